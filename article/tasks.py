@@ -8,6 +8,7 @@ from django.utils.translation import gettext as _
 from article import models
 from config import celery_app
 from core.models import Source
+from core.utils.multi_pattern import MultiPatternMatcher
 from core.utils import utils as core_utils
 from institution.models import Institution
 from usefulmodels.models import ThematicArea
@@ -605,20 +606,34 @@ def match_contrib_inst_aff(user_id):
     Update the the affiliation.source from contributor
     """
     user = User.objects.get(id=user_id)
-
-    for co in models.Contributor.objects.all():
-        # Loop to all contributor institutions
-        for inst in co.institutions.all():
-            # Loop to all affiliations
-            for aff in co.affiliations.all():
-                # check if institution name is in aff.name
-                if inst.display_name:
-                    if inst.display_name in aff.name:
-                        print(
-                            "Update the contributor affiliation: %s(%s)" % (co, co.id)
-                        )
-                        aff.source = inst
-                        aff.save()
+    batch_size = getattr(settings, "AFFILIATION_MATCH_BATCH_SIZE", 1000)
+
+    # The last matching institution of a contributor wins, as in the
+    # institution-by-affiliation loop this replaces.
+    pending = {}
+    contributors = models.Contributor.objects.prefetch_related("institutions", "affiliations")
+    for co in contributors.iterator(chunk_size=batch_size):
+        institutions = [inst for inst in co.institutions.all() if inst.display_name]
+        if not institutions:
+            continue
+        matcher = MultiPatternMatcher(case_sensitive=True)
+        for position, inst in enumerate(institutions):
+            matcher.add(inst.display_name, position)
+
+        for aff in co.affiliations.all():
+            position = max(matcher.iter_matches(aff.name), default=None)
+            if position is None:
+                continue
+            print("Update the contributor affiliation: %s(%s)" % (co, co.id))
+            aff.source = institutions[position]
+            pending[aff.pk] = aff
+
+        if len(pending) >= batch_size:
+            models.Affiliation.objects.bulk_update(pending.values(), ["source"])
+            pending = {}
+
+    if pending:
+        models.Affiliation.objects.bulk_update(pending.values(), ["source"])
 
 
 @celery_app.task(name="Match between affiliation.source and Institution[MEC]")
@@ -468,5 +468,6 @@ from etl.settings import *  # noqa: E402,F403
 from harvest.settings import *  # noqa: E402,F403
 from institution.settings import *  # noqa: E402,F403
 from journal.settings import *  # noqa: E402,F403
+from observation.settings import *  # noqa: E402,F403
 from scholarly_articles.settings import *  # noqa: E402,F403
 from search_gateway.settings import *  # noqa: E402,F403
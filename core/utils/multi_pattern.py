@@ -0,0 +1,73 @@
+from collections import deque
+
+
+class MultiPatternMatcher:
+    """
+    Aho-Corasick automaton matching many substrings in a single pass over a text.
+
+    Every pattern carries a value, and ``iter_matches`` yields the values of
+    all patterns found in the text. Callers that need a priority order use
+    comparable values (e.g. the pattern's position in the original loop) and
+    keep the lowest one.
+    """
+
+    def __init__(self, case_sensitive=False):
+        self.case_sensitive = case_sensitive
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = {}
+        self._patterns = 0
+        self._built = True
+
+    def __len__(self):
+        return self._patterns
+
+    def _normalize(self, text):
+        return text if self.case_sensitive else text.lower()
+
+    def add(self, pattern, value):
+        if not pattern:
+            return
+        node = 0
+        for char in self._normalize(pattern):
+            child = self._goto[node].get(char)
+            if child is None:
+                child = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._goto[node][char] = child
+            node = child
+        self._output.setdefault(node, []).append(value)
+        self._patterns += 1
+        self._built = False
+
+    def build(self):
+        pending = deque(self._goto[0].values())
+        while pending:
+            node = pending.popleft()
+            for char, child in self._goto[node].items():
+                pending.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                inherited = self._output.get(self._fail[child])
+                if inherited:
+                    self._output.setdefault(child, []).extend(inherited)
+        self._built = True
+
+    def iter_matches(self, text):
+        if not text:
+            return
+        if not self._built:
+            self.build()
+        node = 0
+        for char in self._normalize(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            yield from self._output.get(node, ())
+
+    def first(self, text):
+        """Lowest value among the patterns found in ``text``, or None."""
+        return min(self.iter_matches(text), default=None)
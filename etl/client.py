@@ -1,5 +1,7 @@
 import logging
+import threading
 import time
+from contextlib import contextmanager
 from copy import deepcopy
 from typing import Any, Dict, Optional
 
@@ -7,6 +9,11 @@ from search_gateway.client import get_opensearch_client
 
 logger = logging.getLogger(__name__)
 
+# Bulk-load profiles active in this process, by index name: the settings to
+# restore and how many loads are using the profile.
+_bulk_load_profiles: Dict[str, Dict[str, Any]] = {}
+_bulk_load_profiles_lock = threading.Lock()
+
 
 class OpenSearchClient:
     """Simplified OpenSearch client wrapper."""
@@ -39,6 +46,7 @@ class OpenSearchClient:
         )
 
         if self.index_exists(write_alias):
+            self.add_missing_properties(write_alias, mapping)
             return None
 
         index_name = f"{index_prefix}-000001"
@@ -57,6 +65,22 @@ class OpenSearchClient:
         logger.info("Rollover bootstrap index '%s' created successfully.", index_name)
         return index_name
 
+    def add_missing_properties(self, index_name: str, mapping: Dict[str, Any]) -> list[str]:
+        """Add top-level properties of ``mapping`` that ``index_name`` does not map yet."""
+        properties = (mapping.get("mappings") or {}).get("properties") or {}
+        if not properties:
+            return []
+
+        current = self.client.indices.get_mapping(index=index_name)
+        mapped = set()
+        for index_mapping in (current or {}).values():
+            mapped.update(((index_mapping.get("mappings") or {}).get("properties") or {}).keys())
+        missing = {name: config for name, config in properties.items() if name not in mapped}
+        if missing:
+            logger.info("Adding properties %s to the mapping of '%s'.", sorted(missing), index_name)
+            self.client.indices.put_mapping(index=index_name, body={"properties": missing})
+        return sorted(missing)
+
     def ensure_rollover_template(
         self,
         *,
@@ -119,6 +143,64 @@ class OpenSearchClient:
     def add_alias(self, index_name: str, alias_name: str) -> None:
         self.client.indices.put_alias(index=index_name, name=alias_name)
 
+    @contextmanager
+    def bulk_load_profile(
+        self,
+        index_name: str,
+        *,
+        refresh_interval: str = "-1",
+        number_of_replicas: int = 0,
+    ):
+        """
+        Relaxes refresh and replication on ``index_name`` while bulk loading.
+
+        The profile is reference-counted per process: concurrent loads into
+        the same index share it, the first one saves the original settings
+        and the last one to finish restores them.
+        """
+        with _bulk_load_profiles_lock:
+            profile = _bulk_load_profiles.get(index_name)
+            if profile is None:
+                previous = self._current_load_settings(index_name)
+                self.client.indices.put_settings(
+                    index=index_name,
+                    body={
+                        "index": {
+                            "refresh_interval": refresh_interval,
+                            "number_of_replicas": number_of_replicas,
+                        }
+                    },
+                )
+                profile = _bulk_load_profiles[index_name] = {"users": 0, "previous": previous}
+            profile["users"] += 1
+
+        try:
+            yield
+        finally:
+            with _bulk_load_profiles_lock:
+                profile["users"] -= 1
+                if not profile["users"]:
+                    del _bulk_load_profiles[index_name]
+                    for concrete_index, values in profile["previous"].items():
+                        try:
+                            self.client.indices.put_settings(index=concrete_index, body={"index": values})
+                        except Exception:
+                            logger.exception("Failed to restore index settings for '%s'", concrete_index)
+
+    def _current_load_settings(self, index_name: str) -> Dict[str, Dict[str, Any]]:
+        current = self.client.indices.get_settings(
+            index=index_name,
+            name="index.refresh_interval,index.number_of_replicas",
+        )
+        previous = {}
+        for concrete_index, data in current.items():
+            index_settings = (data.get("settings") or {}).get("index") or {}
+            previous[concrete_index] = {
+                "refresh_interval": index_settings.get("refresh_interval"),
+                "number_of_replicas": index_settings.get("number_of_replicas"),
+            }
+        return previous
+
     def _template_from_mapping(
         self,
         mapping: Dict[str, Any],
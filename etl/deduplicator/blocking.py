@@ -0,0 +1,115 @@
+import math
+from collections import Counter, defaultdict
+from itertools import chain
+
+QGRAM_SIZE = 2
+
+
+class TitleBlockingIndex:
+    """
+    Candidate generator for fuzzy title deduplication.
+
+    Titles are indexed by character q-grams inside blocks (document type,
+    ISSN, publication year) and only pairs sharing a q-gram from their
+    prefix-filtered signatures are emitted. The required number of shared
+    q-grams is derived from the title similarity threshold, so every pair
+    able to reach ``min_similarity`` is still returned.
+    """
+
+    def __init__(self, min_similarity, year_tolerance, qgram_size=QGRAM_SIZE):
+        self.min_similarity = float(min_similarity)
+        self.year_tolerance = int(year_tolerance)
+        self.qgram_size = qgram_size
+        self._entries = []
+
+    def add(self, idx, year, titles, block_keys):
+        normalized = [title.lower() for title in titles if title]
+        if not normalized:
+            if self.min_similarity > 0:
+                return
+            normalized = [""]
+
+        self._entries.append((idx, year, normalized, tuple(block_keys)))
+
+    def candidate_pairs(self):
+        tagged_by_title = {}
+        frequencies = Counter()
+        for idx, _year, titles, _block_keys in self._entries:
+            for position, title in enumerate(titles):
+                tagged = self._tagged_qgrams(title)
+                tagged_by_title[(idx, position)] = tagged
+                frequencies.update(gram for gram, _occurrence in tagged)
+
+        members = defaultdict(list)
+        unfilterable = defaultdict(list)
+        postings = defaultdict(list)
+        probes = []
+
+        for idx, year, titles, block_keys in self._entries:
+            for block_key in block_keys:
+                members[(block_key, year)].append((idx, None))
+
+            for position, title in enumerate(titles):
+                length = len(title)
+                prefix = self._prefix(tagged_by_title[(idx, position)], length, frequencies)
+                for block_key in block_keys:
+                    if prefix is None:
+                        unfilterable[(block_key, year)].append((idx, length))
+                    else:
+                        for gram in prefix:
+                            postings[(block_key, year, gram)].append((idx, length))
+                probes.append((idx, year, block_keys, length, prefix))
+
+        seen = set()
+        for idx, year, block_keys, length, prefix in probes:
+            for block_key in block_keys:
+                for other_year in range(year - self.year_tolerance, year + self.year_tolerance + 1):
+                    if prefix is None:
+                        candidates = members.get((block_key, other_year), ())
+                    else:
+                        candidates = chain(
+                            unfilterable.get((block_key, other_year), ()),
+                            *(postings.get((block_key, other_year, gram), ()) for gram in prefix),
+                        )
+
+                    for other, other_length in candidates:
+                        if other == idx:
+                            continue
+                        pair = (idx, other) if idx < other else (other, idx)
+                        if pair in seen:
+                            continue
+                        if other_length is not None and not self._lengths_compatible(length, other_length):
+                            continue
+                        seen.add(pair)
+                        yield pair
+
+    def _lengths_compatible(self, left, right):
+        total = left + right
+        if not total:
+            return True
+        return 2 * min(left, right) / total >= self.min_similarity - 1e-9
+
+    def _tagged_qgrams(self, title):
+        occurrences = Counter()
+        tagged = []
+        for start in range(len(title) - self.qgram_size + 1):
+            gram = title[start:start + self.qgram_size]
+            occurrences[gram] += 1
+            tagged.append((gram, occurrences[gram]))
+        return tagged
+
+    def _min_shared_qgrams(self, length):
+        # ratio >= s implies an edit distance of at most (1 - s) * (len_a + len_b),
+        # and the q-gram lemma bounds the shared q-grams from below. The bound is
+        # smallest when both titles have the same length.
+        q = self.qgram_size
+        bound = length - q + 1 - 2 * q * (1 - self.min_similarity) * length
+        return math.ceil(bound - 1e-9)
+
+    def _prefix(self, tagged, length, frequencies):
+        min_shared = self._min_shared_qgrams(length)
+        if min_shared < 1 or not tagged:
+            return None
+
+        ordered = sorted(tagged, key=lambda item: (frequencies[item[0]], item))
+        return ordered[:len(tagged) - min_shared + 1]
@@ -1,6 +1,8 @@
 import logging
 from typing import Any, Dict, List, Tuple
 
+from django.conf import settings
+
 from etl.client import OpenSearchClient
 from etl.documents import SilverDocument
 from etl.transform.normalizers import (
@@ -9,6 +11,7 @@ from etl.transform.normalizers import (
     normalize_text,
 )
 from etl.deduplicator.helpers import (
+    best_similarity,
     calculate_similarity,
     select_primary_scielo_doc,
 )
@@ -71,13 +74,161 @@ class OpenAlexMatcher:
         logger.debug("Found %s validated OpenAlex matches for SciELO group", len(matches))
         return matches
 
+    def find_matches_batch(
+        self,
+        scielo_groups: List[List[Dict[str, Any]]],
+        max_candidates: int = 10,
+    ) -> List[list]:
+        results: list[list] = [[] for _ in scielo_groups]
+        primaries: dict[int, dict] = {}
+
+        for position, group in enumerate(scielo_groups):
+            if not group:
+                continue
+            primary = select_primary_scielo_doc(group)
+            if not self._can_search_openalex(primary):
+                logger.debug(
+                    "Skipping OpenAlex match lookup for SciELO doc outside configured query scope"
+                )
+                continue
+            primaries[position] = primary
+
+        for strategy in self.rules["openalex_match_strategies"]:
+            if strategy not in ("doi", "isbn", "title"):
+                continue
+
+            pending = [
+                position
+                for position in primaries
+                if strategy == "doi" or not results[position]
+            ]
+
+            searches = []
+            for position in pending:
+                body = self._strategy_search_body(strategy, primaries[position])
+                if body is not None:
+                    searches.append((position, body))
+
+            if not searches:
+                continue
+
+            hits_per_search = self._msearch_openalex(
+                [body for _position, body in searches],
+                strategy,
+            )
+            for (position, _body), candidates in zip(searches, hits_per_search):
+                results[position].extend(
+                    self._strategy_matches(
+                        strategy,
+                        primaries[position],
+                        candidates,
+                        max_candidates,
+                    )
+                )
+
+        results = [self._deduplicate_openalex_matches(matches) for matches in results]
+        logger.debug(
+            "Found validated OpenAlex matches for %s of %s SciELO groups",
+            sum(1 for matches in results if matches),
+            len(results),
+        )
+        return results
+
+    def _strategy_search_body(self, strategy: str, primary: dict) -> dict | None:
+        if strategy == "doi":
+            doi = extract_doi(primary)
+            if not doi or not (doi_stz := normalize_doi(doi)):
+                return None
+            return self._doi_search_body(doi_stz, primary)
+
+        if strategy == "isbn":
+            isbns = extract_isbns(primary)
+            if not isbns:
+                return None
+            return self._isbn_search_body(isbns, primary)
+
+        if strategy == "title":
+            if extract_isbns(primary):
+                return None
+            return self._title_year_search_body(primary)
+
+        return None
+
+    def _strategy_matches(
+        self,
+        strategy: str,
+        primary: dict,
+        candidates: List[Dict[str, Any]],
+        max_candidates: int,
+    ) -> list:
+        if strategy == "doi":
+            return self._doi_matches(primary, candidates, max_candidates)
+        if strategy == "isbn":
+            return self._isbn_matches(primary, candidates, max_candidates)
+        if strategy == "title":
+            return self._title_matches(primary, candidates, max_candidates)
+        return []
+
+    def _msearch_openalex(
+        self,
+        bodies: List[Dict[str, Any]],
+        strategy: str,
+    ) -> List[List[Dict[str, Any]]]:
+        max_searches = getattr(settings, "ETL_OPENALEX_MSEARCH_MAX_SEARCHES", 100)
+        chunk_size = max(int(max_searches or 1), 1)
+        hits_per_search: list[list[dict[str, Any]]] = []
+
+        for start in range(0, len(bodies), chunk_size):
+            chunk = bodies[start:start + chunk_size]
+            request_body = []
+            for body in chunk:
+                request_body.extend([{}, body])
+
+            try:
+                response = self.client.client.msearch(
+                    index=self.input_openalex_index,
+                    body=request_body,
+                )
+                responses = response.get("responses") or []
+            except Exception as exc:
+                logger.error("Error searching OpenAlex by %s (msearch): %s", strategy, exc)
+                responses = []
+
+            for offset in range(len(chunk)):
+                sub_response = responses[offset] if offset < len(responses) else None
+                if not sub_response or sub_response.get("error"):
+                    if sub_response:
+                        logger.error(
+                            "Error searching OpenAlex by %s: %s",
+                            strategy,
+                            sub_response.get("error"),
+                        )
+                    hits_per_search.append([])
+                    continue
+                hits_per_search.append(
+                    [self._hit_source(hit) for hit in sub_response["hits"]["hits"]]
+                )
+
+        return hits_per_search
+
     def _try_openalex_by_doi(self, primary: dict, max_candidates: int) -> list:
         doi = extract_doi(primary)
         if not doi or not (doi_stz := normalize_doi(doi)):
             return []
 
+        return self._doi_matches(
+            primary,
+            self._search_openalex_by_doi(doi_stz, primary),
+            max_candidates,
+        )
+
+    def _doi_matches(self, primary: dict, candidates: list, max_candidates: int) -> list:
+        doi_stz = normalize_doi(extract_doi(primary))
+        if not doi_stz:
+            return []
+
         matches = []
-        for candidate in self._search_openalex_by_doi(doi_stz, primary)[:max_candidates]:
+        for candidate in candidates[:max_candidates]:
             candidate_doi = normalize_doi(extract_doi(candidate))
             if candidate_doi != doi_stz:
                 continue
@@ -94,8 +245,15 @@ class OpenAlexMatcher:
         if not isbns:
             return []
 
+        return self._isbn_matches(
+            primary,
+            self._search_openalex_by_isbn(isbns, primary),
+            max_candidates,
+        )
+
+    def _isbn_matches(self, primary: dict, candidates: list, max_candidates: int) -> list:
         matches = []
-        for candidate in self._search_openalex_by_isbn(isbns, primary)[:max_candidates]:
+        for candidate in candidates[:max_candidates]:
             is_valid, confidence, validation = self._validate_openalex_match(primary, candidate)
             if is_valid:
                 silver_candidate = self._silver_document_from_candidate(candidate)
@@ -106,8 +264,15 @@ class OpenAlexMatcher:
         if extract_isbns(primary):
             return []
 
+        return self._title_matches(
+            primary,
+            self._search_openalex_by_title_year(primary),
+            max_candidates,
+        )
+
+    def _title_matches(self, primary: dict, candidates: list, max_candidates: int) -> list:
         matches = []
-        for candidate in self._search_openalex_by_title_year(primary)[:max_candidates]:
+        for candidate in candidates[:max_candidates]:
             is_valid, confidence, validation = self._validate_openalex_match(
                 primary,
                 candidate,
@@ -259,6 +424,22 @@ class OpenAlexMatcher:
             logger.warning("Invalid DOI after normalization: %s", doi)
             return []
 
+        try:
+            response = self.client.client.search(
+                index=self.input_openalex_index,
+                body=self._doi_search_body(normalized_doi, scielo_doc, size=size),
+            )
+            return [self._hit_source(hit) for hit in response["hits"]["hits"]]
+        except Exception as exc:
+            logger.error("Error searching OpenAlex by DOI: %s", exc)
+            return []
+
+    def _doi_search_body(
+        self,
+        normalized_doi: str,
+        scielo_doc: Dict[str, Any],
+        size: int = 10,
+    ) -> Dict[str, Any]:
         query = {
             "bool": {
                 "filter": [
@@ -272,16 +453,7 @@ class OpenAlexMatcher:
             }
         }
         self._apply_openalex_query_constraints(query, scielo_doc)
-
-        try:
-            response = self.client.client.search(
-                index=self.input_openalex_index,
-                body={"query": query, "size": size},
-            )
-            return [self._hit_source(hit) for hit in response["hits"]["hits"]]
-        except Exception as exc:
-            logger.error("Error searching OpenAlex by DOI: %s", exc)
-            return []
+        return {"query": query, "size": size}
 
     def _doi_exact_or_prefix_queries(self, normalized_doi: str) -> list[dict[str, Any]]:
         doi_values = [
@@ -307,6 +479,22 @@ class OpenAlexMatcher:
         scielo_doc: Dict[str, Any],
         size: int = 10,
     ) -> List[Dict[str, Any]]:
+        try:
+            response = self.client.client.search(
+                index=self.input_openalex_index,
+                body=self._isbn_search_body(isbns, scielo_doc, size=size),
+            )
+            return [self._hit_source(hit) for hit in response["hits"]["hits"]]
+        except Exception as exc:
+            logger.error("Error searching OpenAlex by ISBN: %s", exc)
+            return []
+
+    def _isbn_search_body(
+        self,
+        isbns: List[str],
+        scielo_doc: Dict[str, Any],
+        size: int = 10,
+    ) -> Dict[str, Any]:
         query = {
             "bool": {
                 "should": [
@@ -320,26 +508,36 @@ class OpenAlexMatcher:
             }
         }
         self._apply_openalex_query_constraints(query, scielo_doc)
+        return {"query": query, "size": size}
+
+    def _search_openalex_by_title_year(
+        self,
+        scielo_doc: Dict[str, Any],
+        size: int = 10,
+    ) -> List[Dict[str, Any]]:
+        body = self._title_year_search_body(scielo_doc, size=size)
+        if body is None:
+            return []
 
         try:
             response = self.client.client.search(
                 index=self.input_openalex_index,
-                body={"query": query, "size": size},
+                body=body,
             )
             return [self._hit_source(hit) for hit in response["hits"]["hits"]]
         except Exception as exc:
-            logger.error("Error searching OpenAlex by ISBN: %s", exc)
+            logger.error("Error searching OpenAlex by title: %s", exc)
             return []
 
-    def _search_openalex_by_title_year(
+    def _title_year_search_body(
         self,
         scielo_doc: Dict[str, Any],
         size: int = 10,
-    ) -> List[Dict[str, Any]]:
+    ) -> Dict[str, Any] | None:
         title = scielo_doc.get("title", "")
         issns = scielo_doc.get("source_issns") or []
         if not title:
-            return []
+            return None
 
         query = {
             "bool": {
@@ -362,15 +560,7 @@ class OpenAlexMatcher:
             query["bool"]["should"] = self._source_issn_queries(issns)
             query["bool"]["minimum_should_match"] = 1
 
-        try:
-            response = self.client.client.search(
-                index=self.input_openalex_index,
-                body={"query": query, "size": size},
-            )
-            return [self._hit_source(hit) for hit in response["hits"]["hits"]]
-        except Exception as exc:
-            logger.error("Error searching OpenAlex by title: %s", exc)
-            return []
+        return {"query": query, "size": size}
 
     def _source_issn_queries(self, issns: list[str]) -> list[dict[str, Any]]:
         return [
@@ -485,10 +675,7 @@ class OpenAlexMatcher:
 
         scl_titles = extract_titles(scielo_doc)
         oa_titles = extract_titles(openalex_doc)
-        article_title_sim = max(
-            (calculate_similarity(scl_t, oa_t) for scl_t in scl_titles for oa_t in oa_titles),
-            default=0.0,
-        )
+        article_title_sim = best_similarity(scl_titles, oa_titles)
 
         if (
             isbn_intersection
@@ -1,7 +1,8 @@
 import logging
 from collections import defaultdict
 
-from etl.deduplicator.helpers import calculate_similarity
+from etl.deduplicator.blocking import TitleBlockingIndex
+from etl.deduplicator.helpers import get_similarity_backend
 from etl.transform.normalizers import (
     normalize_document_type_for_etl,
     normalize_doi,
@@ -139,53 +140,49 @@ class SciELODeduplicator:
         min_similarity=0.85,
         year_tolerance=1,
     ):
-        year_groups = defaultdict(list)
+        index = TitleBlockingIndex(min_similarity, year_tolerance)
+        similarity = get_similarity_backend()
+        titles_by_idx = {}
+
         for idx, article in enumerate(articles):
-            year = article.get("publication_year")
-            if year is not None:
-                try:
-                    year = int(year)
-                except (ValueError, TypeError):
-                    continue
-                for y in range(year - year_tolerance, year + year_tolerance + 1):
-                    year_groups[y].append(idx)
-
-        compared_pairs = set()
-        for _year, indices in year_groups.items():
-            if len(indices) < 2:
+            year = self._fuzzy_publication_year(article)
+            if not year:
                 continue
 
-            for i in range(len(indices)):
-                for j in range(i + 1, len(indices)):
-                    idx_i, idx_j = indices[i], indices[j]
-                    pair_key = tuple(sorted([idx_i, idx_j]))
-                    if pair_key in compared_pairs or uf.find(idx_i) == uf.find(idx_j):
-                        continue
-                    compared_pairs.add(pair_key)
+            block_keys = self._fuzzy_block_keys(article)
+            if not block_keys:
+                continue
 
-                    art_i, art_j = articles[idx_i], articles[idx_j]
-                    if not self._is_deduplicable_scielo_pair(art_i, art_j):
-                        continue
-                    if self.rules["fuzzy_requires_source_match"]:
-                        issns_i = set(extract_issns(art_i))
-                        issns_j = set(extract_issns(art_j))
-                        if not (issns_i & issns_j):
-                            continue
-
-                    best_similarity = 0.0
-                    for t1 in extract_titles(art_i):
-                        for t2 in extract_titles(art_j):
-                            best_similarity = max(best_similarity, calculate_similarity(t1, t2))
-
-                    try:
-                        year_i = int(art_i.get("publication_year", 0) or 0)
-                        year_j = int(art_j.get("publication_year", 0) or 0)
-                        year_close = abs(year_i - year_j) <= year_tolerance if year_i and year_j else False
-                    except (ValueError, TypeError):
-                        year_close = False
-
-                    if best_similarity >= min_similarity and year_close:
-                        uf.union(idx_i, idx_j)
+            titles_by_idx[idx] = [similarity.prepare(title) for title in extract_titles(article)]
+            index.add(idx, year, titles_by_idx[idx], block_keys)
+
+        for idx_i, idx_j in index.candidate_pairs():
+            if uf.find(idx_i) == uf.find(idx_j):
+                continue
+
+            best_similarity = 0.0
+            for t1 in titles_by_idx[idx_i]:
+                for t2 in titles_by_idx[idx_j]:
+                    best_similarity = max(best_similarity, similarity.score(t1, t2))
+
+            if best_similarity >= min_similarity:
+                uf.union(idx_i, idx_j)
+
+    def _fuzzy_publication_year(self, article):
+        try:
+            return int(article.get("publication_year", 0) or 0) or None
+        except (ValueError, TypeError):
+            return None
+
+    def _fuzzy_block_keys(self, article):
+        doc_type = extract_scielo_document_type(article)
+        if not self._is_deduplicable_scielo_type(doc_type):
+            return []
+
+        if self.rules["fuzzy_requires_source_match"]:
+            return [(doc_type, issn) for issn in sorted(set(extract_issns(article)))]
+
+        return [(doc_type,)]
 
     def _is_deduplicable_scielo_pair(self, left_doc, right_doc):
         left_type = extract_scielo_document_type(left_doc)
@@ -193,11 +190,17 @@ class SciELODeduplicator:
         if not left_type or not right_type or left_type != right_type:
             return False
 
+        return self._is_deduplicable_scielo_type(left_type)
+
+    def _is_deduplicable_scielo_type(self, doc_type):
+        if not doc_type:
+            return False
+
         allowed_types = set(self.rules.get("scielo_dedup_allowed_types") or [])
-        if left_type not in allowed_types:
+        if doc_type not in allowed_types:
             return False
 
-        return normalize_document_type_for_etl(left_type) == self.rules["document_type"]
+        return normalize_document_type_for_etl(doc_type) == self.rules["document_type"]
 
     def _has_matching_publication_year(self, left_doc, right_doc):
         try:
@@ -39,6 +39,7 @@ SILVER_SETTINGS = {
 
 SILVER_PROPERTIES = {
     "doc_id": {"type": "keyword"},
+    "etl_indexed_at": {"type": "date"},
     "oca_data": {
         "type": "object",
         "properties": {
@@ -108,16 +108,16 @@ class EtlPipelineConfigManager(models.Manager):
             for config in self.enabled()
         }
 
-    def get_for_source(self, source_index: str, source_payload: dict | None = None):
-        config = self.select_for_source(source_index, source_payload)
+    def get_for_source(self, source_index: str, source_payload: dict | None = None, configs=None):
+        config = self.select_for_source(source_index, source_payload, configs=configs)
         if config:
             return config
         raise ValueError(f"No enabled ETL pipeline config for source index: {source_index}")
 
-    def select_for_source(self, source_index: str, source_payload: dict | None = None):
+    def select_for_source(self, source_index: str, source_payload: dict | None = None, configs=None):
         configs = [
             config
-            for config in self.enabled()
+            for config in (self.enabled() if configs is None else configs)
             if config.matches_input_index(source_index)
         ]
         if not configs:
@@ -310,7 +310,50 @@ class EtlPipelineConfig(models.Model):
         }
 
 
+ETL_ITEM_OUTCOME_FIELDS = [
+    "status",
+    "result",
+    "has_openalex_match",
+    "has_scielo_dedup",
+    "scielo_dedup_ids",
+    "openalex_match_ids",
+    "error",
+    "processed_at",
+    "updated_at",
+]
+
+
 class EtlItemProcessQuerySet(models.QuerySet):
+    def mark_processing(self, items: list["EtlItemProcess"]) -> int:
+        if not items:
+            return 0
+
+        now = timezone.now()
+        for item in items:
+            item.status = EtlStatus.PROCESSING
+            item.attempts += 1
+            item.error = None
+            item.updated_at = now
+        return self.filter(pk__in=[item.pk for item in items]).update(
+            status=EtlStatus.PROCESSING,
+            attempts=models.F("attempts") + 1,
+            error=None,
+            updated_at=now,
+        )
+
+    def bulk_save_outcomes(self, items: list["EtlItemProcess"], batch_size: int = 500) -> int:
+        """
+        Persists outcomes set in memory by ``apply_success``/``apply_failure``
+        with one ``bulk_update`` per batch instead of one UPDATE per item.
+        """
+        if not items:
+            return 0
+
+        now = timezone.now()
+        for item in items:
+            item.updated_at = now
+        return self.bulk_update(items, ETL_ITEM_OUTCOME_FIELDS, batch_size=batch_size)
+
     def requeue_stale_processing(self, timeout_minutes: int = 30) -> int:
         stale_before = timezone.now() - timedelta(minutes=timeout_minutes)
         return self.filter(
@@ -445,6 +488,27 @@ class EtlItemProcess(models.Model):
         self.save(update_fields=["status", "attempts", "error", "updated_at"])
 
     def mark_success(self, result=EtlResult.UPDATED, has_openalex_match=False, has_scielo_dedup=False, scielo_dedup_ids=None, openalex_match_ids=None, status=EtlStatus.SUCCESS, error=None):
+        self.apply_success(
+            result,
+            has_openalex_match=has_openalex_match,
+            has_scielo_dedup=has_scielo_dedup,
+            scielo_dedup_ids=scielo_dedup_ids,
+            openalex_match_ids=openalex_match_ids,
+            status=status,
+            error=error,
+        )
+        self.save(update_fields=ETL_ITEM_OUTCOME_FIELDS)
+
+    def apply_success(
+        self,
+        result=EtlResult.UPDATED,
+        has_openalex_match=False,
+        has_scielo_dedup=False,
+        scielo_dedup_ids=None,
+        openalex_match_ids=None,
+        status=EtlStatus.SUCCESS,
+        error=None,
+    ):
         self.status = status
         self.result = result
         self.has_openalex_match = has_openalex_match
@@ -453,31 +517,21 @@ class EtlItemProcess(models.Model):
         self.openalex_match_ids = openalex_match_ids or []
         self.error = error
         self.processed_at = timezone.now()
+
+    def mark_failed(self, error):
+        self.apply_failure(error)
         self.save(
             update_fields=[
                 "status",
                 "result",
-                "has_openalex_match",
-                "has_scielo_dedup",
-                "scielo_dedup_ids",
-                "openalex_match_ids",
                 "error",
                 "processed_at",
                 "updated_at",
             ]
         )
 
-    def mark_failed(self, error):
+    def apply_failure(self, error):
         self.status = EtlStatus.FAILED
         self.result = EtlResult.ERROR
         self.error = str(error)[:5000]
         self.processed_at = timezone.now()
-        self.save(
-            update_fields=[
-                "status",
-                "result",
-                "error",
-                "processed_at",
-                "updated_at",
-            ]
-        )
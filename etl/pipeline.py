@@ -1,10 +1,16 @@
 import hashlib
 import json
 import logging
+import resource
+import time
 from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
 from typing import Any, Dict, List, Optional
 
 from django.conf import settings
+from django.utils import timezone
+from opensearchpy.exceptions import TransportError
 
 from etl.client import OpenSearchClient
 from etl.documents import SilverDocument
@@ -20,9 +26,58 @@ from etl.transform.normalizers import (
 )
 from etl.transform.standardizer import standardizer_for
 from harvest.utils import clean_source_payload
+from search_gateway.pagination import iter_pit_hits
 
 logger = logging.getLogger(__name__)
 
+# Payload fields read while loading, expanding and grouping SciELO input
+# documents. Streaming runs read only these and hydrate full documents per window
+# of groups.
+INPUT_GROUPING_FIELDS = (
+    "_os_id",
+    "best_oa_location",
+    "code",
+    "collection",
+    "display_name",
+    "doc_id",
+    "document_type",
+    "doi",
+    "doi_with_lang",
+    "id",
+    "ids",
+    "journal_issns",
+    "journal_title",
+    "monograph",
+    "pid_v2",
+    "primary_location",
+    "publication_year",
+    "scielo_id",
+    "source",
+    "source_issns",
+    "sources",
+    "title",
+    "title_with_lang",
+    "type",
+)
+
+
+# Failed silver bulk items reported in a run result
+SILVER_BULK_ERROR_SAMPLES = 10
+
+# Write time stamped on every silver document; incremental lookup builds use
+# it as their watermark
+SILVER_INDEXED_AT_FIELD = "etl_indexed_at"
+
+
+def current_memory_mb() -> float | None:
+    """Current resident set size of the process in MiB, or None without /proc."""
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return round(resident_pages * resource.getpagesize() / (1024 * 1024), 1)
+
 
 class OpenSearchETLPipeline:
     """
@@ -54,6 +109,9 @@ class OpenSearchETLPipeline:
 
         self.indexed_index_names: set[str] = set()
         self.loaded_source_ids: set[str] = set()
+        self.written_silver_ids: set[str] = set()
+        self.start_memory_mb: float | None = None
+        self.peak_memory_mb: float | None = None
 
         self.pipeline_config = pipeline_config or EtlPipelineConfig.objects.get_for_source(self.input_scielo_index)
         self.document_type = self.pipeline_config.default_document_type
@@ -66,6 +124,12 @@ class OpenSearchETLPipeline:
         self.silver_write_alias = getattr(settings, "ETL_SILVER_WRITE_ALIAS", "silver_write")
         self.silver_bulk_max_docs = getattr(settings, "ETL_SILVER_BULK_MAX_DOCS", 1000)
         self.silver_bulk_max_bytes = getattr(settings, "ETL_SILVER_BULK_MAX_BYTES", 50 * 1024 * 1024)
+        self.silver_bulk_workers = getattr(settings, "ETL_SILVER_BULK_WORKERS", 1)
+        self.silver_bulk_max_retries = getattr(settings, "ETL_SILVER_BULK_MAX_RETRIES", 5)
+        self.silver_bulk_backoff_seconds = getattr(settings, "ETL_SILVER_BULK_BACKOFF_SECONDS", 1.0)
+        self.silver_bulk_errors: list[dict] = []
+        self.run_input_docs = 0
+        self.input_window_size = getattr(settings, "ETL_INPUT_WINDOW_SIZE", 0)
         self.rules = self.pipeline_config.to_rules()
 
         self.client = OpenSearchClient(
@@ -96,6 +160,10 @@ class OpenSearchETLPipeline:
     ) -> Dict[str, Any]:
         self.skipped_doc_ids = []
         self.indexed_index_names = set()
+        self.written_silver_ids = set()
+        self.silver_bulk_errors = []
+        self.run_input_docs = 0
+        self.start_memory_mb = self.peak_memory_mb = current_memory_mb()
 
         result = {
             "status": "success",
@@ -117,20 +185,27 @@ class OpenSearchETLPipeline:
             "error_messages": [],
             "warning_messages": [],
             "openalex_only_removed_after_merge": 0,
+            "silver_bulk_errors": 0,
+            "silver_bulk_error_samples": [],
         }
 
         try:
+            streaming = self._streaming_enabled()
             input_docs = self._load_scielo_input_documents(
                 max_docs=max_docs,
                 year_filter=year_filter,
                 doc_ids=doc_ids,
+                source_fields=INPUT_GROUPING_FIELDS if streaming else None,
             )
-            result["total_input_docs"] = len(input_docs)
+            result["total_input_docs"] = self.run_input_docs = len(input_docs)
+            self._sample_memory()
 
             if not input_docs:
                 return self._finalize_result(result)
 
             groups = self._build_scielo_groups(input_docs)
+            del input_docs
+            self._sample_memory()
             result["total_groups_formed"] = len(groups)
             result["total_duplicates_found"] = sum(
                 len(group) - 1 for group in groups.values() if len(group) > 1
@@ -151,78 +226,184 @@ class OpenSearchETLPipeline:
             result["scielo_dedup_source_ids"] = scielo_dedup_source_ids
             result["scielo_dedup_map"] = scielo_dedup_map
 
-            all_merged_docs = []
+            # Each window is merged, indexed and cleaned up before the next one
+            # is hydrated, so only one window of documents is held at a time.
+            group_offset = 0
+            windows = self._hydrated_group_windows(groups) if streaming else [groups]
+            for window in windows:
+                merged_docs = []
+                self._merge_group_window(window, result, merged_docs, group_offset)
+                group_offset += len(window)
+                del window
+
+                result["total_indexed_docs"] += self._index_silver_documents(merged_docs)
+                result["openalex_only_removed_after_merge"] += (
+                    self._remove_openalex_only_placeholders(merged_docs)
+                )
+                del merged_docs
+                self._sample_memory()
 
-            for idx, (root_idx, group) in enumerate(groups.items(), 1):
-                try:
+            result["total_skipped_docs"] = len(self.skipped_doc_ids)
+            result["skipped_doc_ids"] = self.skipped_doc_ids
+
+        except Exception as e:
+            logger.error(f"Pipeline failed: {e}", exc_info=True)
+            result["error_messages"].append(f"Pipeline failure: {str(e)}")
+
+        return self._finalize_result(result)
+
+    def _sample_memory(self) -> None:
+        memory_mb = current_memory_mb()
+        if memory_mb is not None:
+            self.peak_memory_mb = max(self.peak_memory_mb or 0.0, memory_mb)
+
+    def _merge_group_window(
+        self,
+        groups: Dict[int, List[Dict[str, Any]]],
+        result: Dict[str, Any],
+        all_merged_docs: List[SilverDocument],
+        group_offset: int = 0,
+    ) -> None:
+        batched_matches = self._find_openalex_matches_batch(groups)
+
+        for idx, (root_idx, group) in enumerate(groups.items(), group_offset + 1):
+            try:
+                if batched_matches is not None:
+                    openalex_matches = batched_matches[root_idx]
+                else:
                     openalex_matches = self.openalex_matcher.find_matches(
                         scielo_group=group,
                         max_candidates=3,
                     )
 
-                    if openalex_matches:
-                        result["groups_with_openalex_matches"] += 1
-                        result["total_openalex_matches"] += len(openalex_matches)
-
-                        oa_ids = [
-                            self._openalex_ids_from_silver_doc(silver_doc)
-                            for silver_doc, _strategy, _confidence, _validation in openalex_matches
-                        ]
-
-                        oa_ids = [oid for items in oa_ids for oid in items]
-                        oa_ids = [oid for oid in oa_ids if oid]
-
-                        for doc in group:
-                            if os_id := doc.get("_os_id"):
-                                result["openalex_matched_source_ids"].append(os_id)
-                                result["openalex_match_map"][os_id] = oa_ids
-
-                    scielo_silver_docs = []
-                    for input_doc_data in group:
-                        try:
-                            input_doc = self._build_input_document(input_doc_data, source="scielo")
-                            silver_doc = standardizer_for(input_doc).run(input_doc)
-                            scielo_silver_docs.append(silver_doc)
-
-                        except Exception as e:
-                            result["warning_messages"].append(f"Standardization error: {e}")
-
-                    if not scielo_silver_docs:
-                        result["warning_messages"].append(
-                            f"No standardized SciELO docs for group {idx}"
-                        )
-                        continue
-
-                    merged_doc = self.merger.merge(
-                        scielo_docs=scielo_silver_docs,
-                        openalex_matches=openalex_matches,
+                if openalex_matches:
+                    result["groups_with_openalex_matches"] += 1
+                    result["total_openalex_matches"] += len(openalex_matches)
+
+                    oa_ids = [
+                        self._openalex_ids_from_silver_doc(silver_doc)
+                        for silver_doc, _strategy, _confidence, _validation in openalex_matches
+                    ]
+
+                    oa_ids = [oid for items in oa_ids for oid in items]
+                    oa_ids = [oid for oid in oa_ids if oid]
+
+                    for doc in group:
+                        if os_id := doc.get("_os_id"):
+                            result["openalex_matched_source_ids"].append(os_id)
+                            result["openalex_match_map"][os_id] = oa_ids
+
+                scielo_silver_docs = []
+                for input_doc_data in group:
+                    try:
+                        input_doc = self._build_input_document(input_doc_data, source="scielo")
+                        silver_doc = standardizer_for(input_doc).run(input_doc)
+                        scielo_silver_docs.append(silver_doc)
+
+                    except Exception as e:
+                        result["warning_messages"].append(f"Standardization error: {e}")
+
+                if not scielo_silver_docs:
+                    result["warning_messages"].append(
+                        f"No standardized SciELO docs for group {idx}"
                     )
+                    continue
 
-                    all_merged_docs.append(merged_doc)
-                    result["total_merged_docs"] += 1
+                merged_doc = self.merger.merge(
+                    scielo_docs=scielo_silver_docs,
+                    openalex_matches=openalex_matches,
+                )
 
-                except Exception as e:
-                    result["error_messages"].append(f"Group {idx} processing error: {str(e)}")
+                all_merged_docs.append(merged_doc)
+                result["total_merged_docs"] += 1
 
-            indexed_count = self._index_silver_documents(all_merged_docs)
-            result["total_indexed_docs"] = indexed_count
-            result["total_skipped_docs"] = len(self.skipped_doc_ids)
-            result["skipped_doc_ids"] = self.skipped_doc_ids
+            except Exception as e:
+                result["error_messages"].append(f"Group {idx} processing error: {str(e)}")
+
+    def _streaming_enabled(self) -> bool:
+        return int(self.input_window_size or 0) > 0
+
+    def _hydrated_group_windows(self, groups: Dict[int, List[Dict[str, Any]]]):
+        window_size = max(int(self.input_window_size or 1), 1)
+        window: Dict[int, List[Dict[str, Any]]] = {}
+        window_docs = 0
+
+        for root_idx, group in groups.items():
+            if window and window_docs + len(group) > window_size:
+                yield self._hydrate_group_window(window)
+                window = {}
+                window_docs = 0
+
+            window[root_idx] = group
+            window_docs += len(group)
+
+        if window:
+            yield self._hydrate_group_window(window)
+
+    def _hydrate_group_window(
+        self,
+        groups: Dict[int, List[Dict[str, Any]]],
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        os_ids = [
+            doc["_os_id"]
+            for group in groups.values()
+            for doc in group
+            if doc.get("_os_id")
+        ]
+        search_body = {
+            "query": {"ids": {"values": os_ids}},
+            "size": min(len(os_ids), 1000) or 1,
+        }
+        full_docs = {
+            normalized["_os_id"]: normalized
+            for _hit, normalized in self._iter_hits(self.input_scielo_index, search_body)
+        }
+
+        hydrated: Dict[int, List[Dict[str, Any]]] = {}
+        for root_idx, group in groups.items():
+            hydrated_group = []
+            for doc in group:
+                full_doc = full_docs.get(doc.get("_os_id"))
+                if full_doc is None:
+                    logger.warning(
+                        "SciELO input document %s disappeared before hydration",
+                        doc.get("_os_id"),
+                    )
+                    continue
+                hydrated_group.append(full_doc)
+            if hydrated_group:
+                hydrated[root_idx] = hydrated_group
+
+        return hydrated
 
-            removed_count = self._remove_openalex_only_placeholders(all_merged_docs)
-            result["openalex_only_removed_after_merge"] = removed_count
+    def _find_openalex_matches_batch(
+        self,
+        groups: Dict[int, List[Dict[str, Any]]],
+    ) -> Dict[int, list] | None:
+        if not getattr(settings, "ETL_OPENALEX_BATCH_MATCHING", True):
+            return None
 
+        root_indexes = list(groups.keys())
+        try:
+            matches = self.openalex_matcher.find_matches_batch(
+                scielo_groups=[groups[root_idx] for root_idx in root_indexes],
+                max_candidates=3,
+            )
         except Exception as e:
-            logger.error(f"Pipeline failed: {e}", exc_info=True)
-            result["error_messages"].append(f"Pipeline failure: {str(e)}")
+            logger.warning(
+                "Batched OpenAlex matching failed, falling back to per-group lookups: %s",
+                e,
+            )
+            return None
 
-        return self._finalize_result(result)
+        return dict(zip(root_indexes, matches))
 
     def _load_scielo_input_documents(
         self,
         max_docs: Optional[int] = None,
         year_filter: Optional[int] = None,
         doc_ids: Optional[List[str]] = None,
+        source_fields: tuple[str, ...] | None = None,
     ) -> List[Dict[str, Any]]:
         query = {"match_all": {}}
 
@@ -239,10 +420,12 @@ class OpenSearchETLPipeline:
             "query": query,
             "size": page_size,
         }
+        if source_fields:
+            search_body["_source"] = self._source_filter(source_fields)
 
         self.loaded_source_ids = set()
         docs = []
-        for hit, normalized in self._scroll_hits(self.input_scielo_index, search_body):
+        for hit, normalized in self._iter_hits(self.input_scielo_index, search_body):
             if not self.pipeline_config.can_process_payload(normalized):
                 continue
             docs.append(normalized)
@@ -255,7 +438,7 @@ class OpenSearchETLPipeline:
                 break
 
         if doc_ids and docs:
-            docs = self._expand_scielo_input_context(docs)
+            docs = self._expand_scielo_input_context(docs, source_fields=source_fields)
 
         if max_docs and len(docs) > max_docs:
             docs = docs[:max_docs]
@@ -263,6 +446,11 @@ class OpenSearchETLPipeline:
         return docs
 
     def _finalize_result(self, result: dict) -> dict:
+        self._sample_memory()
+        result["silver_bulk_errors"] = len(self.silver_bulk_errors)
+        result["silver_bulk_error_samples"] = self.silver_bulk_errors[:SILVER_BULK_ERROR_SAMPLES]
+        result["start_memory_mb"] = self.start_memory_mb
+        result["peak_memory_mb"] = self.peak_memory_mb
         result["errors"] = len(result["error_messages"])
         result["warnings"] = len(result["warning_messages"])
 
@@ -283,7 +471,20 @@ class OpenSearchETLPipeline:
 
         return self.scielo_deduplicator.find_duplicates(articles=input_docs)
 
-    def _expand_scielo_input_context(self, docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _source_filter(self, source_fields: tuple[str, ...]) -> list[str]:
+        fields = [field for field in source_fields if not field.startswith("_")]
+        return fields + [f"raw_data.{field}" for field in fields]
+
+    def _input_identity_key(self, doc: Dict[str, Any]) -> str:
+        if os_id := doc.get("_os_id"):
+            return f"_os_id:{os_id}"
+        return json.dumps(doc, sort_keys=True, ensure_ascii=True)
+
+    def _expand_scielo_input_context(
+        self,
+        docs: List[Dict[str, Any]],
+        source_fields: tuple[str, ...] | None = None,
+    ) -> List[Dict[str, Any]]:
         field_values: dict[str, list] = defaultdict(list)
 
         for doc in docs:
@@ -323,14 +524,16 @@ class OpenSearchETLPipeline:
             "query": {"bool": {"should": should, "minimum_should_match": 1}},
             "size": 1000,
         }
+        if source_fields:
+            search_body["_source"] = self._source_filter(source_fields)
 
-        combined = {json.dumps(doc, sort_keys=True, ensure_ascii=True): doc for doc in docs}
+        combined = {self._input_identity_key(doc): doc for doc in docs}
 
-        for hit, normalized in self._scroll_hits(self.input_scielo_index, search_body):
+        for hit, normalized in self._iter_hits(self.input_scielo_index, search_body):
             self.loaded_source_ids.update(
                 self._source_identity_values(hit.get("_id"), normalized)
             )
-            combined[json.dumps(normalized, sort_keys=True, ensure_ascii=True)] = normalized
+            combined.setdefault(self._input_identity_key(normalized), normalized)
 
         return list(combined.values())
 
@@ -361,23 +564,11 @@ class OpenSearchETLPipeline:
 
         return {str(value) for value in values if value not in (None, "")}
 
-    def _scroll_hits(self, index: str, body: dict, scroll: str = "5m"):
-        response = self.client.client.search(index=index, body=body, scroll=scroll)
-        scroll_id = response.get("_scroll_id")
-        try:
-            while True:
-                hits = response["hits"]["hits"]
-                if not hits:
-                    break
-                for hit in hits:
-                    normalized = clean_source_payload(hit["_source"])
-                    normalized["_os_id"] = hit.get("_id")
-                    yield hit, normalized
-                response = self.client.client.scroll(scroll_id=scroll_id, scroll=scroll)
-                scroll_id = response.get("_scroll_id")
-        finally:
-            if scroll_id:
-                self.client.client.clear_scroll(scroll_id=scroll_id)
+    def _iter_hits(self, index: str, body: dict, keep_alive: str = "5m"):
+        for hit in iter_pit_hits(self.client.client, index, body, keep_alive=keep_alive):
+            normalized = clean_source_payload(hit["_source"])
+            normalized["_os_id"] = hit.get("_id")
+            yield hit, normalized
 
     def _build_input_document(
         self,
@@ -410,8 +601,43 @@ class OpenSearchETLPipeline:
         if not docs_to_index:
             return 0
 
-        index_docs = self._prepare_silver_index_documents(docs_to_index)
-        return self._write_silver_documents(index_docs)
+        index_docs = self._separate_ids_from_earlier_windows(
+            self._prepare_silver_index_documents(docs_to_index)
+        )
+        indexed_count = self._write_silver_documents(index_docs)
+        self.written_silver_ids.update(index_id for index_id, _doc in index_docs)
+        return indexed_count
+
+    def _separate_ids_from_earlier_windows(
+        self,
+        index_docs: list[tuple[str, SilverDocument]],
+    ) -> list[tuple[str, SilverDocument]]:
+        """
+        Documents whose _id was already written by an earlier window of the same
+        run get an alternate _id, like conflicting documents inside a window;
+        earlier windows are no longer in memory to be merged with.
+        """
+        separated = []
+        for index_id, doc in index_docs:
+            if index_id in self.written_silver_ids:
+                logger.warning(
+                    "Silver doc_id %s was already written by an earlier input window; "
+                    "assigning an alternate _id",
+                    index_id,
+                )
+                index_id = self._alternate_silver_id(doc)
+            separated.append((index_id, doc))
+        return separated
+
+    def _alternate_silver_id(self, doc: SilverDocument) -> str:
+        digest = hashlib.sha256(
+            json.dumps(
+                doc.to_index_dict(),
+                sort_keys=True,
+                ensure_ascii=True,
+            ).encode("utf-8")
+        ).hexdigest()
+        return f"{doc.doc_id}__{digest[:12]}"
 
     def _prepare_silver_index_documents(
         self,
@@ -451,14 +677,7 @@ class OpenSearchETLPipeline:
             )
             index_docs.append((doc_id, ordered_docs[0]))
             for doc in ordered_docs[1:]:
-                digest = hashlib.sha256(
-                    json.dumps(
-                        doc.to_index_dict(),
-                        sort_keys=True,
-                        ensure_ascii=True,
-                    ).encode("utf-8")
-                ).hexdigest()
-                index_docs.append((f"{doc.doc_id}__{digest[:12]}", doc))
+                index_docs.append((self._alternate_silver_id(doc), doc))
 
         return index_docs
 
@@ -565,8 +784,11 @@ class OpenSearchETLPipeline:
             mapping=SILVER_MAPPING,
         )
 
-        for actions in self._silver_bulk_action_chunks(docs_to_index, write_alias):
-            self._execute_bulk_index(actions, write_alias)
+        with self._silver_bulk_load_profile(write_alias, len(docs_to_index)):
+            self._execute_bulk_chunks(
+                self._silver_bulk_action_chunks(docs_to_index, write_alias),
+                write_alias,
+            )
         if bootstrap_index:
             self.indexed_index_names.add(bootstrap_index)
 
@@ -594,6 +816,7 @@ class OpenSearchETLPipeline:
         actions = []
         chunk_docs = 0
         chunk_bytes = 0
+        indexed_at = timezone.now().isoformat()
 
         for index_id, doc in docs_to_index:
             action = {
@@ -603,6 +826,7 @@ class OpenSearchETLPipeline:
                 }
             }
             source = doc.to_index_dict()
+            source[SILVER_INDEXED_AT_FIELD] = indexed_at
             action_bytes = self._bulk_action_size_bytes(action, source)
 
             if actions and (chunk_docs >= max_docs or chunk_bytes + action_bytes > max_bytes):
@@ -625,22 +849,86 @@ class OpenSearchETLPipeline:
             + 2
         )
 
-    def _execute_bulk_index(self, actions: list[dict], target_name: str) -> None:
-        response = self.client.client.bulk(body=actions)
-
-        if response.get("errors"):
-            error_items = [
-                item.get("index", {})
-                for item in response["items"]
-                if item.get("index", {}).get("status", 200) >= 400
-            ]
-            error_count = len(error_items)
-            first_error = error_items[0].get("error") if error_items else None
+    def _silver_bulk_load_profile(self, write_alias: str, doc_count: int):
+        # Streaming runs write one window at a time; the threshold applies to
+        # the size of the whole run.
+        doc_count = max(doc_count, self.run_input_docs)
+        if (
+            not getattr(settings, "ETL_SILVER_BULK_LOAD_PROFILE", False)
+            or doc_count < getattr(settings, "ETL_SILVER_BULK_LOAD_MIN_DOCS", 50000)
+        ):
+            return nullcontext()
+        return self.client.bulk_load_profile(write_alias)
+
+    def _execute_bulk_chunks(self, chunks, target_name: str) -> None:
+        workers = max(int(self.silver_bulk_workers or 1), 1)
+        failed_items = []
+
+        if workers == 1:
+            for actions in chunks:
+                failed_items.extend(self._execute_bulk_index(actions))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pending = set()
+                for actions in chunks:
+                    if len(pending) >= workers * 2:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            failed_items.extend(future.result())
+                    pending.add(executor.submit(self._execute_bulk_index, actions))
+                for future in pending:
+                    failed_items.extend(future.result())
+
+        self.silver_bulk_errors.extend(failed_items)
+        if failed_items:
+            first_error = failed_items[0].get("error")
             raise RuntimeError(
-                f"Bulk indexing failed for {error_count} documents in {target_name}: "
+                f"Bulk indexing failed for {len(failed_items)} documents in {target_name}: "
                 f"{first_error}"
             )
 
+    def _execute_bulk_index(self, actions: list[dict]) -> list[dict]:
+        max_retries = max(int(self.silver_bulk_max_retries or 0), 0)
+        failed_items = []
+
+        for attempt in range(max_retries + 1):
+            try:
+                response = self.client.client.bulk(body=actions)
+            except TransportError as exc:
+                if exc.status_code != 429 or attempt == max_retries:
+                    raise
+                self._bulk_backoff(attempt)
+                continue
+
+            if not response.get("errors"):
+                return failed_items
+
+            retry_actions = []
+            for position, item in enumerate(response["items"]):
+                result = item.get("index", {})
+                status = result.get("status", 200)
+                if status == 429 and attempt < max_retries:
+                    retry_actions.extend(actions[position * 2:position * 2 + 2])
+                elif status >= 400:
+                    failed_items.append(
+                        {
+                            "_id": result.get("_id"),
+                            "status": status,
+                            "error": result.get("error"),
+                        }
+                    )
+            if not retry_actions:
+                return failed_items
+            actions = retry_actions
+            self._bulk_backoff(attempt)
+
+        return failed_items
+
+    def _bulk_backoff(self, attempt: int) -> None:
+        delay = float(self.silver_bulk_backoff_seconds or 0) * (2 ** attempt)
+        logger.warning("Bulk request throttled; retrying in %.1fs", delay)
+        time.sleep(delay)
+
     def _stable_fallback_doc_id(self, raw_data: Dict[str, Any]) -> str:
         source_payload = {
             "title": str(raw_data.get("title") or ""),
@@ -667,9 +955,10 @@ class OpenSearchETLPipeline:
         if not self.client.index_exists(index_pattern):
             return 0
 
+        skipped_doc_ids = set(self.skipped_doc_ids)
         oa_ids: set[str] = set()
         for doc in merged_docs:
-            if doc.doc_id in self.skipped_doc_ids:
+            if doc.doc_id in skipped_doc_ids:
                 continue
             found_ids = self._openalex_ids_from_silver_doc(doc)
             oa_ids.update(found_ids)
@@ -1,9 +1,11 @@
 import logging
+import threading
 import traceback
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from django.conf import settings
-from django.db import transaction
+from django.db import connections, transaction
 from django.utils import timezone
 
 from core.utils.db import refresh_db_connections
@@ -13,23 +15,28 @@ from etl.pipeline import OpenSearchETLPipeline
 from etl.transform.extractors import extract_isbns, extract_publication_year
 from etl.transform.normalizers import normalize_document_type_for_etl
 from harvest.utils import source_hash
+from indicator.metrics.cache import invalidate_indicator_result_cache
 from search_gateway.opensearch import OpenSearchIndexClient
 from search_gateway.freshness import invalidate_freshness_cache
 
 logger = logging.getLogger(__name__)
 
 
-def enqueue_etl_item(
+def _etl_item_defaults(
     *,
     source_index: str,
-    external_id: str,
     source_payload: dict,
     document_type: str | None = None,
     publication_year: int | None = None,
     initial_status: str = EtlStatus.PENDING,
-) -> EtlItemProcess:
+    configs=None,
+) -> dict:
     current_hash = source_hash(source_payload)
-    pipeline_config = EtlPipelineConfig.objects.get_for_source(source_index, source_payload)
+    pipeline_config = EtlPipelineConfig.objects.get_for_source(
+        source_index,
+        source_payload,
+        configs=configs,
+    )
     resolved_type = (
         normalize_document_type_for_etl(document_type)
         if document_type
@@ -51,7 +58,7 @@ def enqueue_etl_item(
     preprint_id = raw_ids.get("scl_preprint_id") or ""
     dataset_id = raw_ids.get("dataset_id") or ""
 
-    defaults = {
+    return {
         "document_type": resolved_type,
         "publication_year": resolved_year,
         "source_hash": current_hash,
@@ -65,6 +72,32 @@ def enqueue_etl_item(
         "dataset_id": dataset_id,
     }
 
+
+def enqueue_etl_item(
+    *,
+    source_index: str,
+    external_id: str,
+    source_payload: dict,
+    document_type: str | None = None,
+    publication_year: int | None = None,
+    initial_status: str = EtlStatus.PENDING,
+) -> EtlItemProcess:
+    defaults = _etl_item_defaults(
+        source_index=source_index,
+        source_payload=source_payload,
+        document_type=document_type,
+        publication_year=publication_year,
+        initial_status=initial_status,
+    )
+    current_hash = defaults["source_hash"]
+    resolved_type = defaults["document_type"]
+    resolved_year = defaults["publication_year"]
+    pid_v2 = defaults["pid_v2"]
+    doi = defaults["doi"]
+    isbn = defaults["isbn"]
+    preprint_id = defaults["preprint_id"]
+    dataset_id = defaults["dataset_id"]
+
     item, created = EtlItemProcess.objects.get_or_create(
         source_index=source_index,
         external_id=external_id,
@@ -154,6 +187,82 @@ def enqueue_etl_item(
     return item
 
 
+def enqueue_etl_items(*, source_index: str, documents) -> int:
+    """
+    Bulk counterpart of ``enqueue_etl_item`` for pending items: pipeline
+    configs and existing rows are read once, then one ``bulk_create`` and one
+    ``bulk_update``.
+    ``documents`` is an iterable of ``(external_id, source_payload)``.
+    """
+    configs = list(EtlPipelineConfig.objects.enabled())
+    defaults_by_id = {
+        str(external_id): _etl_item_defaults(
+            source_index=source_index,
+            source_payload=source_payload,
+            configs=configs,
+        )
+        for external_id, source_payload in documents
+    }
+    if not defaults_by_id:
+        return 0
+
+    existing = {
+        item.external_id: item
+        for item in EtlItemProcess.objects.filter(
+            source_index=source_index,
+            external_id__in=list(defaults_by_id),
+        )
+    }
+
+    to_create = []
+    to_update = []
+    for external_id, defaults in defaults_by_id.items():
+        item = existing.get(external_id)
+        if item is None:
+            to_create.append(
+                EtlItemProcess(source_index=source_index, external_id=external_id, **defaults)
+            )
+            continue
+        if item.source_hash == defaults["source_hash"]:
+            continue
+        for field, value in defaults.items():
+            setattr(item, field, value)
+        item.has_openalex_match = False
+        item.has_scielo_dedup = False
+        item.scielo_dedup_ids = []
+        item.openalex_match_ids = []
+        item.processed_at = None
+        item.updated_at = timezone.now()
+        to_update.append(item)
+
+    EtlItemProcess.objects.bulk_create(to_create, ignore_conflicts=True)
+    if to_update:
+        EtlItemProcess.objects.bulk_update(
+            to_update,
+            [
+                "document_type",
+                "publication_year",
+                "source_hash",
+                "status",
+                "result",
+                "error",
+                "pid_v2",
+                "doi",
+                "isbn",
+                "preprint_id",
+                "dataset_id",
+                "has_openalex_match",
+                "has_scielo_dedup",
+                "scielo_dedup_ids",
+                "openalex_match_ids",
+                "processed_at",
+                "updated_at",
+            ],
+            batch_size=500,
+        )
+    return len(to_create) + len(to_update)
+
+
 def backfill_input_items(
     input_index: str,
     *,
@@ -224,6 +333,7 @@ def process_pending_items(
     limit: int = 5000,
     retry_failed: bool = False,
     document_type: str | None = None,
+    workers: int | None = None,
 ) -> list[dict]:
     statuses = [EtlStatus.PENDING]
     if retry_failed:
@@ -254,56 +364,34 @@ def process_pending_items(
             qs = qs.filter(document_type=document_type)
 
         items = list(qs.order_by("updated_at")[:limit])
-        for item in items:
-            item.mark_processing()
+        EtlItemProcess.objects.mark_processing(items)
 
     groups: dict[tuple[str, int | None, str], list[EtlItemProcess]] = defaultdict(list)
     for item in items:
         groups[(item.source_index, item.publication_year, item.document_type)].append(item)
 
-    results = []
-    for (source_index, year, item_document_type), group_items in groups.items():
-        try:
-            result = process_item_group(source_index, year, item_document_type, group_items)
-            results.append(result)
-            refresh_db_connections()
-
-            openalex_ids = set(result.get("openalex_matched_source_ids") or [])
-            dedup_ids = set(result.get("scielo_dedup_source_ids") or [])
-            scielo_dedup_map = result.get("scielo_dedup_map") or {}
-            openalex_match_map = result.get("openalex_match_map") or {}
-            indexed = result.get("total_indexed_docs", 0) > 0
-            skipped_ids = set(result.get("skipped_doc_ids") or [])
-
-            for item in group_items:
-                has_oa = item.external_id in openalex_ids
-                has_dedup = item.external_id in dedup_ids
-                item_result = (
-                    EtlResult.SKIPPED if item.external_id in skipped_ids
-                    else EtlResult.MERGED if (has_oa or has_dedup)
-                    else EtlResult.UPDATED if indexed
-                    else EtlResult.UNCHANGED
-                )
-                item.mark_success(
-                    item_result,
-                    has_openalex_match=has_oa,
-                    has_scielo_dedup=has_dedup,
-                    scielo_dedup_ids=scielo_dedup_map.get(item.external_id) or [],
-                    openalex_match_ids=openalex_match_map.get(item.external_id) or [],
-                    status=EtlStatus.SKIPPED if item.external_id in skipped_ids else EtlStatus.SUCCESS,
-                    error="Missing mandatory publication_year" if item.external_id in skipped_ids else None,
-                )
+    if workers is None:
+        workers = settings.ETL_GROUP_WORKERS
+    workers = max(1, min(int(workers or 1), len(groups) or 1))
 
-        except Exception as exc:
-            logger.exception("Silver ETL pending group failed")
-            refresh_db_connections()
+    pipelines = PipelinePool()
+    results = []
+    for (source_index, year, item_document_type), group_items, outcome in _run_item_groups(
+        groups,
+        pipelines,
+        workers,
+    ):
+        refresh_db_connections()
 
+        if isinstance(outcome, Exception):
+            exc = outcome
             for item in group_items:
-                item.mark_failed(exc)
-                try:
-                    log_etl_error(item=item, exc=exc)
-                except Exception:
-                    logger.exception("Failed to write ETL error log")
+                item.apply_failure(exc)
+            EtlItemProcess.objects.bulk_save_outcomes(group_items)
+            try:
+                log_etl_errors(items=group_items, exc=exc)
+            except Exception:
+                logger.exception("Failed to write ETL error log")
 
             results.append(
                 {
@@ -313,28 +401,156 @@ def process_pending_items(
                     "error": str(exc),
                 }
             )
+            continue
+
+        result = outcome
+        results.append(result)
+        apply_group_outcomes(group_items, result)
+        EtlItemProcess.objects.bulk_save_outcomes(group_items)
 
     if any(r.get("total_indexed_docs", 0) > 0 for r in results):
         invalidate_freshness_cache()
+        invalidate_indicator_result_cache()
 
     return results
 
 
+def apply_group_outcomes(group_items: list[EtlItemProcess], result: dict) -> None:
+    openalex_ids = set(result.get("openalex_matched_source_ids") or [])
+    dedup_ids = set(result.get("scielo_dedup_source_ids") or [])
+    scielo_dedup_map = result.get("scielo_dedup_map") or {}
+    openalex_match_map = result.get("openalex_match_map") or {}
+    indexed = result.get("total_indexed_docs", 0) > 0
+    skipped_ids = set(result.get("skipped_doc_ids") or [])
+
+    for item in group_items:
+        has_oa = item.external_id in openalex_ids
+        has_dedup = item.external_id in dedup_ids
+        item_result = (
+            EtlResult.SKIPPED if item.external_id in skipped_ids
+            else EtlResult.MERGED if (has_oa or has_dedup)
+            else EtlResult.UPDATED if indexed
+            else EtlResult.UNCHANGED
+        )
+        item.apply_success(
+            item_result,
+            has_openalex_match=has_oa,
+            has_scielo_dedup=has_dedup,
+            scielo_dedup_ids=scielo_dedup_map.get(item.external_id) or [],
+            openalex_match_ids=openalex_match_map.get(item.external_id) or [],
+            status=EtlStatus.SKIPPED if item.external_id in skipped_ids else EtlStatus.SUCCESS,
+            error="Missing mandatory publication_year" if item.external_id in skipped_ids else None,
+        )
+
+
+class PipelinePool:
+    """
+    Per-thread cache of ETL pipelines.
+
+    Each worker thread keeps one pipeline (and its OpenSearch clients) per
+    source index and pipeline config for the duration of a batch.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def get(self, source_index: str, pipeline_config: EtlPipelineConfig) -> OpenSearchETLPipeline:
+        pipelines = getattr(self._local, "pipelines", None)
+        if pipelines is None:
+            pipelines = self._local.pipelines = {}
+
+        key = (source_index, pipeline_config.pk, pipeline_config.openalex_index)
+        if key not in pipelines:
+            pipelines[key] = OpenSearchETLPipeline(
+                input_scielo_index=source_index,
+                input_openalex_index=pipeline_config.openalex_index,
+                public_alias=settings.ETL_PUBLIC_ALIAS,
+                pipeline_config=pipeline_config,
+            )
+        return pipelines[key]
+
+
+def _run_item_groups(
+    groups: dict[tuple[str, int | None, str], list[EtlItemProcess]],
+    pipelines: PipelinePool,
+    workers: int,
+):
+    """
+    Yields ``(group_key, group_items, result_or_exception)`` in claim order.
+
+    Pipeline configs are resolved on the calling thread, so worker threads
+    only talk to OpenSearch and every database write stays with the caller.
+    """
+    jobs = []
+    for group_key, group_items in groups.items():
+        source_index, _year, item_document_type = group_key
+        try:
+            pipeline_config = EtlPipelineConfig.objects.get_for_source(
+                source_index,
+                {"type": item_document_type},
+            )
+        except Exception as exc:
+            logger.exception("Silver ETL pending group failed")
+            pipeline_config = exc
+        jobs.append((group_key, group_items, pipeline_config))
+
+    def run_job(group_key, group_items, pipeline_config):
+        if isinstance(pipeline_config, Exception):
+            return pipeline_config
+
+        source_index, year, item_document_type = group_key
+        try:
+            return process_item_group(
+                source_index,
+                year,
+                item_document_type,
+                group_items,
+                pipeline_config=pipeline_config,
+                pipeline=pipelines.get(source_index, pipeline_config),
+            )
+        except Exception as exc:
+            logger.exception("Silver ETL pending group failed")
+            return exc
+
+    if workers <= 1:
+        for group_key, group_items, pipeline_config in jobs:
+            yield group_key, group_items, run_job(group_key, group_items, pipeline_config)
+        return
+
+    def run_threaded_job(group_key, group_items, pipeline_config):
+        try:
+            return run_job(group_key, group_items, pipeline_config)
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="silver-etl") as executor:
+        futures = [
+            executor.submit(run_threaded_job, group_key, group_items, pipeline_config)
+            for group_key, group_items, pipeline_config in jobs
+        ]
+        for (group_key, group_items, _pipeline_config), future in zip(jobs, futures):
+            yield group_key, group_items, future.result()
+
+
 def process_item_group(
     source_index: str,
     publication_year: int | None,
     document_type: str,
     items: list[EtlItemProcess],
+    pipeline_config: EtlPipelineConfig | None = None,
+    pipeline: OpenSearchETLPipeline | None = None,
 ) -> dict:
-    source_payload = {"type": document_type}
-    pipeline_config = EtlPipelineConfig.objects.get_for_source(source_index, source_payload)
-
-    pipeline = OpenSearchETLPipeline(
-        input_scielo_index=source_index,
-        input_openalex_index=pipeline_config.openalex_index,
-        public_alias=settings.ETL_PUBLIC_ALIAS,
-        pipeline_config=pipeline_config,
-    )
+    if pipeline_config is None:
+        source_payload = {"type": document_type}
+        pipeline_config = EtlPipelineConfig.objects.get_for_source(source_index, source_payload)
+
+    if pipeline is None:
+        pipeline = OpenSearchETLPipeline(
+            input_scielo_index=source_index,
+            input_openalex_index=pipeline_config.openalex_index,
+            public_alias=settings.ETL_PUBLIC_ALIAS,
+            pipeline_config=pipeline_config,
+        )
 
     refresh_db_connections()
     try:
@@ -370,17 +586,27 @@ def process_item_group(
 
 
 def log_etl_error(item: EtlItemProcess, exc: Exception):
-    OpenSearchIndexClient().index_error(
-        component="etl",
-        operation="silver_etl",
-        message=str(exc),
-        error_type=exc.__class__.__name__,
-        traceback_text=traceback.format_exc(),
-        context={
-            "source_index": item.source_index,
-            "external_id": item.external_id,
-            "document_type": item.document_type,
-            "publication_year": item.publication_year,
-        },
+    log_etl_errors(items=[item], exc=exc)
+
+
+def log_etl_errors(items: list[EtlItemProcess], exc: Exception):
+    traceback_text = "".join(traceback.format_exception(exc))
+    OpenSearchIndexClient().bulk_index_errors(
+        [
+            {
+                "component": "etl",
+                "operation": "silver_etl",
+                "message": str(exc),
+                "error_type": exc.__class__.__name__,
+                "traceback_text": traceback_text,
+                "context": {
+                    "source_index": item.source_index,
+                    "external_id": item.external_id,
+                    "document_type": item.document_type,
+                    "publication_year": item.publication_year,
+                },
+            }
+            for item in items
+        ],
         error_index_name=settings.ETL_ERROR_INDEX,
     )
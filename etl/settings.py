@@ -9,6 +9,9 @@ ETL_PUBLIC_ALIAS = _env.str(
 )
 ETL_ERROR_INDEX = _env.str("ETL_ERROR_INDEX", default="etl_errors")
 ETL_DEFAULT_BATCH_SIZE = _env.int("ETL_DEFAULT_BATCH_SIZE", default=5000)
+ETL_GROUP_WORKERS = _env.int("ETL_GROUP_WORKERS", default=1)
+# Documents hydrated per window when streaming SciELO input (0 loads all at once)
+ETL_INPUT_WINDOW_SIZE = _env.int("ETL_INPUT_WINDOW_SIZE", default=0)
 ETL_DB_CONNECTION_REFRESH_INTERVAL = _env.int(
     "ETL_DB_CONNECTION_REFRESH_INTERVAL",
     default=100,
@@ -82,6 +85,14 @@ ETL_SILVER_ROLLOVER_MAX_SIZE = _env.str(
     default="30gb",
 )
 
+# Silver bulk writes: requests kept in flight, 429 retries and the bulk-load
+# index profile applied to runs writing at least ETL_SILVER_BULK_LOAD_MIN_DOCS.
+ETL_SILVER_BULK_WORKERS = _env.int("ETL_SILVER_BULK_WORKERS", default=1)
+ETL_SILVER_BULK_MAX_RETRIES = _env.int("ETL_SILVER_BULK_MAX_RETRIES", default=5)
+ETL_SILVER_BULK_BACKOFF_SECONDS = _env.float("ETL_SILVER_BULK_BACKOFF_SECONDS", default=1.0)
+ETL_SILVER_BULK_LOAD_PROFILE = _env.bool("ETL_SILVER_BULK_LOAD_PROFILE", default=False)
+ETL_SILVER_BULK_LOAD_MIN_DOCS = _env.int("ETL_SILVER_BULK_LOAD_MIN_DOCS", default=50000)
+
 # ETL OpenAlex-only backfill
 ETL_OPENALEX_ONLY_INDEX_PATTERN = _env.str(
     "ETL_OPENALEX_ONLY_INDEX_PATTERN",
@@ -91,3 +102,17 @@ ETL_OPENALEX_ONLY_WRITE_ALIAS = _env.str(
     "ETL_OPENALEX_ONLY_WRITE_ALIAS",
     default="silver_openalex_write",
 )
+
+# Title scorer used by fuzzy deduplication and OpenAlex match validation:
+# "difflib", "indel", "rapidfuzz" or "auto" (rapidfuzz when installed,
+# otherwise "indel"). The faster backends match difflib on ordinary titles but
+# score titles of 200+ characters higher, where difflib's autojunk heuristic
+# kicks in, so switching away from difflib can change match decisions.
+ETL_TITLE_SIMILARITY_BACKEND = _env.str("ETL_TITLE_SIMILARITY_BACKEND", default="difflib")
+
+# ETL OpenAlex matching
+ETL_OPENALEX_BATCH_MATCHING = _env.bool("ETL_OPENALEX_BATCH_MATCHING", default=True)
+ETL_OPENALEX_MSEARCH_MAX_SEARCHES = _env.int(
+    "ETL_OPENALEX_MSEARCH_MAX_SEARCHES",
+    default=100,
+)
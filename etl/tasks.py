@@ -5,7 +5,7 @@ from etl.services import process_pending_items
 
 
 @celery_app.task(name="[ETL] Process pending silver items")
-def process_pending_silver_etl(limit=None, user_id=None, document_type=None):
+def process_pending_silver_etl(limit=None, user_id=None, document_type=None, workers=None):
     """
     Processes one batch of pending ETL items.
 
@@ -14,11 +14,11 @@ def process_pending_silver_etl(limit=None, user_id=None, document_type=None):
     """
     if limit is None:
         limit = settings.ETL_DEFAULT_BATCH_SIZE
-    return process_pending_items(limit=limit, document_type=document_type)
+    return process_pending_items(limit=limit, document_type=document_type, workers=workers)
 
 
 @celery_app.task(name="[ETL] Retry failed silver ETL items")
-def retry_failed_silver_etl(limit=None, user_id=None):
+def retry_failed_silver_etl(limit=None, user_id=None, workers=None):
     """
     Retries one batch of failed ETL items.
 
@@ -27,4 +27,4 @@ def retry_failed_silver_etl(limit=None, user_id=None):
     """
     if limit is None:
         limit = settings.ETL_DEFAULT_BATCH_SIZE
-    return process_pending_items(limit=limit, retry_failed=True)
+    return process_pending_items(limit=limit, retry_failed=True, workers=workers)
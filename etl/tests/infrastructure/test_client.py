@@ -70,6 +70,39 @@ class OpenSearchClientTests(SimpleTestCase):
         )
         mock_client.indices.create.assert_not_called()
 
+    @patch("etl.client.get_opensearch_client")
+    def test_ensure_rollover_index_adds_new_properties_to_existing_write_index(self, get_client):
+        mock_client = Mock()
+        mock_client.indices.exists.return_value = True
+        mock_client.indices.get_mapping.return_value = {
+            "silver_scientific_production-000003": {
+                "mappings": {"properties": {"doc_id": {"type": "keyword"}}},
+            }
+        }
+        get_client.return_value = mock_client
+
+        client = OpenSearchClient()
+        client.ensure_rollover_index(
+            index_prefix="silver_scientific_production",
+            write_alias="silver_write",
+            public_alias="scientific_production",
+            mapping={
+                "mappings": {
+                    "dynamic": "strict",
+                    "properties": {
+                        "doc_id": {"type": "keyword"},
+                        "etl_indexed_at": {"type": "date"},
+                    },
+                }
+            },
+        )
+
+        mock_client.indices.put_mapping.assert_called_once_with(
+            index="silver_write",
+            body={"properties": {"etl_indexed_at": {"type": "date"}}},
+        )
+        mock_client.indices.create.assert_not_called()
+
     @patch("etl.client.get_opensearch_client")
     def test_rollover_applies_mapping_and_adds_public_alias_to_new_index(self, get_client):
         mock_client = Mock()
@@ -100,3 +133,24 @@ class OpenSearchClientTests(SimpleTestCase):
             index="silver_scientific_production-000002",
             name="scientific_production",
         )
+
+    @patch("etl.client.get_opensearch_client")
+    def test_overlapping_bulk_load_profiles_restore_original_settings_once(self, get_client):
+        mock_client = Mock()
+        mock_client.indices.get_settings.return_value = {
+            "silver-000001": {"settings": {"index": {"refresh_interval": "1s", "number_of_replicas": "1"}}}
+        }
+        get_client.return_value = mock_client
+        first, second = OpenSearchClient(), OpenSearchClient()
+
+        with first.bulk_load_profile("silver_write"):
+            with second.bulk_load_profile("silver_write"):
+                pass
+            self.assertEqual(mock_client.indices.put_settings.call_count, 1)
+
+        mock_client.indices.get_settings.assert_called_once()
+        self.assertEqual(mock_client.indices.put_settings.call_count, 2)
+        mock_client.indices.put_settings.assert_called_with(
+            index="silver-000001",
+            body={"index": {"refresh_interval": "1s", "number_of_replicas": "1"}},
+        )
@@ -5,7 +5,7 @@ from django.test import TestCase
 from django.utils import timezone
 
 from etl.models import EtlItemProcess, EtlResult, EtlStatus
-from etl.services import enqueue_etl_item, process_pending_items
+from etl.services import enqueue_etl_item, enqueue_etl_items, process_pending_items
 from harvest.utils import source_hash
 
 
@@ -55,6 +55,40 @@ class IncrementalEtlTests(TestCase):
         self.assertIsNone(changed.processed_at)
         self.assertEqual(EtlItemProcess.objects.count(), 1)
 
+    def test_bulk_enqueue_creates_new_and_reopens_changed_items(self):
+        unchanged = enqueue_etl_item(
+            source_index="bronze_scielo_books",
+            external_id="p1",
+            source_payload={"type": "book", "publication_year": 2024, "title": "A"},
+        )
+        unchanged.mark_success(EtlResult.UPDATED)
+        changed = enqueue_etl_item(
+            source_index="bronze_scielo_books",
+            external_id="p2",
+            source_payload={"type": "book", "publication_year": 2024, "title": "B"},
+        )
+        changed.mark_success(EtlResult.UPDATED)
+
+        with self.assertNumQueries(4):
+            count = enqueue_etl_items(
+                source_index="bronze_scielo_books",
+                documents=[
+                    ("p1", {"type": "book", "publication_year": 2024, "title": "A"}),
+                    ("p2", {"type": "book", "publication_year": 2024, "title": "B2"}),
+                    ("p3", {"type": "book", "publication_year": 2023, "title": "C"}),
+                ],
+            )
+
+        self.assertEqual(count, 2)
+        statuses = dict(EtlItemProcess.objects.values_list("external_id", "status"))
+        self.assertEqual(
+            statuses,
+            {"p1": EtlStatus.SUCCESS, "p2": EtlStatus.PENDING, "p3": EtlStatus.PENDING},
+        )
+        changed.refresh_from_db()
+        self.assertIsNone(changed.processed_at)
+        self.assertEqual(EtlItemProcess.objects.get(external_id="p3").publication_year, 2023)
+
     def test_enqueue_marks_existing_same_hash_success_when_backfilling_processed_items(self):
         item = enqueue_etl_item(
             source_index="bronze_scielo_books",
@@ -101,7 +135,7 @@ class IncrementalEtlTests(TestCase):
         self.assertIsNone(updated.error)
         self.assertIsNotNone(updated.processed_at)
 
-    @patch("etl.services.log_etl_error")
+    @patch("etl.services.log_etl_errors")
     @patch("etl.services.OpenSearchETLPipeline")
     def test_process_pending_marks_success(self, pipeline_cls, _log_etl_error):
         item = enqueue_etl_item(
@@ -129,7 +163,47 @@ class IncrementalEtlTests(TestCase):
             doc_ids=["p1"],
         )
 
-    @patch("etl.services.log_etl_error")
+    @patch("etl.services.invalidate_freshness_cache")
+    @patch("etl.services.log_etl_errors")
+    @patch("etl.services.OpenSearchETLPipeline")
+    def test_process_pending_runs_groups_in_parallel_workers(
+        self,
+        pipeline_cls,
+        log_etl_errors,
+        invalidate_freshness_cache,
+    ):
+        for external_id, year in (("p1", 2022), ("p2", 2023), ("p3", 2024)):
+            enqueue_etl_item(
+                source_index="bronze_scielo_books",
+                external_id=external_id,
+                source_payload={"type": "book", "publication_year": year, "title": external_id},
+            )
+
+        def run(year_filter, doc_ids):
+            if year_filter == 2023:
+                raise RuntimeError("boom")
+            return {"errors": 0, "total_indexed_docs": len(doc_ids)}
+
+        pipeline_cls.return_value.run.side_effect = run
+        pipeline_cls.return_value.indexed_index_names = {"silver"}
+        pipeline_cls.return_value.loaded_source_ids = {"p1", "p2", "p3"}
+
+        result = process_pending_items(limit=10, workers=3)
+
+        self.assertEqual(
+            [(r["publication_year"], r.get("errors")) for r in result],
+            [(2022, 0), (2023, 1), (2024, 0)],
+        )
+        statuses = dict(EtlItemProcess.objects.values_list("external_id", "status"))
+        self.assertEqual(
+            statuses,
+            {"p1": EtlStatus.SUCCESS, "p2": EtlStatus.FAILED, "p3": EtlStatus.SUCCESS},
+        )
+        log_etl_errors.assert_called_once()
+        invalidate_freshness_cache.assert_called_once()
+        self.assertLessEqual(pipeline_cls.call_count, 3)
+
+    @patch("etl.services.log_etl_errors")
     @patch("etl.services.OpenSearchETLPipeline")
     def test_process_pending_requeues_stale_processing_items(
         self,
@@ -162,7 +236,7 @@ class IncrementalEtlTests(TestCase):
         self.assertEqual(item.status, EtlStatus.SUCCESS)
         self.assertEqual(result[0]["item_count"], 1)
 
-    @patch("etl.services.log_etl_error")
+    @patch("etl.services.log_etl_errors")
     @patch("etl.services.OpenSearchETLPipeline")
     def test_process_pending_skips_document_type_without_enabled_config(
         self,
@@ -184,3 +258,37 @@ class IncrementalEtlTests(TestCase):
         self.assertIsNotNone(item.processed_at)
         self.assertEqual(result, [])
         pipeline_cls.return_value.run.assert_not_called()
+
+    @patch("etl.services.log_etl_errors")
+    @patch("etl.services.OpenSearchETLPipeline")
+    def test_process_pending_writes_group_outcomes_in_bulk(self, pipeline_cls, _log_etl_errors):
+        for external_id in ("p1", "p2", "p3"):
+            enqueue_etl_item(
+                source_index="bronze_scielo_books",
+                external_id=external_id,
+                source_payload={"type": "book", "publication_year": 2024, "title": external_id},
+            )
+        pipeline_cls.return_value.run.return_value = {
+            "errors": 0,
+            "total_indexed_docs": 2,
+            "total_skipped_docs": 1,
+            "skipped_doc_ids": ["p3"],
+            "openalex_matched_source_ids": ["p1"],
+            "openalex_match_map": {"p1": ["W1"]},
+        }
+        pipeline_cls.return_value.indexed_index_names = {"silver"}
+        pipeline_cls.return_value.loaded_source_ids = {"p1", "p2", "p3"}
+
+        with patch.object(
+            EtlItemProcess,
+            "save",
+            side_effect=AssertionError("outcomes must not be saved per item"),
+        ):
+            process_pending_items(limit=10)
+
+        items = {item.external_id: item for item in EtlItemProcess.objects.all()}
+        self.assertEqual(items["p1"].result, EtlResult.MERGED)
+        self.assertEqual(items["p1"].openalex_match_ids, ["W1"])
+        self.assertEqual(items["p2"].result, EtlResult.UPDATED)
+        self.assertEqual(items["p3"].status, EtlStatus.SKIPPED)
+        self.assertEqual(items["p3"].error, "Missing mandatory publication_year")
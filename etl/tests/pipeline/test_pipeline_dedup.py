@@ -3,10 +3,22 @@ from pathlib import Path
 from unittest.mock import Mock
 
 from django.apps import apps
-
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase
+
+from etl.deduplicator.blocking import TitleBlockingIndex
+from etl.deduplicator.helpers import (
+    IndelSimilarity,
+    RapidfuzzSimilarity,
+    best_similarity,
+    calculate_similarity,
+    get_similarity_backend,
+)
 from etl.deduplicator.openalex import OpenAlexMatcher
-from etl.deduplicator.scielo import SciELODeduplicator
+from etl.deduplicator.scielo import SciELODeduplicator, UnionFind
 from etl.documents import SilverDocument
+from etl.transform.extractors import extract_doi
+from etl.transform.normalizers import normalize_doi
 from etl.transform.standardizer import standardizer_for
 from etl.models import EtlPipelineConfig
 from etl.pipeline import OpenSearchETLPipeline
@@ -88,6 +100,65 @@ class DocumentRulesTests(EtlTestCase):
 
         self.assertEqual(len(groups), 2)
 
+    def test_article_fuzzy_blocking_matches_pairwise_scoring(self):
+        deduplicator = make_deduplicator("article")
+        deduplicator.rules["scielo_dedup_strategies"] = ["fuzzy"]
+        deduplicator.rules["fuzzy_requires_source_match"] = True
+        base_titles = [
+            "Ethical dilemmas in nursing professionals' work",
+            "Prevalence of hypertension among older adults in Brazil",
+            "Editorial",
+            "Saúde mental de estudantes universitários durante a pandemia",
+        ]
+        variants = [
+            lambda title: title,
+            lambda title: title.upper(),
+            lambda title: title[:-2],
+            lambda title: title.replace("e", "a", 2),
+            lambda title: f"{title}: a cross-sectional study",
+        ]
+        articles = []
+        for title_idx, title in enumerate(base_titles):
+            for variant_idx, variant in enumerate(variants):
+                articles.append(
+                    {
+                        "type": "research-article",
+                        "title": variant(title),
+                        "publication_year": 2020 + (title_idx + variant_idx) % 3,
+                        "source_issns": ["0034-7167"] if variant_idx % 2 else ["0034-7167", "1984-0446"],
+                    }
+                )
+
+        uf = UnionFind(len(articles))
+        deduplicator._merge_by_title_fuzzy(articles, uf, min_similarity=0.85, year_tolerance=1)
+
+        expected = UnionFind(len(articles))
+        for i in range(len(articles)):
+            for j in range(i + 1, len(articles)):
+                year_gap = abs(articles[i]["publication_year"] - articles[j]["publication_year"])
+                similarity = calculate_similarity(articles[i]["title"], articles[j]["title"])
+                if year_gap <= 1 and similarity >= 0.85:
+                    expected.union(i, j)
+
+        self.assertEqual(
+            [uf.find(i) == uf.find(j) for i in range(len(articles)) for j in range(len(articles))],
+            [
+                expected.find(i) == expected.find(j)
+                for i in range(len(articles))
+                for j in range(len(articles))
+            ],
+        )
+
+    def test_title_blocking_index_skips_unrelated_titles(self):
+        index = TitleBlockingIndex(min_similarity=0.85, year_tolerance=1)
+        index.add(0, 2024, ["Ethical dilemmas in nursing professionals' work"], [("article", "x")])
+        index.add(1, 2024, ["Ethical dilemmas in nursing professional work"], [("article", "x")])
+        index.add(2, 2024, ["Prevalence of hypertension among older adults"], [("article", "x")])
+        index.add(3, 2021, ["Ethical dilemmas in nursing professionals' work"], [("article", "x")])
+        index.add(4, 2024, ["Ethical dilemmas in nursing professionals' work"], [("article", "y")])
+
+        self.assertEqual(list(index.candidate_pairs()), [(0, 1)])
+
     def test_article_dedup_requires_same_raw_type(self):
         deduplicator = make_deduplicator("article")
         groups = deduplicator.find_duplicates(
@@ -423,8 +494,9 @@ class DocumentRulesTests(EtlTestCase):
         pipeline.input_scielo_index = "bronze_scielo_datasets"
         pipeline.loaded_source_ids = set()
         pipeline.client = Mock()
+        pipeline.client.client.create_pit.return_value = {"pit_id": "pit-1"}
         pipeline.client.client.search.return_value = {
-            "_scroll_id": "scroll-1",
+            "pit_id": "pit-1",
             "hits": {
                 "hits": [
                     {
@@ -438,10 +510,6 @@ class DocumentRulesTests(EtlTestCase):
                 ]
             },
         }
-        pipeline.client.client.scroll.return_value = {
-            "_scroll_id": "scroll-1",
-            "hits": {"hits": []},
-        }
         docs = [
             {
                 "_os_id": "requested-os-id",
@@ -456,7 +524,7 @@ class DocumentRulesTests(EtlTestCase):
         self.assertEqual(len(expanded), 2)
         self.assertTrue(all(isinstance(doc, dict) for doc in expanded))
         self.assertIn("related-os-id", pipeline.loaded_source_ids)
-        pipeline.client.client.clear_scroll.assert_called_once_with(scroll_id="scroll-1")
+        pipeline.client.client.delete_pit.assert_called_once_with(body={"pit_id": ["pit-1"]})
 
     def test_book_chapter_isbn_requires_chapter_title_match(self):
         matcher = make_matcher("book-chapter")
@@ -926,6 +994,79 @@ class DocumentRulesTests(EtlTestCase):
         self.assertEqual(matches[0][1], "title_year_author")
         self.assertEqual(matcher.client.client.search.call_count, 2)
 
+    def test_openalex_batch_falls_through_to_title_only_for_unmatched_groups(self):
+        matcher = make_matcher("article")
+        matcher.rules["openalex_match_strategies"] = ["doi", "title"]
+        matcher.client = Mock()
+        matched_candidate = dict(self._silver_articles["en"])
+        matched_doi = normalize_doi(extract_doi(matched_candidate))
+        matcher.client.client.msearch.side_effect = [
+            {
+                "responses": [
+                    {"hits": {"hits": [{"_source": matched_candidate}]}},
+                    {"hits": {"hits": []}},
+                ]
+            },
+            {
+                "responses": [
+                    {"hits": {"hits": [{"_source": self._silver_articles["en"]}]}},
+                ]
+            },
+        ]
+        groups = [
+            [
+                {
+                    "type": "article",
+                    "publication_year": 2025,
+                    "ids": {"doi": matched_doi},
+                    "title": "Ethical dilemmas in nursing professionals' work",
+                    "source_issns": ["0034-7167", "1984-0446"],
+                }
+            ],
+            [
+                {
+                    "type": "article",
+                    "publication_year": 2025,
+                    "ids": {"doi": "10.1590/unmatched"},
+                    "title": "Ethical dilemmas in nursing professionals' work",
+                    "source_issns": ["0034-7167", "1984-0446"],
+                }
+            ],
+        ]
+
+        matches = matcher.find_matches_batch(groups, max_candidates=3)
+
+        self.assertEqual(len(matches), 2)
+        self.assertEqual([match[1] for match in matches[0]], ["doi"])
+        self.assertEqual([match[1] for match in matches[1]], ["title_year_author"])
+        matcher.client.client.search.assert_not_called()
+        self.assertEqual(matcher.client.client.msearch.call_count, 2)
+        title_body = matcher.client.client.msearch.call_args_list[1].kwargs["body"]
+        self.assertEqual(len(title_body), 2)
+        self.assertIn("match", title_body[1]["query"]["bool"]["must"][0])
+
+    def test_openalex_batch_isolates_failed_sub_responses(self):
+        matcher = make_matcher("article")
+        matcher.rules["openalex_match_strategies"] = ["title"]
+        matcher.client = Mock()
+        matcher.client.client.msearch.return_value = {
+            "responses": [
+                {"error": {"type": "search_phase_execution_exception"}, "status": 400},
+                {"hits": {"hits": [{"_source": self._silver_articles["en"]}]}},
+            ]
+        }
+        doc = {
+            "type": "article",
+            "publication_year": 2025,
+            "title": "Ethical dilemmas in nursing professionals' work",
+            "source_issns": ["0034-7167", "1984-0446"],
+        }
+
+        matches = matcher.find_matches_batch([[doc], [dict(doc)]], max_candidates=3)
+
+        self.assertEqual(matches[0], [])
+        self.assertEqual(len(matches[1]), 1)
+
     def test_openalex_isbn_search_only_uses_bibliographic_isbn_fields(self):
         matcher = make_matcher("book")
         matcher.client = Mock()
@@ -1119,3 +1260,70 @@ class DocumentRulesTests(EtlTestCase):
 
         self.assertEqual(matches, [])
         matcher.client.client.search.assert_not_called()
+
+
+class TitleSimilarityBackendTests(SimpleTestCase):
+
+    _golden = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._golden = json.loads(
+            (FIXTURES_DIR / "title_similarity_golden.json").read_text()
+        )
+
+    def _fast_backends(self):
+        backends = [IndelSimilarity()]
+        try:
+            backends.append(RapidfuzzSimilarity())
+        except ImproperlyConfigured:
+            pass
+        return backends
+
+    def test_difflib_backend_reproduces_golden_ratios(self):
+        difflib_backend = get_similarity_backend("difflib")
+        for case in self._golden:
+            with self.subTest(left=case["left"], right=case["right"]):
+                self.assertAlmostEqual(
+                    calculate_similarity(case["left"], case["right"], difflib_backend),
+                    case["difflib_ratio"],
+                    places=4,
+                )
+
+    def test_fast_backends_agree_with_difflib_on_golden_set(self):
+        for backend in self._fast_backends():
+            for case in self._golden:
+                if case.get("long_title"):
+                    continue
+                with self.subTest(backend=backend.name, left=case["left"], right=case["right"]):
+                    expected = case["difflib_ratio"]
+                    score = calculate_similarity(case["left"], case["right"], backend)
+                    self.assertGreaterEqual(score, expected - 1e-4)
+                    if expected >= 0.7:
+                        self.assertAlmostEqual(score, expected, delta=0.05)
+                    for threshold in (0.80, 0.85, 0.90):
+                        self.assertEqual(score >= threshold, expected >= threshold)
+
+    def test_fast_backends_may_score_long_titles_above_difflib(self):
+        long_cases = [case for case in self._golden if case.get("long_title")]
+        self.assertTrue(long_cases)
+        for backend in self._fast_backends():
+            for case in long_cases:
+                with self.subTest(backend=backend.name, left=case["left"]):
+                    score = calculate_similarity(case["left"], case["right"], backend)
+                    self.assertLess(case["difflib_ratio"], 0.85)
+                    self.assertGreaterEqual(score, 0.85)
+
+    def test_default_backend_is_difflib(self):
+        self.assertEqual(get_similarity_backend().name, "difflib")
+
+    def test_best_similarity_prepares_each_title_once(self):
+        backend = IndelSimilarity()
+        backend.prepare = Mock(side_effect=str.lower)
+
+        similarity = best_similarity(["Editorial", "Erratum"], ["EDITORIAL", "Errata", "Note"], backend)
+
+        self.assertEqual(similarity, 1.0)
+        self.assertEqual(backend.prepare.call_count, 5)
+        self.assertEqual(best_similarity([], ["Editorial"], backend), 0.0)
@@ -1,10 +1,11 @@
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 from django.test import TestCase, override_settings
 
 from etl.documents import SilverDocument
 from etl.mapping_silver import SILVER_MAPPING
 from etl.pipeline import OpenSearchETLPipeline
+from etl.tests.base import EtlTestCase
 
 
 class OrchestratorAliasTests(TestCase):
@@ -80,6 +81,8 @@ class OrchestratorAliasTests(TestCase):
         bulk_body = client.client.bulk.call_args.kwargs["body"]
         self.assertEqual(bulk_body[0]["index"]["_index"], "silver_write")
         self.assertEqual(bulk_body[2]["index"]["_index"], "silver_write")
+        self.assertTrue(bulk_body[1]["etl_indexed_at"])
+        self.assertEqual(bulk_body[1]["etl_indexed_at"], bulk_body[3]["etl_indexed_at"])
         client.add_alias.assert_not_called()
         self.assertEqual(pipeline.indexed_index_names, {"silver_scientific_production-000001"})
 
@@ -285,3 +288,231 @@ class OrchestratorAliasTests(TestCase):
 
         client.add_alias.assert_not_called()
         client.rollover.assert_not_called()
+
+
+    @override_settings(ETL_SILVER_BULK_BACKOFF_SECONDS=0)
+    @patch("etl.pipeline.standardizer_for")
+    @patch("etl.pipeline.OpenAlexMatcher")
+    @patch("etl.pipeline.SciELODeduplicator")
+    @patch("etl.pipeline.OpenSearchClient")
+    def test_indexing_retries_throttled_items_and_captures_item_errors(
+        self,
+        client_cls,
+        _scielo_deduplicator_cls,
+        _openalex_matcher_cls,
+        _standardizer_for,
+    ):
+        client = Mock()
+        client.client.bulk.side_effect = [
+            {
+                "errors": True,
+                "items": [
+                    {"index": {"_id": "S001", "status": 201}},
+                    {"index": {"_id": "S002", "status": 429, "error": {"type": "es_rejected_execution_exception"}}},
+                    {"index": {"_id": "S003", "status": 400, "error": {"type": "mapper_parsing_exception"}}},
+                ],
+            },
+            {"errors": False, "items": [{"index": {"_id": "S002", "status": 201}}]},
+        ]
+        client.ensure_rollover_index.return_value = "silver_scientific_production-000001"
+        client_cls.return_value = client
+        pipeline = OpenSearchETLPipeline(
+            opensearch_url="http://opensearch:9200",
+            public_alias="scientific_production",
+        )
+        docs = [
+            SilverDocument(doc_id=f"S00{i}", type="article", publication_year=2024, title=f"Title {i}")
+            for i in range(1, 4)
+        ]
+
+        with self.assertRaises(RuntimeError):
+            pipeline._index_silver_documents(docs)
+
+        retried_body = client.client.bulk.call_args_list[1].kwargs["body"]
+        self.assertEqual(len(retried_body), 2)
+        self.assertEqual(retried_body[1]["doc_id"], "S002")
+        self.assertEqual(
+            pipeline.silver_bulk_errors,
+            [{"_id": "S003", "status": 400, "error": {"type": "mapper_parsing_exception"}}],
+        )
+
+    @override_settings(
+        ETL_SILVER_BULK_MAX_DOCS=1,
+        ETL_SILVER_BULK_WORKERS=3,
+        ETL_SILVER_BULK_LOAD_PROFILE=True,
+        ETL_SILVER_BULK_LOAD_MIN_DOCS=2,
+    )
+    @patch("etl.pipeline.standardizer_for")
+    @patch("etl.pipeline.OpenAlexMatcher")
+    @patch("etl.pipeline.SciELODeduplicator")
+    @patch("etl.pipeline.OpenSearchClient")
+    def test_indexing_sends_chunks_in_parallel_under_bulk_load_profile(
+        self,
+        client_cls,
+        _scielo_deduplicator_cls,
+        _openalex_matcher_cls,
+        _standardizer_for,
+    ):
+        client = Mock()
+        client.client.bulk.return_value = {"errors": False}
+        client.bulk_load_profile.return_value = MagicMock()
+        client.ensure_rollover_index.return_value = "silver_scientific_production-000001"
+        client.rollover.return_value = None
+        client_cls.return_value = client
+        pipeline = OpenSearchETLPipeline(
+            opensearch_url="http://opensearch:9200",
+            public_alias="scientific_production",
+        )
+        docs = [
+            SilverDocument(doc_id=f"S{i:03d}", type="article", publication_year=2024, title=f"Title {i}")
+            for i in range(10)
+        ]
+
+        indexed_count = pipeline._index_silver_documents(docs)
+
+        self.assertEqual(indexed_count, 10)
+        self.assertEqual(client.client.bulk.call_count, 10)
+        sent_ids = sorted(
+            call.kwargs["body"][0]["index"]["_id"]
+            for call in client.client.bulk.call_args_list
+        )
+        self.assertEqual(len(set(sent_ids)), 10)
+        client.bulk_load_profile.assert_called_once_with("silver_write")
+
+    @patch("etl.pipeline.standardizer_for")
+    @patch("etl.pipeline.OpenAlexMatcher")
+    @patch("etl.pipeline.SciELODeduplicator")
+    @patch("etl.pipeline.OpenSearchClient")
+    def test_doc_id_written_by_earlier_window_gets_alternate_id(
+        self,
+        client_cls,
+        _scielo_deduplicator_cls,
+        _openalex_matcher_cls,
+        _standardizer_for,
+    ):
+        client = Mock()
+        client.client.bulk.return_value = {"errors": False}
+        client.ensure_rollover_index.return_value = None
+        client.rollover.return_value = None
+        client_cls.return_value = client
+        pipeline = OpenSearchETLPipeline(opensearch_url="http://opensearch:9200")
+
+        pipeline._index_silver_documents(
+            [SilverDocument(doc_id="S001", type="article", publication_year=2024, title="First")]
+        )
+        pipeline._index_silver_documents(
+            [SilverDocument(doc_id="S001", type="article", publication_year=2024, title="Second")]
+        )
+
+        sent_ids = [call.kwargs["body"][0]["index"]["_id"] for call in client.client.bulk.call_args_list]
+        self.assertEqual(sent_ids[0], "S001")
+        self.assertTrue(sent_ids[1].startswith("S001__"))
+
+    @patch("etl.pipeline.standardizer_for")
+    @patch("etl.pipeline.OpenAlexMatcher")
+    @patch("etl.pipeline.SciELODeduplicator")
+    @patch("etl.pipeline.OpenSearchClient")
+    def test_run_resets_and_reports_silver_bulk_errors(
+        self,
+        client_cls,
+        _scielo_deduplicator_cls,
+        _openalex_matcher_cls,
+        _standardizer_for,
+    ):
+        client_cls.return_value = Mock()
+        pipeline = OpenSearchETLPipeline(opensearch_url="http://opensearch:9200")
+        pipeline.silver_bulk_errors = [{"_id": "old", "status": 400, "error": "stale"}]
+        failed = [{"_id": f"S{i}", "status": 400, "error": "mapper_parsing_exception"} for i in range(12)]
+
+        def load_input(**kwargs):
+            pipeline.silver_bulk_errors.extend(failed)
+            return []
+
+        pipeline._load_scielo_input_documents = load_input
+
+        result = pipeline.run()
+
+        self.assertEqual(result["silver_bulk_errors"], 12)
+        self.assertEqual(result["silver_bulk_error_samples"], failed[:10])
+
+
+class StreamingInputTests(EtlTestCase):
+    @override_settings(ETL_INPUT_WINDOW_SIZE=2)
+    @patch("etl.pipeline.standardizer_for")
+    @patch("etl.pipeline.OpenAlexMatcher")
+    @patch("etl.pipeline.OpenSearchClient")
+    def test_streaming_run_groups_slim_docs_and_hydrates_per_window(
+        self,
+        client_cls,
+        openalex_matcher_cls,
+        standardizer_for,
+    ):
+        full_docs = {
+            "os-a": {"code": "S-A", "type": "research-article", "publication_year": 2024,
+                     "title": "Same article", "doi": "10.1590/dup", "source_issns": ["0034-7167"], "abstract": "A"},
+            "os-b": {"code": "S-B", "type": "research-article", "publication_year": 2024,
+                     "title": "Same article", "doi": "10.1590/dup", "source_issns": ["0034-7167"], "abstract": "B"},
+            "os-c": {"code": "S-C", "type": "research-article", "publication_year": 2024,
+                     "title": "Other article", "doi": "10.1590/other", "source_issns": ["0034-7167"], "abstract": "C"},
+        }
+        search_bodies = []
+
+        def search(body):
+            if "search_after" in body:
+                return {"pit_id": "pit-1", "hits": {"hits": []}}
+            search_bodies.append(body)
+            if "_source" in body:
+                hits = [
+                    {"_id": os_id, "_source": {k: v for k, v in doc.items() if k != "abstract"}}
+                    for os_id, doc in full_docs.items()
+                ]
+            else:
+                hits = [
+                    {"_id": os_id, "_source": full_docs[os_id], "sort": [os_id]}
+                    for os_id in body["query"]["ids"]["values"]
+                ]
+            return {"pit_id": "pit-1", "hits": {"hits": hits}}
+
+        client = Mock()
+        client.client.create_pit.return_value = {"pit_id": "pit-1"}
+        client.client.search.side_effect = search
+        client_cls.return_value = client
+        openalex_matcher_cls.return_value.find_matches_batch.side_effect = (
+            lambda scielo_groups, max_candidates: [[] for _group in scielo_groups]
+        )
+        standardized = []
+
+        def standardize(input_doc):
+            standardized.append(input_doc)
+            return SilverDocument(
+                doc_id=input_doc["code"],
+                type="article",
+                publication_year=2024,
+                title=input_doc["title"],
+            )
+
+        standardizer_for.return_value.run.side_effect = standardize
+        pipeline = OpenSearchETLPipeline(opensearch_url="http://opensearch:9200")
+        pipeline._build_input_document = lambda raw_data, source="scielo": raw_data
+        pipeline._index_silver_documents = Mock(side_effect=lambda docs: len(docs))
+        pipeline._remove_openalex_only_placeholders = Mock(return_value=0)
+
+        result = pipeline.run(year_filter=2024)
+
+        self.assertEqual(result["total_input_docs"], 3)
+        self.assertEqual(result["total_groups_formed"], 2)
+        self.assertEqual(result["total_merged_docs"], 2)
+        self.assertEqual(result["total_indexed_docs"], 2)
+        self.assertEqual(
+            sorted(sorted(doc.doc_id for doc in call.args[0]) for call in pipeline._index_silver_documents.call_args_list),
+            [["S-A"], ["S-C"]],
+        )
+        self.assertEqual(pipeline._remove_openalex_only_placeholders.call_count, 2)
+        self.assertIn("start_memory_mb", result)
+        self.assertGreaterEqual(result["peak_memory_mb"], result["start_memory_mb"])
+        self.assertIn("title", search_bodies[0]["_source"])
+        self.assertIn("raw_data.title", search_bodies[0]["_source"])
+        self.assertNotIn("abstract", search_bodies[0]["_source"])
+        hydration_ids = [body["query"]["ids"]["values"] for body in search_bodies[1:]]
+        self.assertEqual(sorted(map(sorted, hydration_ids)), [["os-a", "os-b"], ["os-c"]])
+        self.assertEqual(sorted(doc["abstract"] for doc in standardized), ["A", "B", "C"])
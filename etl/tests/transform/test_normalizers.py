@@ -1,5 +1,6 @@
 from django.test import SimpleTestCase
 
+from etl.transform import normalizers
 from etl.transform.normalizers import (
     normalize_keywords,
     normalize_author_name,
@@ -146,3 +147,18 @@ class CountryNormalizerTests(SimpleTestCase):
     def test_normalize_country_code_rejects_unknown_values(self):
         self.assertIsNone(normalize_country_code("not-a-country"))
         self.assertIsNone(normalize_country_code(None))
+
+    def test_normalize_country_code_memoizes_fuzzy_lookups(self):
+        normalizers._fuzzy_country_code.cache_clear()
+
+        self.assertEqual(normalize_country_code("Brazil"), "BR")
+        self.assertEqual(normalize_country_code("Brazil"), "BR")
+
+        info = normalizers._fuzzy_country_code.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_lookup_tables_are_read_only(self):
+        with self.assertRaises(TypeError):
+            normalizers.COUNTRY_ALPHA_3_TO_ALPHA_2["XXX"] = "XX"
+        with self.assertRaises(TypeError):
+            normalizers.LANGUAGE_NAME_TO_ALPHA_2["klingon"] = "kl"
@@ -1,20 +1,77 @@
+import functools
 import re
 import unicodedata
+from types import MappingProxyType
 
 import pycountry
 from django.conf import settings
 
+_DOI_URL_PREFIX_RE = re.compile(r"^https?://(dx\.)?doi\.org/")
+_DOI_PREFIX_RE = re.compile(r"^doi:")
+_DOI_LANGUAGE_SUFFIX_RE = re.compile(r"([0-9\-])([a-z]{2})$")
+_DOI_RE = re.compile(r"^10\.\d{4,9}/\S+$")
+_OPENALEX_WORK_RE = re.compile(r"^(?:https?://openalex\.org/)?(W\d+)$", re.IGNORECASE)
+_ISBN_10_RE = re.compile(r"^\d{9}[\dX]$", re.IGNORECASE)
+_NON_ISSN_CHARS_RE = re.compile(r"[^\dX]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_LANGUAGE_SEPARATOR_RE = re.compile(r"[-_]")
+_COUNTRY_FUZZY_CACHE_SIZE = 4096
+
+
+def _language_tables():
+    alpha_2 = set()
+    alpha_3 = {}
+    bibliographic = {}
+    names = {}
+    for language in pycountry.languages:
+        code = getattr(language, "alpha_2", None)
+        if not code:
+            continue
+        alpha_2.add(code.lower())
+        alpha_3.setdefault(language.alpha_3.lower(), code)
+        if hasattr(language, "bibliographic"):
+            bibliographic.setdefault(language.bibliographic.lower(), code)
+        for attribute in ("name", "common_name"):
+            if hasattr(language, attribute):
+                names.setdefault(getattr(language, attribute).lower(), code)
+    return (
+        frozenset(alpha_2),
+        MappingProxyType(alpha_3),
+        MappingProxyType(bibliographic),
+        MappingProxyType(names),
+    )
+
+
+def _country_tables():
+    alpha_2 = {}
+    alpha_3 = {}
+    for country in pycountry.countries:
+        alpha_2[country.alpha_2.upper()] = country.alpha_2
+        alpha_3[country.alpha_3.upper()] = country.alpha_2
+    return MappingProxyType(alpha_2), MappingProxyType(alpha_3)
+
+
+# Built once at import from pycountry, in its iteration order so the first
+# language with a matching name wins as in the former linear scan.
+(
+    LANGUAGE_ALPHA_2_CODES,
+    LANGUAGE_ALPHA_3_TO_ALPHA_2,
+    LANGUAGE_BIBLIOGRAPHIC_TO_ALPHA_2,
+    LANGUAGE_NAME_TO_ALPHA_2,
+) = _language_tables()
+COUNTRY_ALPHA_2_CODES, COUNTRY_ALPHA_3_TO_ALPHA_2 = _country_tables()
+
 
 def normalize_doi(doi: str | None) -> str | None:
     if not doi:
         return None
 
     normalized = str(doi).strip().lower()
-    normalized = re.sub(r"^https?://(dx\.)?doi\.org/", "", normalized)
-    normalized = re.sub(r"^doi:", "", normalized)
-    normalized = re.sub(r"([0-9\-])([a-z]{2})$", r"\1", normalized)
+    normalized = _DOI_URL_PREFIX_RE.sub("", normalized)
+    normalized = _DOI_PREFIX_RE.sub("", normalized)
+    normalized = _DOI_LANGUAGE_SUFFIX_RE.sub(r"\1", normalized)
 
-    return normalized if re.match(r"^10\.\d{4,9}/\S+$", normalized) else None
+    return normalized if _DOI_RE.match(normalized) else None
 
 
 def normalize_openalex_id(openalex_id: str | None) -> str | None:
@@ -22,7 +79,7 @@ def normalize_openalex_id(openalex_id: str | None) -> str | None:
         return None
 
     normalized = str(openalex_id).strip()
-    match = re.match(r"^(?:https?://openalex\.org/)?(W\d+)$", normalized, re.IGNORECASE)
+    match = _OPENALEX_WORK_RE.match(normalized)
     if not match:
         return None
 
@@ -51,7 +108,7 @@ def normalize_isbn(isbn: str | None) -> str | None:
         return None
 
     normalized = str(isbn).strip().replace("-", "").replace(" ", "")
-    if len(normalized) == 10 and re.match(r"^\d{9}[\dX]$", normalized, re.IGNORECASE):
+    if len(normalized) == 10 and _ISBN_10_RE.match(normalized):
         return normalized.upper()
     if len(normalized) == 13 and normalized.isdigit():
         return normalized
@@ -63,7 +120,7 @@ def normalize_issn(issn: str | None) -> str | None:
     if not issn:
         return None
 
-    normalized = re.sub(r"[^\dX]", "", str(issn).upper())
+    normalized = _NON_ISSN_CHARS_RE.sub("", str(issn).upper())
     if len(normalized) == 8:
         return f"{normalized[:4]}-{normalized[4:]}"
     return None
@@ -82,7 +139,7 @@ def normalize_text(text: str | None, strip_accents=True) -> str | None:
             char for char in unicode_normalized_text if not unicodedata.combining(char)
         )
 
-    whitespace_normalized_text = re.sub(r"\s+", " ", unicode_normalized_text)
+    whitespace_normalized_text = _WHITESPACE_RE.sub(" ", unicode_normalized_text)
     return whitespace_normalized_text if whitespace_normalized_text else None
 
 
@@ -129,55 +186,29 @@ def normalize_language(language: str | None) -> str | None:
     language_value = str(language).strip()
 
     if "-" in language_value or "_" in language_value:
-        base_code = re.split(r"[-_]", language_value)[0]
+        base_code = _LANGUAGE_SEPARATOR_RE.split(language_value)[0]
         if normalized := normalize_language(base_code):
             return normalized
 
+    language_lower = language_value.lower()
     if len(language_value) == 2 and language_value.isalpha():
-        result = pycountry.languages.get(alpha_2=language_value.lower())
-        if result:
-            return result.alpha_2
+        if language_lower in LANGUAGE_ALPHA_2_CODES:
+            return language_lower
 
     if len(language_value) == 3 and language_value.isalpha():
-        result = pycountry.languages.get(alpha_3=language_value.lower())
-        if result and hasattr(result, "alpha_2"):
-            return result.alpha_2
-
-        result = pycountry.languages.get(bibliographic=language_value.lower())
-        if result and hasattr(result, "alpha_2"):
-            return result.alpha_2
-
-    language_lower = language_value.lower()
-    for language_item in pycountry.languages:
-        if hasattr(language_item, "name") and language_item.name.lower() == language_lower:
-            if hasattr(language_item, "alpha_2"):
-                return language_item.alpha_2
-        if (
-            hasattr(language_item, "common_name")
-            and language_item.common_name.lower() == language_lower
-        ):
-            if hasattr(language_item, "alpha_2"):
-                return language_item.alpha_2
-
-    return None
-
-
-def normalize_country_code(country: str | None) -> str | None:
-    if not country:
-        return None
+        code = LANGUAGE_ALPHA_3_TO_ALPHA_2.get(language_lower)
+        if code:
+            return code
 
-    country_value = str(country).strip()
+        code = LANGUAGE_BIBLIOGRAPHIC_TO_ALPHA_2.get(language_lower)
+        if code:
+            return code
 
-    if len(country_value) == 2 and country_value.isalpha():
-        result = pycountry.countries.get(alpha_2=country_value.upper())
-        if result:
-            return result.alpha_2
+    return LANGUAGE_NAME_TO_ALPHA_2.get(language_lower)
 
-    if len(country_value) == 3 and country_value.isalpha():
-        result = pycountry.countries.get(alpha_3=country_value.upper())
-        if result:
-            return result.alpha_2
 
+@functools.lru_cache(maxsize=_COUNTRY_FUZZY_CACHE_SIZE)
+def _fuzzy_country_code(country_value: str) -> str | None:
     try:
         result = pycountry.countries.search_fuzzy(country_value)
         if result:
@@ -193,3 +224,22 @@ def normalize_country_code(country: str | None) -> str | None:
         pass
 
     return None
+
+
+def normalize_country_code(country: str | None) -> str | None:
+    if not country:
+        return None
+
+    country_value = str(country).strip()
+
+    if len(country_value) == 2 and country_value.isalpha():
+        code = COUNTRY_ALPHA_2_CODES.get(country_value.upper())
+        if code:
+            return code
+
+    if len(country_value) == 3 and country_value.isalpha():
+        code = COUNTRY_ALPHA_3_TO_ALPHA_2.get(country_value.upper())
+        if code:
+            return code
+
+    return _fuzzy_country_code(country_value)
@@ -4,12 +4,14 @@ Utiliza scripts Painless configurados via interface.
 """
 import json
 import logging
+import time
 
+from django.conf import settings
 from django.db.models import Exists, OuterRef
 from django.utils import timezone
 
 from etl.models import EtlItemProcess, EtlPipelineConfig
-from etl.services import enqueue_etl_item
+from etl.services import enqueue_etl_item, enqueue_etl_items
 from search_gateway.client import get_opensearch_client
 
 from .models import TransformationScript, HarvestStatus, IndexStatus
@@ -79,6 +81,7 @@ def _build_reindex_body(
     transform_script,
     query_script=None,
     identifier=None,
+    identifiers=None,
 ):
     body = {
         "source": {"index": source_index},
@@ -86,6 +89,21 @@ def _build_reindex_body(
         "script": {"lang": "painless", "source": transform_script},
     }
 
+    if identifiers:
+        if query_script:
+            body["source"]["query"] = {
+                "bool": {
+                    "should": [
+                        _parse_query_script(query_script=query_script, identifier=value)
+                        for value in identifiers
+                    ],
+                    "minimum_should_match": 1,
+                }
+            }
+        else:
+            body["source"]["query"] = {"ids": {"values": list(identifiers)}}
+        return body
+
     if identifier:
         if query_script:
             body["source"]["query"] = _parse_query_script(
@@ -173,29 +191,147 @@ def transform_document(script, identifier=None):
     return result
 
 
+def transform_documents(script, identifiers):
+    """
+    Transforma um lote de documentos com um único _reindex.
+
+    Args:
+        script: Instância do TransformationScript
+        identifiers: IDs dos documentos a transformar
+
+    Returns:
+        Dict com status e mensagem da operação
+    """
+    identifiers = list(dict.fromkeys(value for value in identifiers if value))
+    if not identifiers:
+        return {"status": "skip", "message": "Nenhum documento para transformar."}
+
+    missing = _ensure_indices_exist(script.source_index, script.dest_index)
+    if missing:
+        return missing
+
+    try:
+        body = _build_reindex_body(
+            source_index=script.source_index,
+            dest_index=script.dest_index,
+            transform_script=script.transform_script,
+            query_script=getattr(script, "query_script", None),
+            identifiers=identifiers,
+        )
+    except Exception as exc:
+        return {"status": "error", "message": f"Query JSON inválida: {exc}"}
+
+    result = _run_reindex(
+        body=body,
+        log_prefix=(
+            f"Transformando {len(identifiers)} documentos de {script.source_index} para {script.dest_index}"
+        ),
+        error_context=f"lote de {len(identifiers)} documentos",
+    )
+    if result.get("status") == "success":
+        _enqueue_transformed_bronze_batch(script.dest_index, identifiers)
+        result["message"] = f"{len(identifiers)} documentos transformados: {result.get('message', '')}"
+    return result
+
+
+def _enqueue_transformed_bronze_batch(index_name, identifiers):
+    try:
+        response = client.mget(index=index_name, body={"ids": identifiers})
+    except Exception as exc:
+        logger.warning(
+            "Falha ao enfileirar ETL silver para %s (%s documentos): %s",
+            index_name,
+            len(identifiers),
+            exc,
+        )
+        return
+
+    indexed_at = timezone.now().isoformat()
+    configs = list(EtlPipelineConfig.objects.enabled())
+    documents = []
+    actions = []
+    for doc in response.get("docs", []):
+        if not doc.get("found"):
+            continue
+        identifier = doc.get("_id")
+        source = doc.get("_source") or {}
+        try:
+            if not EtlPipelineConfig.objects.select_for_source(index_name, source, configs=configs):
+                continue
+        except Exception as exc:
+            logger.warning(
+                "Falha ao enfileirar ETL silver para %s/%s: %s",
+                index_name,
+                identifier,
+                exc,
+            )
+            continue
+        actions.append({"update": {"_index": index_name, "_id": identifier}})
+        actions.append(
+            {
+                "doc": {
+                    "oca_indexed_at": indexed_at,
+                    "oca_source_hash": source_hash(source),
+                }
+            }
+        )
+        documents.append((identifier, source))
+
+    if not documents:
+        return
+
+    try:
+        # enqueue_etl_items já ignora documentos com o mesmo hash do item ETL;
+        # o hash só é gravado no bronze depois do enfileiramento.
+        enqueue_etl_items(source_index=index_name, documents=documents)
+        response = client.bulk(body=actions, refresh=False)
+    except Exception as exc:
+        logger.warning(
+            "Falha ao enfileirar ETL silver para %s (%s documentos): %s",
+            index_name,
+            len(documents),
+            exc,
+        )
+        return
+
+    if not response.get("errors"):
+        return
+    failed = [
+        (item.get("update") or {})
+        for item in response.get("items", [])
+        if (item.get("update") or {}).get("status", 200) >= 400
+    ]
+    if failed:
+        logger.warning(
+            "Falha ao gravar oca_source_hash em %s documentos de %s: %s",
+            len(failed),
+            index_name,
+            "; ".join(f"{item.get('_id')}: {item.get('error')}" for item in failed[:5]),
+        )
+
+
 def _enqueue_transformed_bronze(index_name, identifier):
     try:
         response = client.get(index=index_name, id=identifier)
         source = response.get("_source") or {}
         if not EtlPipelineConfig.objects.select_for_source(index_name, source):
             return
-        payload_hash = source_hash(source)
+        enqueue_etl_item(
+            source_index=index_name,
+            external_id=identifier,
+            source_payload=source,
+        )
         client.update(
             index=index_name,
             id=identifier,
             body={
                 "doc": {
                     "oca_indexed_at": timezone.now().isoformat(),
-                    "oca_source_hash": payload_hash,
+                    "oca_source_hash": source_hash(source),
                 }
             },
             refresh=False,
         )
-        enqueue_etl_item(
-            source_index=index_name,
-            external_id=identifier,
-            source_payload=source,
-        )
     except Exception as exc:
         logger.warning(
             "Falha ao enfileirar ETL silver para %s/%s: %s",
@@ -217,16 +353,8 @@ def transform_after_indexing(instance, model_name):
     Returns:
         Dict com status e mensagem da operação
     """
-    harvest_model_key = model_name
-    if model_name == "HarvestedSciELOData":
-        type_data = getattr(instance, "type_data", None)
-        if type_data:
-            harvest_model_key = f"{model_name}_{type_data}"
-
-    script = TransformationScript.objects.filter(
-        harvest_model=harvest_model_key,
-        is_active=True
-    ).first()
+    harvest_model_key = _harvest_model_key(instance, model_name)
+    script = _active_transformation_script(harvest_model_key)
 
     if not script:
         logger.info(
@@ -242,6 +370,83 @@ def transform_after_indexing(instance, model_name):
     return transform_document(script, instance.identifier)
 
 
+def _harvest_model_key(instance, model_name):
+    if model_name == "HarvestedSciELOData":
+        type_data = getattr(instance, "type_data", None)
+        if type_data:
+            return f"{model_name}_{type_data}"
+    return model_name
+
+
+def _active_transformation_script(harvest_model_key):
+    return TransformationScript.objects.filter(
+        harvest_model=harvest_model_key,
+        is_active=True
+    ).first()
+
+
+class BronzeTransformBatch:
+    """
+    Acumula identificadores por script de transformação e executa um único
+    _reindex por lote, quando o lote enche ou a janela de tempo expira.
+    Usar como context manager garante o envio do que restar no final.
+    """
+
+    def __init__(self, batch_size=None, window_seconds=None):
+        self.batch_size = batch_size or getattr(
+            settings, "HARVEST_BRONZE_TRANSFORM_BATCH_SIZE", 500
+        )
+        self.window_seconds = (
+            window_seconds
+            if window_seconds is not None
+            else getattr(settings, "HARVEST_BRONZE_TRANSFORM_WINDOW_SECONDS", 60)
+        )
+        self.results = []
+        self._scripts = {}
+        self._pending = {}
+        self._window_started = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+        return False
+
+    def add(self, instance, model_name):
+        identifier = getattr(instance, "identifier", None)
+        if not identifier:
+            return
+
+        harvest_model_key = _harvest_model_key(instance, model_name)
+        if harvest_model_key not in self._scripts:
+            self._scripts[harvest_model_key] = _active_transformation_script(harvest_model_key)
+        script = self._scripts[harvest_model_key]
+        if not script:
+            return
+
+        script, identifiers = self._pending.setdefault(script.pk, (script, []))
+        identifiers.append(identifier)
+        if self._window_started is None:
+            self._window_started = time.monotonic()
+
+        if len(identifiers) >= self.batch_size:
+            self._flush_script(script.pk)
+        elif time.monotonic() - self._window_started >= self.window_seconds:
+            self.flush()
+
+    def flush(self):
+        for script_pk in list(self._pending):
+            self._flush_script(script_pk)
+        self._window_started = None
+
+    def _flush_script(self, script_pk):
+        script, identifiers = self._pending.pop(script_pk)
+        self.results.append(transform_documents(script, identifiers))
+        if not self._pending:
+            self._window_started = None
+
+
 def reconcile_missing_bronze_etl(document_model):
     model_name = document_model.__name__
 
@@ -268,9 +473,10 @@ def reconcile_missing_bronze_etl(document_model):
     missing_qs = indexed_qs.filter(~Exists(has_etl))
     
     logger.info("Reconciliação. Fase 2. %s: %d sem ETL", model_name, missing_qs.count())
-    for obj in missing_qs.iterator():
-        try:
-            transform_after_indexing(instance=obj, model_name=model_name)
-        except Exception as exc:
-            logger.warning("Reconcialiação. Fase 2. Falha ao criar ETL para documento do tipo %s (%s): %s",
-                            model_name, obj.identifier, exc)
+    with BronzeTransformBatch() as batch:
+        for obj in missing_qs.iterator():
+            try:
+                batch.add(obj, model_name)
+            except Exception as exc:
+                logger.warning("Reconcialiação. Fase 2. Falha ao criar ETL para documento do tipo %s (%s): %s",
+                                model_name, obj.identifier, exc)
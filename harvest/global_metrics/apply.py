@@ -2,11 +2,13 @@ import logging
 from pathlib import Path
 
 from django.conf import settings
+from opensearchpy.helpers import streaming_bulk
 
+from harvest.global_metrics.join import GlobalMetricsHashIndex, canonical_issn
 from harvest.global_metrics.opensearch import (
-    find_global_metric_group_for_silver_group,
-    iter_silver_issn_year_groups,
-    update_silver_group_by_query,
+    build_silver_metrics_update_action,
+    iter_global_metric_rows,
+    iter_silver_metric_targets,
 )
 from harvest.models import GlobalMetricsUploadFile
 from search_gateway.client import get_opensearch_client
@@ -17,6 +19,11 @@ def apply_global_metrics_upload_to_silver(
     harvest_index=None,
     silver_index=None
 ):
+    """
+    Aplica as métricas de um upload no silver com um hash join: as linhas do
+    upload são lidas uma vez e indexadas por (ano, ISSN), o silver é lido uma
+    vez e as alterações seguem em atualizações parciais via _bulk.
+    """
 
     upload_file = GlobalMetricsUploadFile.objects.get(pk=upload_file_id)
     client = get_opensearch_client()
@@ -29,6 +36,8 @@ def apply_global_metrics_upload_to_silver(
         "ETL_SILVER_INDEX_PATTERN",
         "silver_scientific_production",
     )
+    chunk_size = getattr(settings, "GLOBAL_METRICS_APPLY_BULK_CHUNK_SIZE", 500)
+    progress_every = getattr(settings, "GLOBAL_METRICS_APPLY_PROGRESS_EVERY", 50000)
     source_file = Path(upload_file.file.name).name
 
     stats = {
@@ -44,42 +53,72 @@ def apply_global_metrics_upload_to_silver(
         "unresolved_countries": [],
         "errors": [],
     }
+
+    metrics_index = GlobalMetricsHashIndex()
+    for row in iter_global_metric_rows(client, harvest_index, source_file):
+        metrics_index.add_row(row)
+    stats["harvest_lookups"] = 1
+    logging.info(
+        f"Upload {upload_file.pk}: {metrics_index.metric_rows} linhas de métricas "
+        f"em {len(metrics_index.groups)} grupos (ano, ISSN)."
+    )
+
+    if not metrics_index.groups:
+        return stats
+
+    silver_keys = set()
+    matched_keys = set()
+    matched_row_ids = set()
     unresolved_countries = set()
 
+    def iter_update_actions():
+        for hit, year, issns in iter_silver_metric_targets(client, silver_index):
+            matches = metrics_index.match(year, issns)
+            silver_keys.update((year, canonical_issn(issn)) for issn in issns)
+            if not matches:
+                continue
 
-    silver_groups = list(
-        iter_silver_issn_year_groups(
-            client=client,
-            silver_index=silver_index,
-        )
-    )
+            stats["matches_found"] += 1
+            indexed_in = set()
+            country_codes = []
+            for key, group in matches:
+                matched_keys.add(key)
+                matched_row_ids.update(group["row_ids"])
+                unresolved_countries.update(group["unresolved_countries"])
+                indexed_in.update(group["indexed_in"])
+                for country_code in group["country_codes"]:
+                    if country_code not in country_codes:
+                        country_codes.append(country_code)
 
-    for silver_group in silver_groups:
-        stats["silver_groups_seen"] += 1
-        stats["harvest_lookups"] += 1
-        group = find_global_metric_group_for_silver_group(
-            client=client,
-            harvest_index=harvest_index,
-            source_file=source_file,
-            silver_group=silver_group,
-        )
-        if group is None:
-            continue
+            if stats["matches_found"] % progress_every == 0:
+                logging.info(
+                    f"Upload {upload_file.pk}: {stats['matches_found']} documentos do silver "
+                    f"casados, {stats['updated']} atualizados."
+                )
 
-        stats["metric_rows"] += group.pop("metric_rows", 0)
-        stats["groups_processed"] += 1
-        unresolved_countries.update(group.pop("unresolved_countries", []))
-        response = update_silver_group_by_query(
-            client=client,
-            silver_index=silver_index,
-            group=group,
-        )
-        stats["matches_found"] += response.get("total", 0)
-        stats["updated"] += response.get("updated", 0)
-        stats["version_conflicts"] += response.get("version_conflicts", 0)
-        if failures := response.get("failures"):
-            stats["errors"].extend(failures)
+            action = build_silver_metrics_update_action(hit, indexed_in, country_codes)
+            if action is not None:
+                yield action
+
+    for ok, result in streaming_bulk(
+        client=client,
+        actions=iter_update_actions(),
+        chunk_size=chunk_size,
+        raise_on_error=False,
+        raise_on_exception=False,
+    ):
+        if ok:
+            stats["updated"] += 1
+            continue
+        item = result.get("update") or {}
+        if item.get("status") == 409:
+            stats["version_conflicts"] += 1
+        else:
+            stats["errors"].append(item.get("error") or item or result)
 
+    stats["metric_rows"] = len(matched_row_ids)
+    stats["silver_groups_seen"] = len({key for key in silver_keys if key[1]})
+    stats["groups_processed"] = len(matched_keys)
     stats["unresolved_countries"] = sorted(unresolved_countries)
     logging.info(
         f"Métricas globais do upload {upload_file.pk} aplicadas em {silver_index}: "
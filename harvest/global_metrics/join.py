@@ -0,0 +1,58 @@
+from etl.transform.normalizers import normalize_issn
+from harvest.global_metrics.parsing import append_unique
+from search_gateway.option_normalization import clean_text
+
+
+def canonical_issn(value):
+    return normalize_issn(value) or clean_text(value)
+
+
+class GlobalMetricsHashIndex:
+    """
+    Linhas de métricas de um upload agrupadas por (ano, ISSN canônico).
+
+    Cada linha entra no grupo de cada um dos seus ISSNs, reproduzindo a
+    sobreposição de ISSNs usada na consulta por grupo do silver.
+    """
+
+    def __init__(self):
+        self.groups = {}
+        self.metric_rows = 0
+
+    def add_row(self, row):
+        row_id = self.metric_rows
+        self.metric_rows += 1
+        for issn in row["issns"]:
+            issn_key = canonical_issn(issn)
+            if not issn_key:
+                continue
+            group = self.groups.setdefault(
+                (row["year"], issn_key),
+                {
+                    "row_ids": set(),
+                    "indexed_in": set(),
+                    "country_codes": [],
+                    "unresolved_countries": [],
+                },
+            )
+            if row_id in group["row_ids"]:
+                continue
+            group["row_ids"].add(row_id)
+            group["indexed_in"].update(row["indexed_in"])
+            append_unique(group["country_codes"], row.get("country_code"))
+            if row.get("country") and not row.get("country_code"):
+                append_unique(group["unresolved_countries"], row["country"])
+
+    def match(self, year, issns):
+        """Chaves e grupos do índice que casam com um documento silver."""
+        matches = []
+        seen = set()
+        for issn in issns:
+            key = (year, canonical_issn(issn))
+            if not key[1] or key in seen:
+                continue
+            seen.add(key)
+            group = self.groups.get(key)
+            if group is not None:
+                matches.append((key, group))
+        return matches
@@ -1,15 +1,23 @@
-from etl.transform.normalizers import normalize_issn
 from harvest.global_metrics.parsing import (
-    append_unique,
     coerce_int,
     global_metric_row_from_hit,
     issn_terms,
-    issns_overlap,
 )
-from search_gateway.option_normalization import clean_text
+from search_gateway.pagination import iter_pit_hits
 
 
-def iter_silver_issn_year_groups(client, silver_index):
+def iter_global_metric_rows(client, harvest_index, source_file):
+    body = {
+        "query": {"bool": {"filter": [source_file_query(source_file)]}},
+        "size": 1000,
+    }
+    for hit in iter_pit_hits(client, harvest_index, body, keep_alive="20m"):
+        row = global_metric_row_from_hit(hit)
+        if row:
+            yield row
+
+
+def iter_silver_metric_targets(client, silver_index):
     body = {
         "query": {
             "bool": {
@@ -19,113 +27,68 @@ def iter_silver_issn_year_groups(client, silver_index):
                 ]
             }
         },
-        "_source": ["publication_year", "source.issns"],
+        "_source": [
+            "publication_year",
+            "source.issns",
+            "oca_data.scielo.source.indexed_in",
+            "oca_data.scielo.source.country_code",
+        ],
+        "seq_no_primary_term": True,
         "size": 5000,
     }
-    processed = set()
-    for hit in scroll_hits(client, silver_index, body):
+    for hit in iter_pit_hits(client, silver_index, body, keep_alive="20m"):
         source = hit.get("_source") or {}
         year = coerce_int(source.get("publication_year"))
         source_data = source.get("source") if isinstance(source.get("source"), dict) else {}
         issns = issn_terms(source_data.get("issns"))
         if year is None or not issns:
             continue
-
-        for issn in issns:
-            canonical_issn = normalize_issn(issn) or clean_text(issn)
-            if not canonical_issn:
-                continue
-            key = (year, canonical_issn)
-            if key in processed:
-                continue
-            processed.add(key)
-            group_issns = []
-            append_unique(group_issns, issn)
-            append_unique(group_issns, canonical_issn)
-            yield {
-                "year": year,
-                "issns": group_issns,
-            }
+        yield hit, year, issns
 
 
-def find_global_metric_group_for_silver_group(
-    client,
-    harvest_index,
-    source_file,
-    silver_group,
-):
-    group = {
-        "year": silver_group["year"],
-        "issns": silver_group["issns"],
-        "indexed_in": set(),
-        "country_codes": [],
-        "countries": [],
-        "metric_rows": 0,
-        "unresolved_countries": [],
-    }
-    lookup_body = build_harvest_metric_lookup_body(
-        source_file=source_file,
-        year=silver_group["year"],
-        issns=silver_group["issns"],
-    )
-    for hit in scroll_hits(client, harvest_index, lookup_body):
-        row = global_metric_row_from_hit(hit)
-        if not row or row["year"] != silver_group["year"]:
-            continue
-        if not issns_overlap(row["issns"], silver_group["issns"]):
-            continue
+def current_scielo_source(hit):
+    oca_data = (hit.get("_source") or {}).get("oca_data")
+    scielo = oca_data.get("scielo") if isinstance(oca_data, dict) else None
+    source = scielo.get("source") if isinstance(scielo, dict) else None
+    return source if isinstance(source, dict) else {}
 
-        group["metric_rows"] += 1
-        group["indexed_in"].update(row["indexed_in"])
-        append_unique(group["country_codes"], row.get("country_code"))
-        append_unique(group["countries"], row.get("country"))
-        if row.get("country") and not row.get("country_code"):
-            append_unique(group["unresolved_countries"], row["country"])
 
-    if not group["indexed_in"] and not group["country_codes"]:
+def build_silver_metrics_update_action(hit, indexed_in, country_codes):
+    """
+    Atualização parcial que acrescenta os valores de indexed_in que faltam e
+    usa o primeiro country_code. As alterações são calculadas a partir do
+    snapshot do PIT, por isso a ação leva if_seq_no/if_primary_term: se o
+    documento mudou desde a leitura, o _bulk responde 409 em vez de gravar
+    dados antigos. Retorna None quando o documento já está atualizado.
+    """
+    current = current_scielo_source(hit)
+    current_indexed_in = current.get("indexed_in")
+    if current_indexed_in is None:
+        merged = []
+    elif isinstance(current_indexed_in, list):
+        merged = list(current_indexed_in)
+    else:
+        merged = [current_indexed_in]
+
+    changes = {}
+    missing = [value for value in sorted(indexed_in) if value not in merged]
+    if missing or (indexed_in and not isinstance(current_indexed_in, list)):
+        changes["indexed_in"] = merged + missing
+    if country_codes and current.get("country_code") != country_codes[0]:
+        changes["country_code"] = country_codes[0]
+    if not changes:
         return None
-    return group
-
 
-def build_harvest_metric_lookup_body(source_file, year, issns):
-    issn_should = []
-    for issn in issns:
-        issn_should.extend(
-            [
-                {"term": {"raw_data.issns.keyword": issn}},
-                {"term": {"raw_data.issns": issn}},
-                {"match_phrase": {"raw_data.issns": issn}},
-            ]
-        )
-
-    return {
-        "query": {
-            "bool": {
-                "filter": [
-                    source_file_query(source_file),
-                    {
-                        "bool": {
-                            "should": [
-                                {"term": {"raw_data.year": year}},
-                                {"term": {"raw_data.year.keyword": str(year)}},
-                                {"match_phrase": {"raw_data.year": str(year)}},
-                            ],
-                            "minimum_should_match": 1,
-                        }
-                    },
-                ],
-                "must": [
-                    {
-                        "bool": {
-                            "should": issn_should,
-                            "minimum_should_match": 1,
-                        }
-                    }
-                ],
-            }
-        },
-        "size": 1000,
+    action = {
+        "_op_type": "update",
+        "_index": hit["_index"],
+        "_id": hit["_id"],
+        "doc": {"oca_data": {"scielo": {"source": changes}}},
     }
+    if hit.get("_seq_no") is not None and hit.get("_primary_term") is not None:
+        action["if_seq_no"] = hit["_seq_no"]
+        action["if_primary_term"] = hit["_primary_term"]
+    return action
 
 
 def source_file_query(source_file):
@@ -139,81 +102,3 @@ def source_file_query(source_file):
             "minimum_should_match": 1,
         }
     }
-
-
-def global_metrics_update_script():
-    return """
-        if (ctx._source.oca_data == null) {
-            ctx._source.oca_data = new HashMap();
-        }
-        if (ctx._source.oca_data.scielo == null) {
-            ctx._source.oca_data.scielo = new HashMap();
-        }
-        if (ctx._source.oca_data.scielo.source == null) {
-            ctx._source.oca_data.scielo.source = new HashMap();
-        }
-        if (params.indexed_in != null && params.indexed_in.size() > 0) {
-            def current = ctx._source.oca_data.scielo.source.indexed_in;
-            if (current == null) {
-                ctx._source.oca_data.scielo.source.indexed_in = new ArrayList();
-            } else if (!(current instanceof List)) {
-                def values = new ArrayList();
-                values.add(current);
-                ctx._source.oca_data.scielo.source.indexed_in = values;
-            }
-            for (def value : params.indexed_in) {
-                if (!ctx._source.oca_data.scielo.source.indexed_in.contains(value)) {
-                    ctx._source.oca_data.scielo.source.indexed_in.add(value);
-                }
-            }
-        }
-        if (params.country_codes != null && params.country_codes.size() > 0) {
-            ctx._source.oca_data.scielo.source.country_code = params.country_codes.get(0);
-        }
-    """
-
-
-def build_global_metrics_update_by_query_body(group):
-    return {
-        "query": {
-            "bool": {
-                "filter": [
-                    {"term": {"publication_year": group["year"]}},
-                    {"terms": {"source.issns": group["issns"]}},
-                ]
-            }
-        },
-        "script": {
-            "lang": "painless",
-            "source": global_metrics_update_script(),
-            "params": {
-                "indexed_in": sorted(group["indexed_in"]),
-                "country_codes": group["country_codes"],
-            },
-        },
-    }
-
-
-def update_silver_group_by_query(client, silver_index, group):
-    return client.update_by_query(
-        index=silver_index,
-        body=build_global_metrics_update_by_query_body(group),
-        conflicts="proceed",
-        refresh=False,
-    )
-
-
-def scroll_hits(client, index, body, scroll="20m"):
-    response = client.search(index=index, body=body, scroll=scroll)
-    scroll_id = response.get("_scroll_id")
-    try:
-        while True:
-            hits = response.get("hits", {}).get("hits", [])
-            if not hits:
-                break
-            yield from hits
-            response = client.scroll(scroll_id=scroll_id, scroll=scroll)
-            scroll_id = response.get("_scroll_id")
-    finally:
-        if scroll_id:
-            client.clear_scroll(scroll_id=scroll_id)
@@ -1,14 +1,24 @@
+import json
 import logging
+from collections import OrderedDict
 from urllib.parse import urlencode
 
 from django.conf import settings
+from django.db import transaction
 from django.db.models import Max
 from django.utils import timezone
 
 from core.utils.utils import fetch_data
+from harvest.bronze_transform import BronzeTransformBatch
 from harvest.exception_logs import ExceptionContext
-from harvest.indexing import delete_harvested_document
-from harvest.models import HarvestedBooks, HarvestErrorLogBooks
+from harvest.indexing import (
+    bulk_index_harvested_instances,
+    delete_harvested_document,
+    new_index_stats,
+)
+from harvest.models import HarvestedBooks, HarvestErrorLogBooks, HarvestStatus
+
+BOOK_FIELDS = ["source_url", "type_data", "parent", "last_seq", "raw_data"]
 
 
 def _build_url(base_url, params=None):
@@ -57,10 +67,44 @@ def fetch_doc(base_url, db_name, doc_id, headers, user):
         return None, None
 
 
-def fetch_changes_page(base_url, db_name, since, limit, headers):
+def fetch_docs(base_url, db_name, doc_ids, headers, user):
+    """
+    Busca vários documentos com uma única requisição a _all_docs. Se a
+    requisição falhar, busca cada documento com fetch_doc, que registra o erro.
+    Retorna {identifier: (payload, url)} dos documentos encontrados.
+    """
+    doc_ids = sorted(set(doc_ids))
+    if not doc_ids:
+        return {}
+    url = _build_url(
+        f"{base_url}/{db_name}/_all_docs",
+        {"include_docs": "true", "keys": json.dumps(doc_ids)},
+    )
+    try:
+        payload = fetch_data(url, headers=headers, json=True, timeout=60, verify=False)
+    except Exception as exc:
+        logging.warning("Falha no _all_docs de books, buscando um a um: %s", exc)
+        docs = {}
+        for doc_id in doc_ids:
+            doc, doc_url = fetch_doc(base_url, db_name, doc_id, headers, user)
+            if doc:
+                docs[doc_id] = (doc, doc_url)
+        return docs
+
+    rows = payload.get("rows") if isinstance(payload, dict) else None
+    return {
+        row["id"]: (row["doc"], f"{base_url}/{db_name}/{row['id']}")
+        for row in rows or []
+        if isinstance(row, dict) and isinstance(row.get("doc"), dict)
+    }
+
+
+def fetch_changes_page(base_url, db_name, since, limit, headers, include_docs=False):
     params = {"since": since}
     if limit is not None:
         params["limit"] = limit
+    if include_docs:
+        params["include_docs"] = "true"
     url = _build_url(
         f"{base_url}/{db_name}/_changes",
         params,
@@ -79,11 +123,13 @@ def _extract_last_seq(payload):
     """Último seq da página: last_seq/seq no JSON ou seq do último item de results."""
     if not isinstance(payload, dict):
         return None
+    if payload.get("last_seq") is not None:
+        return payload.get("last_seq")
     results = payload.get("results")
     if isinstance(results, list) and results:
         last = results[-1]
         if isinstance(last, dict):
-            return last.get("last_seq")
+            return last.get("last_seq", last.get("seq"))
     return None
 
 
@@ -205,6 +251,22 @@ def iter_changes(
     since=None,
     limit=100,
     headers=None,
+):
+    for changes in iter_changes_pages(
+        db_name=db_name,
+        since=since,
+        limit=limit,
+        headers=headers,
+    ):
+        yield from changes
+
+
+def iter_changes_pages(
+    db_name="scielobooks_1a",
+    since=None,
+    limit=100,
+    headers=None,
+    include_docs=False,
 ):
     base_url = _base_url()
     if not base_url:
@@ -221,13 +283,13 @@ def iter_changes(
             limit=limit,
             since=since,
             headers=headers,
+            include_docs=include_docs,
         )
         changes = _extract_changes(payload)
         if not changes:
             break
 
-        for change in changes:
-            yield change
+        yield changes
 
         last_seq = _extract_last_seq(payload)
         if last_seq is None or last_seq == since:
@@ -241,7 +303,17 @@ def harvest_books(
     limit=100,
     since=None,
     headers=None,
+    batch=True,
 ):
+    if batch:
+        return harvest_books_in_batches(
+            user=user,
+            db_name=db_name,
+            limit=limit,
+            since=since,
+            headers=headers,
+        )
+
     for change in iter_changes(
         db_name=db_name,
         since=since,
@@ -315,3 +387,244 @@ def harvest_single_book(
         parent=parent,
         last_seq=last_seq,
     )
+
+
+class MonographCache:
+    """
+    LRU de monographs já resolvidos durante uma coleta, evitando consultar
+    banco e CouchDB de novo para capítulos do mesmo livro.
+    """
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize or getattr(settings, "HARVEST_BOOKS_MONOGRAPH_CACHE_SIZE", 1024)
+        self._entries = OrderedDict()
+
+    def __contains__(self, identifier):
+        return identifier in self._entries
+
+    def get(self, identifier):
+        monograph = self._entries.get(identifier)
+        if monograph is not None:
+            self._entries.move_to_end(identifier)
+        return monograph
+
+    def set(self, identifier, monograph):
+        self._entries[identifier] = monograph
+        self._entries.move_to_end(identifier)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def _bulk_persist_harvested_books(user, records):
+    """
+    Grava os registros de uma página com bulk_create/bulk_update. Se a
+    gravação em lote falhar, cada registro passa por _persist_harvested_books,
+    que registra o erro por livro. Retorna as instâncias gravadas em lote.
+    """
+    if not records:
+        return []
+
+    now = timezone.now()
+    existing = {
+        obj.identifier: obj
+        for obj in HarvestedBooks.objects.filter(
+            identifier__in=[record["identifier"] for record in records]
+        )
+    }
+    to_create = []
+    to_update = []
+    for record in records:
+        obj = existing.get(record["identifier"])
+        if obj is None:
+            obj = HarvestedBooks(identifier=record["identifier"], creator=user)
+            to_create.append(obj)
+        else:
+            to_update.append(obj)
+        for field in BOOK_FIELDS:
+            setattr(obj, field, record[field])
+        obj.harvest_status = HarvestStatus.SUCCESS
+        obj.last_harvest_attempt = now
+        obj.updated = now
+
+    try:
+        with transaction.atomic():
+            HarvestedBooks.objects.bulk_create(to_create)
+            HarvestedBooks.objects.bulk_update(
+                to_update,
+                BOOK_FIELDS + ["harvest_status", "last_harvest_attempt", "updated"],
+            )
+    except Exception as exc:
+        logging.warning("Falha na gravação em lote de books, gravando um a um: %s", exc)
+        for record in records:
+            _persist_harvested_books(user=user, **record)
+        return []
+    return to_create + to_update
+
+
+def _book_record(identifier, source_url, raw_data, parent=None, last_seq=None):
+    return {
+        "identifier": identifier,
+        "source_url": source_url,
+        "raw_data": raw_data,
+        "type_data": raw_data.get("TYPE"),
+        "parent": parent,
+        "last_seq": last_seq,
+    }
+
+
+def _resolve_monograph_parents(base_url, db_name, identifiers, headers, user, monographs):
+    """
+    Resolve os monographs de uma página: cache da coleta, banco e, para os
+    que faltarem, uma requisição _all_docs. Os buscados no CouchDB são
+    gravados como em _resolve_monograph_parent.
+
+    Retorna os monographs por identificador e as instâncias gravadas em lote,
+    que não passam pelos sinais e precisam ser indexadas pelo chamador.
+    """
+    persisted = []
+    missing = {identifier for identifier in identifiers if identifier not in monographs}
+    if missing:
+        for parent in HarvestedBooks.objects.filter(identifier__in=missing):
+            monographs.set(parent.identifier, parent)
+            missing.discard(parent.identifier)
+    if missing:
+        fetched = fetch_docs(base_url, db_name, missing, headers, user)
+        records = [
+            _book_record(payload.get("_id"), url, _sanitize_raw_data(payload))
+            for payload, url in fetched.values()
+        ]
+        persisted = _bulk_persist_harvested_books(user, records)
+        parents = persisted
+        if len(persisted) < len(records):
+            parents = HarvestedBooks.objects.filter(
+                identifier__in=[record["identifier"] for record in records]
+            )
+        for parent in parents:
+            monographs.set(parent.identifier, parent)
+    return {identifier: monographs.get(identifier) for identifier in identifiers}, persisted
+
+
+def harvest_books_page(base_url, db_name, changes, headers, user, monographs, stats):
+    """
+    Coleta uma página do _changes obtida com include_docs. Livros sem
+    capítulo pai são gravados antes dos capítulos ("Part"), que recebem os
+    dados do monograph resolvido. Retorna as instâncias gravadas em lote.
+    """
+    docs = {}
+    for change in changes:
+        doc_id = change.get("id")
+        if not doc_id:
+            continue
+        if change.get("deleted"):
+            docs.pop(doc_id, None)
+            _delete_book_record(identifier=doc_id)
+            stats["deleted"] += 1
+            continue
+
+        payload = change.get("doc")
+        doc_url = f"{base_url}/{db_name}/{doc_id}"
+        if not isinstance(payload, dict) or not payload.get("_id"):
+            payload, doc_url = fetch_doc(
+                base_url=base_url,
+                db_name=db_name,
+                doc_id=doc_id,
+                headers=headers,
+                user=user,
+            )
+            if not payload:
+                stats["failed"] += 1
+                continue
+        docs[payload["_id"]] = (_sanitize_raw_data(payload), doc_url, change.get("seq"))
+
+    books = [
+        _book_record(identifier, doc_url, payload, last_seq=last_seq)
+        for identifier, (payload, doc_url, last_seq) in docs.items()
+        if payload.get("TYPE") != "Part"
+    ]
+    persisted = _bulk_persist_harvested_books(user, books)
+    for book in persisted:
+        monographs.set(book.identifier, book)
+
+    parts = [
+        (identifier, payload, doc_url, last_seq)
+        for identifier, (payload, doc_url, last_seq) in docs.items()
+        if payload.get("TYPE") == "Part"
+    ]
+    parents, fetched_parents = _resolve_monograph_parents(
+        base_url=base_url,
+        db_name=db_name,
+        identifiers={payload["monograph"] for _id, payload, _url, _seq in parts if payload.get("monograph")},
+        headers=headers,
+        user=user,
+        monographs=monographs,
+    )
+
+    part_records = []
+    for identifier, payload, doc_url, last_seq in parts:
+        parent = None
+        if payload.get("monograph"):
+            parent = parents.get(payload["monograph"])
+            if not parent:
+                stats["skipped"] += 1
+                continue
+            payload = _include_data_monograph_in_payload_type_part(
+                payload=payload, monograph=parent
+            )
+        part_records.append(_book_record(identifier, doc_url, payload, parent, last_seq))
+    persisted += fetched_parents
+    persisted += _bulk_persist_harvested_books(user, part_records)
+
+    stats["harvested"] += len(books) + len(part_records)
+    return persisted
+
+
+def harvest_books_in_batches(
+    user,
+    db_name="scielobooks_1a",
+    limit=100,
+    since=None,
+    headers=None,
+):
+    """
+    Coleta o _changes página a página com include_docs, gravando e indexando
+    cada página em lote. Os monographs resolvidos ficam num LRU da coleta.
+    """
+    base_url = _base_url()
+    monographs = MonographCache()
+    stats = {"harvested": 0, "deleted": 0, "skipped": 0, "failed": 0}
+    index_stats = new_index_stats()
+    with BronzeTransformBatch() as transform_batch:
+        for changes in iter_changes_pages(
+            db_name=db_name,
+            since=since,
+            limit=limit,
+            headers=headers,
+            include_docs=True,
+        ):
+            persisted = harvest_books_page(
+                base_url=base_url,
+                db_name=db_name,
+                changes=changes,
+                headers=headers,
+                user=user,
+                monographs=monographs,
+                stats=stats,
+            )
+            indexed = bulk_index_harvested_instances(persisted, stats=index_stats)
+            for obj in indexed:
+                try:
+                    transform_batch.add(obj, "HarvestedBooks")
+                except Exception as exc:
+                    logging.warning(
+                        "Falha na transformação bronze HarvestedBooks (%s): %s",
+                        obj.identifier,
+                        exc,
+                    )
+
+    logging.info(
+        f"Coleta de books: coletados={stats['harvested']} removidos={stats['deleted']} "
+        f"sem monograph={stats['skipped']} falhas={stats['failed']} "
+        f"indexados={index_stats['indexed']} inalterados={index_stats['unchanged']} "
+        f"falhas de indexação={index_stats['failed']}"
+    )
+    return {**stats, "index": index_stats}
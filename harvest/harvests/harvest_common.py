@@ -13,6 +13,7 @@ def harvest_records(
     fk_field,
     label,
 ):
+    stats = {"harvested": 0, "indexed": 0, "unchanged": 0, "failed": 0}
     for rec in recs:
         if not rec.header.identifier:
             continue
@@ -36,3 +37,17 @@ def harvest_records(
         )
         exc_context.save_to_db()
         exc_context.mark_status_harvest()
+
+        stats["harvested"] += 1
+        outcome = getattr(harvested_obj, "index_outcome", None)
+        if outcome is None and harvested_obj.raw_data:
+            # O sinal de post_save só reindexa quando o raw_data mudou.
+            outcome = "unchanged"
+        if outcome in stats:
+            stats[outcome] += 1
+
+    logging.info(
+        f"Coleta de {label}: coletados={stats['harvested']} indexados={stats['indexed']} "
+        f"inalterados={stats['unchanged']} falhas={stats['failed']}"
+    )
+    return stats
@@ -16,7 +16,7 @@ NODES = [
 
 
 def harvest_preprint(recs, user):
-    harvest_records(
+    return harvest_records(
         recs=recs,
         user=user,
         nodes=NODES,
@@ -9,7 +9,7 @@ from django.utils import timezone
 
 from search_gateway.client import get_opensearch_client
 
-from .bronze_transform import transform_after_indexing
+from .bronze_transform import BronzeTransformBatch
 from .exception_logs import ExceptionContext
 from .models import HarvestStatus, IndexStatus
 from .utils import source_hash
@@ -50,10 +50,21 @@ def _get_error_log_fk_field(instance):
     }.get(instance.__class__.__name__)
 
 
-def index_harvested_raw_data(model, index_name=None, only_success=True, refresh=False):
+def index_harvested_raw_data(
+    model,
+    index_name=None,
+    only_success=True,
+    refresh=False,
+    chunk_size=None,
+    incremental=None,
+):
     """
     Indexa o raw_data dos modelos HarvestedPreprint, HarvestedBooks e
-    HarvestedSciELOData no OpenSearch.
+    HarvestedSciELOData no OpenSearch, em lotes enviados via _bulk.
+
+    No modo incremental, documentos cujo oca_source_hash armazenado é igual
+    ao hash atual não são reenviados nem transformados. Retorna as contagens
+    de indexados, inalterados e com falha.
     """
     status_filter = [HarvestStatus.SUCCESS]
     if not only_success:
@@ -65,25 +76,237 @@ def index_harvested_raw_data(model, index_name=None, only_success=True, refresh=
 
     queryset = queryset.exclude(index_status=IndexStatus.SUCCESS)
 
-    for obj in queryset.iterator():
-        index_name = get_index_name(model_name=model.__name__, instance=obj)
-        index_harvested_instance(instance=obj, index_name=index_name, refresh=False)
+    client = get_opensearch_client()
+    if client is None:
+        logger.warning("OpenSearch client não configurado.")
+        return None
+
+    stats = new_index_stats()
+    chunk_size = chunk_size or getattr(settings, "HARVEST_RAW_INDEX_CHUNK_SIZE", 500)
+    with BronzeTransformBatch() as transform_batch:
+        for chunk in _iter_chunks(queryset.iterator(chunk_size=chunk_size), chunk_size):
+            indexed = bulk_index_harvested_instances(
+                chunk,
+                client=client,
+                incremental=incremental,
+                stats=stats,
+            )
+
+            for obj in indexed:
+                if not obj.raw_data:
+                    continue
+                try:
+                    transform_batch.add(obj, model.__name__)
+                except Exception as exc:
+                    logger.warning(
+                        "Falha na transformação bronze %s (%s): %s",
+                        model.__name__,
+                        obj.identifier,
+                        exc,
+                    )
+
+    logger.info(
+        "Indexação raw %s: indexados=%s inalterados=%s falhas=%s",
+        model.__name__,
+        stats["indexed"],
+        stats["unchanged"],
+        stats["failed"],
+    )
+    return stats
+
+
+def new_index_stats():
+    return {"indexed": 0, "unchanged": 0, "failed": 0}
+
+
+def _incremental_enabled(incremental):
+    if incremental is None:
+        return getattr(settings, "HARVEST_INCREMENTAL_INDEXING", True)
+    return incremental
+
+
+def _stored_source_hashes(client, documents):
+    """Lê o oca_source_hash já indexado para pares (índice, identificador)."""
+    if not documents:
+        return {}
+    response = client.mget(
+        body={
+            "docs": [
+                {"_index": index_name, "_id": identifier, "_source": ["oca_source_hash"]}
+                for index_name, identifier in documents
+            ]
+        }
+    )
+    return {
+        (doc.get("_index"), doc.get("_id")): (doc.get("_source") or {}).get("oca_source_hash")
+        for doc in response.get("docs", [])
+        if doc.get("found")
+    }
+
+
+def _is_unchanged(client, index_name, identifier, payload_hash):
+    try:
+        stored = _stored_source_hashes(client, [(index_name, identifier)])
+    except Exception as exc:
+        logger.warning("Falha ao ler hash indexado de %s (%s): %s", identifier, index_name, exc)
+        return False
+    return stored.get((index_name, identifier)) == payload_hash
+
+
+def _iter_chunks(iterable, chunk_size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def bulk_index_harvested_instances(
+    instances,
+    client=None,
+    refresh=False,
+    incremental=None,
+    stats=None,
+):
+    """
+    Indexa um lote de objetos harvest com uma única requisição _bulk e
+    atualiza o index_status do lote. Retorna os objetos indexados; os
+    inalterados (modo incremental) só têm o index_status atualizado.
+    """
+    client = client or get_opensearch_client()
+    if client is None:
+        logger.warning("OpenSearch client não configurado.")
+        return []
+
+    indexed_at = timezone.now().isoformat()
+    candidates = []
+    failures = []
+    for instance in instances:
+        index_name = get_index_name(instance=instance)
+        if not index_name:
+            logger.warning(
+                f"Index name não configurado para {instance.__class__.__name__} ({instance.identifier})."
+            )
+            continue
+        try:
+            payload_hash = source_hash(instance.raw_data)
+        except Exception as exc:
+            failures.append((instance, index_name, exc))
+            continue
+        candidates.append((instance, index_name, payload_hash))
+
+    stored_hashes = {}
+    if candidates and _incremental_enabled(incremental):
+        try:
+            stored_hashes = _stored_source_hashes(
+                client,
+                [(index_name, instance.identifier) for instance, index_name, _hash in candidates],
+            )
+        except Exception as exc:
+            logger.warning("Falha ao ler hashes indexados; indexando o lote inteiro: %s", exc)
+
+    actions = []
+    sent = []
+    unchanged = []
+    for instance, index_name, payload_hash in candidates:
+        if stored_hashes.get((index_name, instance.identifier)) == payload_hash:
+            unchanged.append((instance, index_name))
+            continue
+        actions.append({"index": {"_index": index_name, "_id": instance.identifier}})
+        actions.append(
+            {
+                "raw_data": instance.raw_data,
+                "oca_indexed_at": indexed_at,
+                "oca_source_hash": payload_hash,
+            }
+        )
+        sent.append((instance, index_name))
+
+    indexed = []
+    if sent:
+        try:
+            response = client.bulk(body=actions, refresh=refresh)
+        except Exception as exc:
+            failures.extend((instance, index_name, exc) for instance, index_name in sent)
+        else:
+            for (instance, index_name), item in zip(sent, response.get("items", [])):
+                result = item.get("index", {})
+                if result.get("status", 200) >= 400:
+                    failures.append(
+                        (instance, index_name, RuntimeError(str(result.get("error"))))
+                    )
+                else:
+                    indexed.append((instance, index_name))
+
+    _mark_chunk_indexed(indexed + unchanged)
+    _mark_chunk_index_failed(failures)
+    if stats is not None:
+        stats["indexed"] += len(indexed)
+        stats["unchanged"] += len(unchanged)
+        stats["failed"] += len(failures)
+    return [instance for instance, _index_name in indexed]
+
+
+def _mark_chunk_indexed(indexed):
+    if not indexed:
+        return
+
+    now = timezone.now()
+    by_index = {}
+    for instance, index_name in indexed:
+        instance.index_status = IndexStatus.SUCCESS
+        instance.indexed_at = now
+        instance.index_name = index_name
+        instance.updated = now
+        by_index.setdefault((instance.__class__, index_name), []).append(instance.pk)
 
-        if obj.index_status == IndexStatus.SUCCESS and obj.raw_data:
-            try:
-                transform_after_indexing(instance=obj, model_name=model.__name__)
-            except Exception as exc:
-                logger.warning(
-                    "Falha na transformação bronze %s (%s): %s",
-                    model.__name__,
-                    obj.identifier,
-                    exc,
-                )
+    for (model, index_name), pks in by_index.items():
+        model.objects.filter(pk__in=pks).update(
+            index_status=IndexStatus.SUCCESS,
+            indexed_at=now,
+            index_name=index_name,
+            updated=now,
+        )
 
 
-def index_harvested_instance(instance, index_name=None, refresh=False):
+def _mark_chunk_index_failed(failures):
+    if not failures:
+        return
+
+    now = timezone.now()
+    by_model = {}
+    for instance, index_name, exc in failures:
+        logger.warning(
+            f"Falha ao indexar em {index_name} {instance.__class__.__name__} ({instance.identifier}): {exc}"
+        )
+        instance.index_status = IndexStatus.FAILED
+        instance.updated = now
+        by_model.setdefault(instance.__class__, []).append(instance.pk)
+
+        exc_context = ExceptionContext(
+            harvest_object=instance,
+            log_model=instance.harvest_error_log.model,
+            fk_field=_get_error_log_fk_field(instance),
+        )
+        exc_context.add_exception(exception=exc, field_name="raw_data")
+        exc_context.save_to_db()
+
+    for model, pks in by_model.items():
+        model.objects.filter(pk__in=pks).update(
+            index_status=IndexStatus.FAILED,
+            updated=now,
+        )
+
+
+def index_harvested_instance(instance, index_name=None, refresh=False, incremental=None):
     """
     Indexa um único objeto harvest no OpenSearch.
+
+    Retorna "indexed", "unchanged" (modo incremental, hash igual ao indexado)
+    ou "failed"; None quando não há cliente ou índice configurado.
     """
     exc_context = ExceptionContext(
         harvest_object=instance,
@@ -104,6 +327,15 @@ def index_harvested_instance(instance, index_name=None, refresh=False):
 
     try:
         payload_hash = source_hash(instance.raw_data)
+        if _incremental_enabled(incremental) and _is_unchanged(
+            client, index_name, instance.identifier, payload_hash
+        ):
+            logger.info(
+                f"Instancia {instance.__class__.__name__}: {instance.identifier} inalterada no indice {index_name}"
+            )
+            instance.mark_as_indexed(index_name=index_name)
+            return "unchanged"
+
         logging.info(
             f"Indexando instancia {instance.__class__.__name__}: {instance.identifier} no indice {index_name}"
         )
@@ -126,9 +358,11 @@ def index_harvested_instance(instance, index_name=None, refresh=False):
         instance.mark_as_index_failed()
         exc_context.add_exception(exception=exc, field_name="raw_data")
         exc_context.save_to_db()
+        return "failed"
 
     if refresh:
         client.indices.refresh(index=index_name)
+    return "indexed"
 
 
 def delete_harvested_document(model_name, identifier, refresh=False):
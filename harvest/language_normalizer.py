@@ -1,5 +1,7 @@
+import functools
 import re
 import unicodedata
+from types import MappingProxyType
 
 try:
     from iso639 import Lang
@@ -25,7 +27,7 @@ ISO639_2_TO_1 = {
 }
 
 
-SYNONYM_TO_ISO639_1 = {
+SYNONYM_TO_ISO639_1 = MappingProxyType({
     # English
     "english": "en",
     "ingles": "en",
@@ -45,22 +47,26 @@ SYNONYM_TO_ISO639_1 = {
     "castellano": "es",
     "spanish sign language": "es",
     "spanish castilian": "es",
-}
+})
 
 
 _ALPHA_CODE_RE = re.compile(r"^[a-zA-Z]+$")
 _SPACE_RE = re.compile(r"\s+")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9\s]")
+# Distinct raw values resolved through iso639 kept per process
+_ISO639_CACHE_SIZE = 4096
 
 
 def _normalize_key(value):
     text = unicodedata.normalize("NFKD", value)
     text = text.encode("ascii", "ignore").decode("ascii")
     text = text.lower()
-    text = re.sub(r"[^a-z0-9\s]", " ", text)
+    text = _NON_ALNUM_RE.sub(" ", text)
     text = _SPACE_RE.sub(" ", text).strip()
     return text
 
 
+@functools.lru_cache(maxsize=_ISO639_CACHE_SIZE)
 def _resolve_with_iso639(value):
     if not Lang:
         return None
@@ -15,6 +15,16 @@ GLOBAL_METRICS_UPLOAD_ERROR_INDEX = _env.str(
     "GLOBAL_METRICS_UPLOAD_ERROR_INDEX",
     default="global_metrics_upload_errors",
 )
+# Partial updates per _bulk request when applying an upload to the silver
+# index, and how many matched silver documents between progress logs
+GLOBAL_METRICS_APPLY_BULK_CHUNK_SIZE = _env.int(
+    "GLOBAL_METRICS_APPLY_BULK_CHUNK_SIZE",
+    default=500,
+)
+GLOBAL_METRICS_APPLY_PROGRESS_EVERY = _env.int(
+    "GLOBAL_METRICS_APPLY_PROGRESS_EVERY",
+    default=50000,
+)
 
 # OpenSearch raw index names
 OS_INDEX_RAW_PREPRINT = _env.str(
@@ -38,8 +48,30 @@ OS_INDEX_RAW_SCIELO_DATA = _env.str(
     default="raw_scielo_data",
 )
 
+# Raw documents sent per _bulk request when indexing harvested data
+HARVEST_RAW_INDEX_CHUNK_SIZE = _env.int(
+    "HARVEST_RAW_INDEX_CHUNK_SIZE",
+    default=500,
+)
+
+# Skip re-indexing raw documents whose stored oca_source_hash is unchanged
+HARVEST_INCREMENTAL_INDEXING = _env.bool("HARVEST_INCREMENTAL_INDEXING", default=True)
+
+# Bronze transformation batches: identifiers per _reindex and the longest
+# time pending identifiers wait before being sent
+HARVEST_BRONZE_TRANSFORM_BATCH_SIZE = _env.int(
+    "HARVEST_BRONZE_TRANSFORM_BATCH_SIZE",
+    default=500,
+)
+HARVEST_BRONZE_TRANSFORM_WINDOW_SECONDS = _env.int(
+    "HARVEST_BRONZE_TRANSFORM_WINDOW_SECONDS",
+    default=60,
+)
+
 # Harvest books, preprint, and SciELO Data settings
 SCIELO_BOOKS_BASE_URL = _env("SCIELO_BOOKS_BASE_URL", default=None)
+# Monographs kept in memory per books harvest, shared by their chapters
+HARVEST_BOOKS_MONOGRAPH_CACHE_SIZE = _env.int("HARVEST_BOOKS_MONOGRAPH_CACHE_SIZE", default=1024)
 SITE_SCIELO_DATA = _env("SITE_SCIELO_DATA", default="https://data.scielo.org")
 USER_AGENT = _env(
     "USER_AGENT",
@@ -60,11 +60,12 @@ def _index_if_raw_data_saved(instance, created, update_fields):
         model_name=instance.__class__.__name__,
         instance=instance,
     )
-    index_harvested_instance(instance=instance, index_name=index_name)
+    outcome = index_harvested_instance(instance=instance, index_name=index_name)
+    instance.index_outcome = outcome
 
     model_name = instance.__class__.__name__
     try:
-        if instance.index_status == IndexStatus.SUCCESS and instance.raw_data:
+        if outcome == "indexed" and instance.raw_data:
             transform_after_indexing(instance=instance, model_name=model_name)
     except Exception as exc:
         logger.warning(
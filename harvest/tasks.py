@@ -52,7 +52,7 @@ def harvest_preprint_in_endpoint_oai_pmh(username, user_id=None, reprocess=None,
         logging.info("Coletando todos os registros")
 
     recs = service_oai_pmh_scythe(url=url, from_date=from_date, verify=verify)    
-    harvest_preprint(recs=recs, user=user)
+    return harvest_preprint(recs=recs, user=user)
 
 
 @celery_app.task(name="Harvest data SciELO Data")
@@ -82,6 +82,7 @@ def harvest_books_in_couchdb(
     db_name="scielobooks_1a",
     headers=None,
     run_single_tasks=False,
+    batch=True,
 ):
     user = User.objects.get(username=username)
     since = start if since is None else since
@@ -92,6 +93,7 @@ def harvest_books_in_couchdb(
             since=since,
             db_name=db_name,
             headers=headers,
+            batch=batch,
         )
         return
 
@@ -258,5 +260,6 @@ def reconcile_harvest_pipeline(document_type, user_id=None):
                       document_type)
         return
 
-    index_harvested_raw_data(document_model)
+    stats = index_harvested_raw_data(document_model)
     reconcile_missing_bronze_etl(document_model)
+    return stats
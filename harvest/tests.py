@@ -1,5 +1,6 @@
 import io
 import tempfile
+from types import SimpleNamespace
 from unittest.mock import patch
 
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -14,8 +15,11 @@ from harvest.language_normalizer import (
 )
 
 from .exception_logs import ExceptionContext
+from .harvests.harvest_books import harvest_books
 from .harvests.harvest_data import harvest_data
 from .harvests.harvest_preprint import NODES, harvest_preprint
+from .bronze_transform import BronzeTransformBatch
+from .indexing import index_harvested_raw_data
 from .models import (
     GlobalMetricsUploadFile,
     HarvestedBooks,
@@ -24,14 +28,12 @@ from .models import (
     HarvestErrorLogBooks,
     HarvestErrorLogPreprint,
     HarvestErrorLogSciELOData,
+    IndexStatus,
+    TransformationScript,
 )
+from .global_metrics.apply import apply_global_metrics_upload_to_silver
 from .global_metrics.constants import GLOBAL_METRICS_REQUIRED_COLUMNS
 from .global_metrics.indexing import GlobalMetricsIndexingError, index_prepared_rows, iter_file_rows
-from .global_metrics.opensearch import (
-    build_global_metrics_update_by_query_body,
-    build_harvest_metric_lookup_body,
-    iter_silver_issn_year_groups,
-)
 from .global_metrics.parsing import global_metric_row_from_hit
 from .parse_info_oai_pmh import (
     get_date,
@@ -40,6 +42,7 @@ from .parse_info_oai_pmh import (
     parse_author_name,
 )
 from .storage import global_metrics_upload_path, overwrite_media_storage
+from .utils import source_hash
 
 
 class GlobalMetricsUploadFileTests(TestCase):
@@ -144,67 +147,148 @@ class GlobalMetricsUploadTaskTests(SimpleTestCase):
 
         self.assertEqual(rows[0][1]["scielo_active_and_valid_in_the_year"], "1")
 
-    def test_iter_silver_issn_year_groups_deduplicates_combinations(self):
-        client = DummyOpenSearchClient(
-            [
-                {
-                    "_source": {
-                        "publication_year": 2024,
-                        "source": {"issns": ["12345678", "8765-4321"]},
-                    }
+    @patch("harvest.global_metrics.apply.streaming_bulk")
+    @patch("harvest.global_metrics.opensearch.iter_pit_hits")
+    @patch("harvest.global_metrics.apply.get_opensearch_client")
+    @patch("harvest.global_metrics.apply.GlobalMetricsUploadFile.objects.get")
+    def test_apply_global_metrics_joins_upload_rows_and_silver_in_one_pass(
+        self,
+        mock_get_upload,
+        mock_get_client,
+        mock_iter_pit_hits,
+        mock_streaming_bulk,
+    ):
+        mock_get_upload.return_value = SimpleNamespace(
+            pk=7,
+            file=SimpleNamespace(name="global_metrics_uploads/metrics.csv"),
+        )
+        metric_hits = [
+            {"_source": {"raw_data": {"issns": "12345678", "year": "2024", "wos_active_in_the_year": "1", "country": "Brazil"}}},
+            {"_source": {"raw_data": {"issns": "1234-5678", "year": "2024", "scopus_active_in_the_year": "true", "country": "Atlantis"}}},
+            {"_source": {"raw_data": {"issns": "1111-2222", "year": "2023", "wos_active_in_the_year": "1"}}},
+        ]
+        silver_hits = [
+            {
+                "_index": "silver-1",
+                "_id": "doc-1",
+                "_seq_no": 12,
+                "_primary_term": 3,
+                "_source": {
+                    "publication_year": 2024,
+                    "source": {"issns": ["1234-5678"]},
+                    "oca_data": {"scielo": {"source": {"indexed_in": "SciELO"}}},
                 },
-                {
-                    "_source": {
-                        "publication_year": 2024,
-                        "source": {"issns": ["1234-5678"]},
-                    }
+            },
+            {
+                "_index": "silver-1",
+                "_id": "doc-2",
+                "_source": {
+                    "publication_year": 2024,
+                    "source": {"issns": ["12345678"]},
+                    "oca_data": {"scielo": {"source": {"indexed_in": ["Scopus", "WoS"], "country_code": "BR"}}},
                 },
-            ]
+            },
+            {"_index": "silver-1", "_id": "doc-3", "_source": {"publication_year": 2022, "source": {"issns": ["1234-5678"]}}},
+        ]
+        mock_iter_pit_hits.side_effect = lambda client, index, body, **kwargs: iter(
+            metric_hits if index == "global_metrics_upload_file" else silver_hits
         )
+        sent = []
 
-        groups = list(iter_silver_issn_year_groups(client, "silver_scientific_production"))
+        def fake_streaming_bulk(client, actions, **kwargs):
+            for action in actions:
+                sent.append(action)
+                yield True, {"update": {"_id": action["_id"], "status": 200}}
+
+        mock_streaming_bulk.side_effect = fake_streaming_bulk
 
+        stats = apply_global_metrics_upload_to_silver(
+            7,
+            harvest_index="global_metrics_upload_file",
+            silver_index="silver_scientific_production",
+        )
+
+        self.assertEqual(mock_iter_pit_hits.call_count, 2)
+        silver_body = mock_iter_pit_hits.call_args_list[1].args[2]
+        self.assertTrue(silver_body["seq_no_primary_term"])
         self.assertEqual(
-            groups,
+            sent,
             [
-                {"year": 2024, "issns": ["12345678", "1234-5678"]},
-                {"year": 2024, "issns": ["8765-4321"]},
+                {
+                    "_op_type": "update",
+                    "_index": "silver-1",
+                    "_id": "doc-1",
+                    "if_seq_no": 12,
+                    "if_primary_term": 3,
+                    "doc": {
+                        "oca_data": {
+                            "scielo": {
+                                "source": {
+                                    "indexed_in": ["SciELO", "Scopus", "WoS"],
+                                    "country_code": "BR",
+                                }
+                            }
+                        }
+                    },
+                }
             ],
         )
-
-    def test_build_harvest_metric_lookup_body_filters_upload_issn_and_year(self):
-        body = build_harvest_metric_lookup_body(
-            source_file="metrics.csv",
-            year=2024,
-            issns=["12345678", "1234-5678"],
+        self.assertEqual(stats["metric_rows"], 2)
+        self.assertEqual(stats["harvest_lookups"], 1)
+        self.assertEqual(stats["silver_groups_seen"], 2)
+        self.assertEqual(stats["groups_processed"], 1)
+        self.assertEqual(stats["matches_found"], 2)
+        self.assertEqual(stats["updated"], 1)
+        self.assertEqual(stats["unresolved_countries"], ["Atlantis"])
+        self.assertEqual(stats["errors"], [])
+
+    @patch("harvest.global_metrics.apply.streaming_bulk")
+    @patch("harvest.global_metrics.opensearch.iter_pit_hits")
+    @patch("harvest.global_metrics.apply.get_opensearch_client")
+    @patch("harvest.global_metrics.apply.GlobalMetricsUploadFile.objects.get")
+    def test_apply_global_metrics_counts_stale_silver_documents_as_conflicts(
+        self,
+        mock_get_upload,
+        mock_get_client,
+        mock_iter_pit_hits,
+        mock_streaming_bulk,
+    ):
+        mock_get_upload.return_value = SimpleNamespace(
+            pk=7,
+            file=SimpleNamespace(name="global_metrics_uploads/metrics.csv"),
         )
-
-        query = body["query"]["bool"]
-        self.assertEqual(query["filter"][0]["bool"]["minimum_should_match"], 1)
-        self.assertIn({"term": {"raw_data.year": 2024}}, query["filter"][1]["bool"]["should"])
-        self.assertIn(
-            {"match_phrase": {"raw_data.issns": "1234-5678"}},
-            query["must"][0]["bool"]["should"],
+        metric_hits = [
+            {"_source": {"raw_data": {"issns": "1234-5678", "year": "2024", "wos_active_in_the_year": "1"}}},
+        ]
+        silver_hits = [
+            {
+                "_index": "silver-1",
+                "_id": "doc-1",
+                "_seq_no": 5,
+                "_primary_term": 1,
+                "_source": {"publication_year": 2024, "source": {"issns": ["1234-5678"]}},
+            },
+        ]
+        mock_iter_pit_hits.side_effect = lambda client, index, body, **kwargs: iter(
+            metric_hits if index == "global_metrics_upload_file" else silver_hits
         )
 
-    def test_build_global_metrics_update_by_query_body_preserves_params(self):
-        body = build_global_metrics_update_by_query_body(
-            {
-                "year": 2024,
-                "issns": ["12345678", "1234-5678"],
-                "indexed_in": {"WoS", "Scopus"},
-                "country_codes": ["BR"],
-                "countries": ["Brasil"],
-            }
+        def fake_streaming_bulk(client, actions, **kwargs):
+            for action in actions:
+                self.assertEqual((action["if_seq_no"], action["if_primary_term"]), (5, 1))
+                yield False, {"update": {"_id": action["_id"], "status": 409}}
+
+        mock_streaming_bulk.side_effect = fake_streaming_bulk
+
+        stats = apply_global_metrics_upload_to_silver(
+            7,
+            harvest_index="global_metrics_upload_file",
+            silver_index="silver_scientific_production",
         )
 
-        filters = body["query"]["bool"]["filter"]
-        self.assertEqual(filters[0], {"term": {"publication_year": 2024}})
-        self.assertEqual(filters[1], {"terms": {"source.issns": ["12345678", "1234-5678"]}})
-        params = body["script"]["params"]
-        self.assertEqual(params["indexed_in"], ["Scopus", "WoS"])
-        self.assertEqual(params["country_codes"], ["BR"])
-        self.assertIn("oca_data.scielo.source", body["script"]["source"])
+        self.assertEqual(stats["updated"], 0)
+        self.assertEqual(stats["version_conflicts"], 1)
+        self.assertEqual(stats["errors"], [])
 
     @override_settings(GLOBAL_METRICS_UPLOAD_ERROR_INDEX="global_metrics_upload_errors")
     @patch("harvest.global_metrics.indexing.OpenSearchIndexClient")
@@ -317,18 +401,231 @@ class GlobalMetricsUploadTaskTests(SimpleTestCase):
         self.assertEqual(mock_index_client.return_value.index_error.call_count, 12)
 
 
-class DummyOpenSearchClient:
-    def __init__(self, hits):
-        self.hits = hits
+class RawDataBulkIndexingTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(username="indexer", password="teste")
+        HarvestedPreprint.objects.bulk_create(
+            [
+                HarvestedPreprint(
+                    identifier=f"oai:scielo:preprint:{number}",
+                    creator=self.user,
+                    raw_data={"title": f"Preprint {number}"},
+                    harvest_status="success",
+                )
+                for number in range(3)
+            ]
+        )
+
+    @patch("harvest.indexing.BronzeTransformBatch")
+    @patch("harvest.indexing.get_opensearch_client")
+    def test_indexes_chunks_with_bulk_and_logs_item_failures(self, mock_client, mock_batch):
+        def bulk(body, refresh):
+            return {
+                "items": [
+                    {"index": {"_id": action["index"]["_id"], "status": 400, "error": {"type": "boom"}}}
+                    if action["index"]["_id"].endswith(":1")
+                    else {"index": {"_id": action["index"]["_id"], "status": 201}}
+                    for action in body[::2]
+                ]
+            }
+
+        mock_client.return_value.bulk.side_effect = bulk
+        mock_client.return_value.mget.return_value = {"docs": []}
+
+        stats = index_harvested_raw_data(HarvestedPreprint, chunk_size=2)
+
+        self.assertEqual(mock_client.return_value.bulk.call_count, 2)
+        first_body = mock_client.return_value.bulk.call_args_list[0].kwargs["body"]
+        self.assertEqual(first_body[0]["index"]["_index"], "raw_scielo_preprint")
+        self.assertIn("oca_source_hash", first_body[1])
+        statuses = dict(HarvestedPreprint.objects.values_list("identifier", "index_status"))
+        self.assertEqual(
+            statuses,
+            {
+                "oai:scielo:preprint:0": IndexStatus.SUCCESS,
+                "oai:scielo:preprint:1": IndexStatus.FAILED,
+                "oai:scielo:preprint:2": IndexStatus.SUCCESS,
+            },
+        )
+        self.assertEqual(HarvestErrorLogPreprint.objects.count(), 1)
+        transform_batch = mock_batch.return_value.__enter__.return_value
+        self.assertEqual(transform_batch.add.call_count, 2)
+        self.assertEqual(stats, {"indexed": 2, "unchanged": 0, "failed": 1})
+
+    @patch("harvest.indexing.BronzeTransformBatch")
+    @patch("harvest.indexing.get_opensearch_client")
+    def test_incremental_mode_skips_documents_with_unchanged_hash(self, mock_client, mock_batch):
+        stored = {
+            "oai:scielo:preprint:0": source_hash({"title": "Preprint 0"}),
+            "oai:scielo:preprint:1": source_hash({"title": "Old title"}),
+        }
+        mock_client.return_value.mget.side_effect = lambda body: {
+            "docs": [
+                {
+                    "_index": doc["_index"],
+                    "_id": doc["_id"],
+                    "found": True,
+                    "_source": {"oca_source_hash": stored[doc["_id"]]},
+                }
+                for doc in body["docs"]
+                if doc["_id"] in stored
+            ]
+        }
+        mock_client.return_value.bulk.side_effect = lambda body, refresh: {
+            "items": [{"index": {"_id": action["index"]["_id"], "status": 200}} for action in body[::2]]
+        }
+
+        stats = index_harvested_raw_data(HarvestedPreprint)
+
+        body = mock_client.return_value.bulk.call_args.kwargs["body"]
+        self.assertEqual(
+            [action["index"]["_id"] for action in body[::2]],
+            ["oai:scielo:preprint:1", "oai:scielo:preprint:2"],
+        )
+        self.assertEqual(stats, {"indexed": 2, "unchanged": 1, "failed": 0})
+        self.assertFalse(
+            HarvestedPreprint.objects.exclude(index_status=IndexStatus.SUCCESS).exists()
+        )
+        transform_batch = mock_batch.return_value.__enter__.return_value
+        self.assertEqual(transform_batch.add.call_count, 2)
+
+
+class BronzeTransformBatchTests(TestCase):
+    def setUp(self):
+        user = User.objects.create(username="transformer", password="teste")
+        TransformationScript.objects.bulk_create(
+            [
+                TransformationScript(
+                    creator=user,
+                    name="preprint",
+                    source_index="raw_scielo_preprint",
+                    dest_index="bronze_scielo_preprint",
+                    transform_script="ctx._source = ctx._source.raw_data",
+                    harvest_model="HarvestedPreprint",
+                )
+            ]
+        )
+
+    @patch("harvest.bronze_transform.enqueue_etl_items")
+    @patch("harvest.bronze_transform.EtlPipelineConfig.objects.select_for_source")
+    @patch("harvest.bronze_transform.client")
+    def test_runs_one_reindex_per_batch_and_enqueues_in_bulk(
+        self,
+        mock_client,
+        mock_select_for_source,
+        mock_enqueue,
+    ):
+        mock_client.indices.exists.return_value = True
+        mock_client.reindex.return_value = {"total": 3, "created": 3}
+        mock_client.mget.side_effect = lambda index, body: {
+            "docs": [
+                {"_id": identifier, "found": True, "_source": {"title": identifier}}
+                for identifier in body["ids"]
+            ]
+        }
+        mock_client.bulk.return_value = {"errors": False, "items": []}
+        preprints = [HarvestedPreprint(identifier=f"oai:{number}") for number in range(5)]
+
+        with BronzeTransformBatch(batch_size=3, window_seconds=3600) as batch:
+            for preprint in preprints:
+                batch.add(preprint, "HarvestedPreprint")
+
+        self.assertEqual(mock_client.reindex.call_count, 2)
+        first_query = mock_client.reindex.call_args_list[0].kwargs["body"]["source"]["query"]
+        self.assertEqual(first_query, {"ids": {"values": ["oai:0", "oai:1", "oai:2"]}})
+        self.assertEqual(mock_client.bulk.call_count, 2)
+        self.assertEqual(mock_enqueue.call_count, 2)
+        enqueued = mock_enqueue.call_args_list[1].kwargs
+        self.assertEqual(enqueued["source_index"], "bronze_scielo_preprint")
+        self.assertEqual([identifier for identifier, _source in enqueued["documents"]], ["oai:3", "oai:4"])
+        batch_configs = [call.kwargs["configs"] for call in mock_select_for_source.call_args_list[:3]]
+        self.assertEqual(mock_select_for_source.call_count, 5)
+        self.assertTrue(all(configs is batch_configs[0] for configs in batch_configs))
+
+    @patch("harvest.bronze_transform.enqueue_etl_items")
+    @patch("harvest.bronze_transform.EtlPipelineConfig.objects.select_for_source")
+    @patch("harvest.bronze_transform.client")
+    def test_enqueues_new_documents_carrying_the_raw_hash(
+        self,
+        mock_client,
+        mock_select_for_source,
+        mock_enqueue,
+    ):
+        raw_payload = {"title": "Preprint"}
+        bronze = {**raw_payload, "oca_source_hash": source_hash(raw_payload)}
+        mock_client.indices.exists.return_value = True
+        mock_client.reindex.return_value = {"total": 1, "created": 1}
+        mock_client.mget.return_value = {
+            "docs": [{"_id": "oai:new", "found": True, "_source": bronze}]
+        }
+        calls = []
+        mock_enqueue.side_effect = lambda **kwargs: calls.append("enqueue")
+        mock_client.bulk.side_effect = lambda **kwargs: calls.append("bulk") or {"errors": False}
 
-    def search(self, index, body, scroll):
-        return {"_scroll_id": "scroll-1", "hits": {"hits": self.hits}}
+        with BronzeTransformBatch(batch_size=10, window_seconds=3600) as batch:
+            batch.add(HarvestedPreprint(identifier="oai:new"), "HarvestedPreprint")
 
-    def scroll(self, scroll_id, scroll):
-        return {"_scroll_id": scroll_id, "hits": {"hits": []}}
+        self.assertEqual(calls, ["enqueue", "bulk"])
+        self.assertEqual(
+            [identifier for identifier, _source in mock_enqueue.call_args.kwargs["documents"]],
+            ["oai:new"],
+        )
 
-    def clear_scroll(self, scroll_id):
-        return None
+    @patch("harvest.bronze_transform.enqueue_etl_items", side_effect=RuntimeError("db down"))
+    @patch("harvest.bronze_transform.EtlPipelineConfig.objects.select_for_source")
+    @patch("harvest.bronze_transform.client")
+    def test_hash_is_not_stamped_when_enqueue_fails(
+        self,
+        mock_client,
+        mock_select_for_source,
+        mock_enqueue,
+    ):
+        mock_client.indices.exists.return_value = True
+        mock_client.reindex.return_value = {"total": 1, "created": 1}
+        mock_client.mget.return_value = {
+            "docs": [{"_id": "oai:1", "found": True, "_source": {"title": "Preprint"}}]
+        }
+
+        with BronzeTransformBatch(batch_size=10, window_seconds=3600) as batch:
+            batch.add(HarvestedPreprint(identifier="oai:1"), "HarvestedPreprint")
+
+        mock_enqueue.assert_called_once()
+        mock_client.bulk.assert_not_called()
+
+
+    @patch("harvest.bronze_transform.enqueue_etl_items")
+    @patch("harvest.bronze_transform.EtlPipelineConfig.objects.select_for_source")
+    @patch("harvest.bronze_transform.client")
+    def test_logs_documents_whose_hash_could_not_be_stamped(
+        self,
+        mock_client,
+        mock_select_for_source,
+        mock_enqueue,
+    ):
+        mock_client.indices.exists.return_value = True
+        mock_client.reindex.return_value = {"total": 2, "created": 2}
+        mock_client.mget.return_value = {
+            "docs": [
+                {"_id": "oai:1", "found": True, "_source": {"title": "Um"}},
+                {"_id": "oai:2", "found": True, "_source": {"title": "Dois"}},
+            ]
+        }
+        mock_client.bulk.return_value = {
+            "errors": True,
+            "items": [
+                {"update": {"_id": "oai:1", "status": 200}},
+                {"update": {"_id": "oai:2", "status": 429, "error": {"type": "es_rejected_execution_exception"}}},
+            ],
+        }
+
+        with self.assertLogs("harvest.bronze_transform", level="WARNING") as logs:
+            with BronzeTransformBatch(batch_size=10, window_seconds=3600) as batch:
+                batch.add(HarvestedPreprint(identifier="oai:1"), "HarvestedPreprint")
+                batch.add(HarvestedPreprint(identifier="oai:2"), "HarvestedPreprint")
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("1 documentos", logs.output[0])
+        self.assertIn("oai:2", logs.output[0])
 
 
 class DummyHeader:
@@ -555,6 +852,76 @@ class HarvestTestOAIPMH(TestCase):
         self.assertEqual(dataset_obj.raw_data["identifier"], "ds-1")
 
 
+
+@override_settings(SCIELO_BOOKS_BASE_URL="https://books.example.org")
+class BooksBatchHarvestTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="books", password="secret")
+
+    def _fetch_data(self, url, **kwargs):
+        self.requested.append(url)
+        if "/_all_docs?" in url:
+            return {"rows": [{"id": "m2", "doc": {"_id": "m2", "TYPE": "Monograph", "title": "Outro livro"}}]}
+        if "since=0" in url:
+            return {
+                "results": [
+                    {"seq": 1, "id": "p1", "doc": {"_id": "p1", "TYPE": "Part", "monograph": "m1"}},
+                    {
+                        "seq": 2,
+                        "id": "m1",
+                        "doc": {"_id": "m1", "TYPE": "Monograph", "title": "Livro", "doi_number": "10.1/m1"},
+                    },
+                    {"seq": 3, "id": "p2", "doc": {"_id": "p2", "TYPE": "Part", "monograph": "m2"}},
+                ],
+                "last_seq": 3,
+            }
+        if "since=3" in url:
+            return {
+                "results": [{"seq": 4, "id": "p3", "doc": {"_id": "p3", "TYPE": "Part", "monograph": "m2"}}],
+                "last_seq": 4,
+            }
+        return {"results": [], "last_seq": 4}
+
+    @patch("harvest.harvests.harvest_books.BronzeTransformBatch")
+    @patch("harvest.harvests.harvest_books.bulk_index_harvested_instances")
+    @patch("harvest.harvests.harvest_books.fetch_data")
+    def test_batch_mode_uses_included_docs_and_caches_monographs(
+        self, mock_fetch_data, mock_bulk_index, mock_batch
+    ):
+        self.requested = []
+        mock_fetch_data.side_effect = self._fetch_data
+        mock_bulk_index.side_effect = lambda instances, stats: list(instances)
+
+        stats = harvest_books(user=self.user, since=0, limit=3)
+
+        self.assertEqual(len(self.requested), 4)
+        self.assertTrue(all("include_docs=true" in url for url in self.requested))
+        self.assertEqual(sum("/_all_docs?" in url for url in self.requested), 1)
+        self.assertEqual(stats["harvested"], 4)
+        self.assertEqual(
+            [sorted(obj.identifier for obj in call.args[0]) for call in mock_bulk_index.call_args_list],
+            [["m1", "m2", "p1", "p2"], ["p3"]],
+        )
+        transform_batch = mock_batch.return_value.__enter__.return_value
+        self.assertEqual(
+            sorted(call.args[0].identifier for call in transform_batch.add.call_args_list),
+            ["m1", "m2", "p1", "p2", "p3"],
+        )
+
+        m1 = HarvestedBooks.objects.get(identifier="m1")
+        p1 = HarvestedBooks.objects.get(identifier="p1")
+        p3 = HarvestedBooks.objects.get(identifier="p3")
+        self.assertEqual(m1.raw_data["id"], "m1")
+        self.assertNotIn("_id", m1.raw_data)
+        self.assertEqual(p1.parent, m1)
+        self.assertEqual(p1.last_seq, 1)
+        self.assertEqual(p1.harvest_status, "success")
+        self.assertEqual(p1.raw_data["monograph_title"], "Livro")
+        self.assertEqual(p1.raw_data["doi_number"], "10.1/m1")
+        self.assertEqual(p3.parent.identifier, "m2")
+        self.assertIsNone(p3.parent.last_seq)
+
+
 class LanguageNormalizerTests(SimpleTestCase):
     def test_expected_examples_are_normalized(self):
         examples = {
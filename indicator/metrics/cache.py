@@ -0,0 +1,81 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import get_language
+
+from search_gateway.filters_cache import normalize_filters_for_cache
+
+CACHE_PREFIX = "indicator_results"
+GENERATION_KEY = f"{CACHE_PREFIX}:generation"
+HITS_KEY = f"{CACHE_PREFIX}:hits"
+MISSES_KEY = f"{CACHE_PREFIX}:misses"
+
+
+def result_cache_enabled():
+    return getattr(settings, "INDICATOR_RESULT_CACHE_ENABLED", True)
+
+
+def current_generation():
+    """Token bumped after every ETL write; it is part of every result key."""
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, 1, timeout=None)
+        generation = cache.get(GENERATION_KEY) or 1
+    return generation
+
+
+def invalidate_indicator_result_cache():
+    """Starts a new generation so results cached before an ETL write are unused."""
+    cache.add(GENERATION_KEY, 1, timeout=None)
+    try:
+        return cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.set(GENERATION_KEY, 2, timeout=None)
+        return 2
+
+
+def result_cache_key(data_source, filters, study_unit):
+    config_digest = hashlib.sha256(
+        json.dumps(data_source.metric_config_schema, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    payload = json.dumps(
+        {
+            "data_source": data_source.index_name,
+            "config": config_digest,
+            "filters": normalize_filters_for_cache(filters),
+            "study_unit": study_unit,
+            "language": get_language(),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"{CACHE_PREFIX}:{current_generation()}:{digest}"
+
+
+def get_cached_result(key):
+    data = cache.get(key)
+    _count(HITS_KEY if data is not None else MISSES_KEY)
+    return data
+
+
+def set_cached_result(key, data):
+    cache.set(key, data, getattr(settings, "INDICATOR_RESULT_CACHE_TTL", 60 * 60 * 6))
+
+
+def get_result_cache_stats():
+    return {
+        "hits": cache.get(HITS_KEY) or 0,
+        "misses": cache.get(MISSES_KEY) or 0,
+        "generation": current_generation(),
+    }
+
+
+def _count(key):
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
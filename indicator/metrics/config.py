@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field as dataclass_field
 from typing import Any, Dict, List, Optional, Union
 
+from .formula import CompiledFormula, compile_formula
+
 
 @dataclass
 class PhysicalMetric:
@@ -46,6 +48,7 @@ class MetricGroup:
         self.breakdown_variable = breakdown_variable
         self.sort = sort or []
         self.collapse = collapse or {}
+        self._compiled_formulas: Dict[str, CompiledFormula] = {}
 
     @property
     def physical_metrics(self) -> List[PhysicalMetric]:
@@ -61,6 +64,13 @@ class MetricGroup:
                 return m
         return None
 
+    def compiled_formula(self, metric: ComputedMetric) -> CompiledFormula:
+        compiled = self._compiled_formulas.get(metric.key)
+        if compiled is None or compiled.formula != metric.formula:
+            compiled = compile_formula(metric.formula)
+            self._compiled_formulas[metric.key] = compiled
+        return compiled
+
     @classmethod
     def from_config(cls, group_key: str, group_dict: Dict[str, Any], breakdown_variable: Optional[str] = None) -> "MetricGroup":
         metrics_list = []
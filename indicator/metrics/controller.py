@@ -1,6 +1,12 @@
 from search_gateway.client import get_opensearch_client
 from search_gateway.models import DataSource
 
+from indicator.metrics.cache import (
+    get_cached_result,
+    result_cache_enabled,
+    result_cache_key,
+    set_cached_result,
+)
 from indicator.metrics.engine import MetricEngine
 
 
@@ -13,4 +19,14 @@ def get_indicator_data(data_source_name, filters, study_unit="document"):
     if not data_source:
         return None, "Invalid data_source"
 
-    return MetricEngine(data_source=data_source, filters=filters, study_unit=study_unit).run(es)
+    cache_key = None
+    if result_cache_enabled():
+        cache_key = result_cache_key(data_source, filters, study_unit)
+        cached = get_cached_result(cache_key)
+        if cached is not None:
+            return cached, None
+
+    data, error = MetricEngine(data_source=data_source, filters=filters, study_unit=study_unit).run(es)
+    if cache_key and data is not None and not error:
+        set_cached_result(cache_key, data)
+    return data, error
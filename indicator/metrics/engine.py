@@ -1,6 +1,7 @@
 from typing import Any, Dict
 
 from .config import MetricGroup
+from .msearch import MultiSearchPlan
 from .presentation import MetricPresentation
 from .query import MetricQuery
 from .result import MetricResultBuilder
@@ -26,11 +27,30 @@ class MetricEngine:
             return None, f"Study unit '{self.group_key}' not found in metric_config"
 
         metric_group = self._build_metric_group(breakdown_variable=self.filters.get("breakdown_variable"))
-        data, error = self._fetch_metric_data(es, metric_group, self.filters)
+        baseline_filters, compared_filters = self._plan_comparison_baseline()
+
+        plan = MultiSearchPlan(self.data_source.index_name)
+        plan.add(self._build_search_body(metric_group, self.filters))
+        baseline_group = None
+        if compared_filters:
+            baseline_group = self._build_metric_group(breakdown_variable=None)
+            plan.add(self._build_search_body(baseline_group, baseline_filters))
+        outcomes = plan.execute(es)
+
+        response, error = outcomes[0]
         if error:
-            return None, error
+            return None, f"Error executing search: {error}"
+        data = MetricResultBuilder(self.data_source, metric_group).build_from_response(response)
 
-        relative_metrics = self._build_relative_metrics(es, metric_group, data)
+        baseline_data = None
+        if baseline_group is not None:
+            baseline_response, baseline_error = outcomes[1]
+            if not baseline_error:
+                baseline_data = MetricResultBuilder(self.data_source, baseline_group).build_from_response(
+                    baseline_response
+                )
+
+        relative_metrics = self._build_relative_metrics(metric_group, data, baseline_data, compared_filters)
         adapted_data = MetricPresentation(self.data_source, metric_group).adapt_data(data, relative_metrics)
         adapted_data["study_unit"] = self.study_unit
         adapted_data["data_source"] = self.data_source.index_name
@@ -95,39 +115,28 @@ class MetricEngine:
             breakdown_variable=breakdown_variable,
         )
 
-    def _fetch_metric_data(self, es, metric_group, filters):
+    def _build_search_body(self, metric_group, filters):
         metric_query = MetricQuery(self.data_source, metric_group)
-        body = {
+        return {
             "size": 0,
             "query": metric_query.build_query(filters),
             "aggs": metric_query.build_aggs(),
         }
 
-        try:
-            response = es.search(index=self.data_source.index_name, body=body)
-        except Exception as exc:
-            return None, f"Error executing search: {exc}"
-
-        data = MetricResultBuilder(self.data_source, metric_group).build_from_response(response)
-        return data, None
-
-    def _build_relative_metrics(self, es, metric_group, data):
+    def _plan_comparison_baseline(self):
         control_filter_keys = self._build_indicator_control_filter_keys()
         baseline_filters, comparative_filter_keys = self._build_comparison_baseline_filters(
             control_filter_keys=control_filter_keys,
         )
-        compared_filters = sorted(comparative_filter_keys)
+        return baseline_filters, sorted(comparative_filter_keys)
+
+    def _build_relative_metrics(self, metric_group, data, baseline_data, compared_filters):
         relative_metrics = {
             "enabled": False,
             "compared_filters": compared_filters,
         }
 
-        if not comparative_filter_keys:
-            return relative_metrics
-
-        baseline_group = self._build_metric_group(breakdown_variable=None)
-        baseline_data, error = self._fetch_metric_data(es, baseline_group, baseline_filters)
-        if error:
+        if not compared_filters or baseline_data is None:
             return relative_metrics
 
         relative_metrics = MetricResultBuilder(self.data_source, metric_group).compute_relative_metrics(
@@ -0,0 +1,70 @@
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import sympy
+from sympy.parsing.sympy_parser import parse_expr
+
+
+class CompiledFormula:
+    """
+    A ComputedMetric formula parsed once and lambdified to NumPy.
+
+    ``evaluate`` computes a whole series at once; missing inputs count as 0 and
+    nan/inf results become 0, as the per-value sympy evaluation did.
+    """
+
+    def __init__(self, formula: str, symbols: Tuple[str, ...], func: Optional[Callable]):
+        self.formula = formula
+        self.symbols = symbols
+        self.func = func
+
+    def evaluate(self, columns: Dict[str, Sequence[Any]], length: int, precision: int) -> List[float]:
+        if self.func is None or length <= 0:
+            return [0.0] * max(length, 0)
+
+        arrays = [_column_array(columns.get(name), length) for name in self.symbols]
+        try:
+            with np.errstate(all="ignore"):
+                result = np.broadcast_to(np.asarray(self.func(*arrays)), (length,))
+            values = _finite_or_zero(result)
+        except Exception:
+            values = [self._evaluate_scalar([array[idx] for array in arrays]) for idx in range(length)]
+
+        return [round(float(value), precision) for value in values]
+
+    def _evaluate_scalar(self, args: List[float]) -> float:
+        try:
+            with np.errstate(all="ignore"):
+                return float(_finite_or_zero(np.asarray(self.func(*args)).reshape(1))[0])
+        except Exception:
+            return 0.0
+
+
+@lru_cache(maxsize=256)
+def compile_formula(formula: str) -> CompiledFormula:
+    try:
+        expr = parse_expr(str(formula).strip())
+        symbols = tuple(sorted(expr.free_symbols, key=lambda sym: sym.name))
+        func = sympy.lambdify(symbols, expr, modules="numpy")
+    except Exception:
+        return CompiledFormula(formula, (), None)
+    return CompiledFormula(formula, tuple(sym.name for sym in symbols), func)
+
+
+def _column_array(values: Optional[Sequence[Any]], length: int) -> np.ndarray:
+    array = np.zeros(length, dtype=float)
+    for idx, value in enumerate((values or [])[:length]):
+        try:
+            array[idx] = float(value)
+        except (TypeError, ValueError):
+            array[idx] = np.nan
+    return array
+
+
+def _finite_or_zero(result: np.ndarray) -> np.ndarray:
+    if np.iscomplexobj(result):
+        result = np.where(result.imag == 0, result.real, np.nan)
+    values = np.array(result, dtype=float)
+    values[~np.isfinite(values)] = 0.0
+    return values
@@ -0,0 +1,58 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+SearchOutcome = Tuple[Optional[Dict[str, Any]], Optional[str]]
+
+
+class MultiSearchPlan:
+    """
+    Collects the independent search bodies of one request and sends them in a
+    single ``_msearch`` round trip.
+
+    ``execute`` returns one ``(response, error)`` pair per body, in the order
+    they were added, so a failing sub-search does not discard the others.
+    """
+
+    def __init__(self, index_name: str):
+        self.index_name = index_name
+        self._searches: List[Tuple[str, Dict[str, Any]]] = []
+
+    def add(self, body: Dict[str, Any], index: str = None) -> int:
+        self._searches.append((index or self.index_name, body))
+        return len(self._searches) - 1
+
+    def __len__(self) -> int:
+        return len(self._searches)
+
+    def execute(self, es) -> List[SearchOutcome]:
+        if not self._searches:
+            return []
+
+        request_body = []
+        for index, body in self._searches:
+            request_body.extend([{"index": index}, body])
+
+        try:
+            response = es.msearch(body=request_body)
+        except Exception as exc:
+            return [(None, str(exc))] * len(self._searches)
+
+        responses = (response or {}).get("responses") or []
+        outcomes = []
+        for position in range(len(self._searches)):
+            sub_response = responses[position] if position < len(responses) else None
+            outcomes.append(_resolve_sub_response(sub_response))
+        return outcomes
+
+
+def _resolve_sub_response(sub_response: Optional[Dict[str, Any]]) -> SearchOutcome:
+    if not isinstance(sub_response, dict):
+        return None, "Missing response in msearch result"
+
+    error = sub_response.get("error")
+    if error:
+        if isinstance(error, dict):
+            reason = error.get("reason") or error.get("type") or error
+            return None, str(reason)
+        return None, str(error)
+
+    return sub_response, None
@@ -1,8 +1,5 @@
 from typing import Any, Dict, List
 
-import sympy
-from sympy.parsing.sympy_parser import parse_expr
-
 from .config import MetricGroup
 
 
@@ -28,36 +25,32 @@ class MetricResultBuilder:
         if "series" not in data:
             metrics_data = data.get("metrics", {})
             for comp_metric in self.metric_group.computed_metrics:
-                computed_series = []
-                for idx in range(len(years)):
-                    context = {}
-                    for phys_key, vals in metrics_data.items():
-                        if idx < len(vals):
-                            context[phys_key] = vals[idx]
-
-                    val = self._evaluate_formula(comp_metric.formula, context, comp_metric.precision)
-                    computed_series.append(val)
-
-                metrics_data[comp_metric.key] = computed_series
+                metrics_data[comp_metric.key] = self._evaluate_formula_series(
+                    comp_metric,
+                    metrics_data,
+                    len(years),
+                )
             return data
 
         series = data.get("series", [])
         breakdown_keys = data["breakdown_raw_keys"]
 
+        columns_by_breakdown: Dict[str, Dict[str, Any]] = {}
+        for s in series:
+            phys_key = s.get("metric_key")
+            if not phys_key:
+                continue
+            for name in dict.fromkeys((self._series_breakdown_name(s), s.get("name"))):
+                columns_by_breakdown.setdefault(name, {})[phys_key] = s.get("data", [])
+
         new_series = list(series)
         for comp_metric in self.metric_group.computed_metrics:
             for breakdown in breakdown_keys:
-                computed_values = []
-                for idx in range(len(years)):
-                    context = {}
-                    for s in series:
-                        if self._series_breakdown_name(s) == breakdown or s.get("name") == breakdown:
-                            phys_key = s.get("metric_key")
-                            if phys_key and idx < len(s.get("data", [])):
-                                context[phys_key] = s["data"][idx]
-
-                    val = self._evaluate_formula(comp_metric.formula, context, comp_metric.precision)
-                    computed_values.append(val)
+                computed_values = self._evaluate_formula_series(
+                    comp_metric,
+                    columns_by_breakdown.get(breakdown, {}),
+                    len(years),
+                )
 
                 new_series.append({
                     "name": f"{breakdown} ({comp_metric.get_label()})",
@@ -229,23 +222,14 @@ class MetricResultBuilder:
 
         return 0
 
-    def _evaluate_formula(self, formula_str: str, context: Dict[str, Any], precision: int) -> float:
-        try:
-            expr = parse_expr(str(formula_str).strip())
-            safe_context = {}
-            for sym in expr.free_symbols:
-                safe_context[sym] = context.get(str(sym), 0)
-
-            substituted = expr.subs(safe_context)
-            result = substituted.evalf()
-
-            if result in (sympy.nan, sympy.oo, sympy.zoo, -sympy.oo) or not result.is_number:
-                return 0.0
-
-            val = float(result)
-            return round(val, precision)
-        except Exception:
-            return 0.0
+    def _evaluate_formula_series(
+        self,
+        comp_metric: Any,
+        columns: Dict[str, Any],
+        length: int,
+    ) -> List[float]:
+        compiled = self.metric_group.compiled_formula(comp_metric)
+        return compiled.evaluate(columns, length, comp_metric.precision)
 
     def _series_breakdown_name(self, series: Dict[str, Any]) -> str:
         if series.get("breakdown_key"):
@@ -0,0 +1,109 @@
+from unittest.mock import Mock
+
+from django.test import SimpleTestCase
+
+from indicator.metrics.engine import MetricEngine
+from indicator.metrics.msearch import MultiSearchPlan
+
+
+def per_year_response(counts):
+    return {
+        "aggregations": {
+            "per_year": {
+                "buckets": [
+                    {"key": year, "doc_count": count}
+                    for year, count in counts.items()
+                ]
+            }
+        }
+    }
+
+
+class MetricEngineMultiSearchTests(SimpleTestCase):
+    def setUp(self):
+        self.data_source = Mock()
+        self.data_source.index_name = "scielo"
+        self.data_source.get_field_settings_dict.return_value = {
+            "country": {"index_field_name": "country", "settings": {}},
+        }
+        self.data_source.get_form_control_field_names.return_value = []
+        self.data_source.get_field.return_value = None
+        self.data_source.metric_config_schema = {
+            "study_units": {
+                "document": {
+                    "time_dimension": {"field": "publication_year", "agg_type": "terms"},
+                    "metrics": [{"key": "document_count", "agg": "count"}],
+                }
+            }
+        }
+        self.es = Mock()
+
+    def test_main_and_baseline_queries_share_one_msearch(self):
+        self.es.msearch.return_value = {
+            "responses": [
+                per_year_response({2020: 5, 2021: 10}),
+                per_year_response({2020: 50, 2021: 40}),
+            ]
+        }
+
+        data, error = MetricEngine(self.data_source, {"country": ["BR"]}).run(self.es)
+
+        self.assertIsNone(error)
+        self.es.msearch.assert_called_once()
+        self.es.search.assert_not_called()
+        body = self.es.msearch.call_args.kwargs["body"]
+        self.assertEqual(len(body), 4)
+        self.assertEqual(body[0], {"index": "scielo"})
+        self.assertNotEqual(body[1]["query"], body[3]["query"])
+        self.assertTrue(data["relative_metrics"]["enabled"])
+
+    def test_failed_baseline_sub_response_keeps_main_result(self):
+        self.es.msearch.return_value = {
+            "responses": [
+                per_year_response({2020: 5}),
+                {"error": {"type": "search_phase_execution_exception", "reason": "boom"}, "status": 500},
+            ]
+        }
+
+        data, error = MetricEngine(self.data_source, {"country": ["BR"]}).run(self.es)
+
+        self.assertIsNone(error)
+        self.assertFalse(data["relative_metrics"]["enabled"])
+        self.assertEqual(data["relative_metrics"]["compared_filters"], ["country"])
+
+    def test_failed_main_sub_response_is_reported(self):
+        self.es.msearch.return_value = {
+            "responses": [{"error": {"type": "illegal_argument_exception", "reason": "bad field"}, "status": 400}]
+        }
+
+        data, error = MetricEngine(self.data_source, {}).run(self.es)
+
+        self.assertIsNone(data)
+        self.assertEqual(error, "Error executing search: bad field")
+
+
+class MultiSearchPlanTests(SimpleTestCase):
+    def test_transport_error_fails_every_search(self):
+        es = Mock()
+        es.msearch.side_effect = RuntimeError("connection refused")
+        plan = MultiSearchPlan("scielo")
+        plan.add({"size": 0})
+        plan.add({"size": 0}, index="other")
+
+        outcomes = plan.execute(es)
+
+        self.assertEqual(outcomes, [(None, "connection refused")] * 2)
+        self.assertEqual(es.msearch.call_args.kwargs["body"][2], {"index": "other"})
+
+    def test_missing_sub_response_is_an_error(self):
+        es = Mock()
+        es.msearch.return_value = {"responses": [{"hits": {"hits": []}}]}
+        plan = MultiSearchPlan("scielo")
+        plan.add({})
+        plan.add({})
+
+        outcomes = plan.execute(es)
+
+        self.assertEqual(outcomes[0], ({"hits": {"hits": []}}, None))
+        self.assertIsNone(outcomes[1][0])
+        self.assertIsNotNone(outcomes[1][1])
@@ -0,0 +1,72 @@
+from unittest.mock import Mock, patch
+
+from django.test import SimpleTestCase
+
+from indicator.metrics.config import MetricGroup
+from indicator.metrics.formula import compile_formula
+from indicator.metrics.result import MetricResultBuilder
+
+
+def build_group(breakdown_variable=None):
+    return MetricGroup.from_config(
+        "document",
+        {
+            "metrics": [
+                {"key": "citations", "field": "citations", "agg": "sum"},
+                {"key": "documents", "agg": "count"},
+                {
+                    "type": "computed",
+                    "key": "citations_per_document",
+                    "formula": "citations / documents",
+                    "precision": 2,
+                },
+            ]
+        },
+        breakdown_variable=breakdown_variable,
+    )
+
+
+class ComputedMetricFormulaTests(SimpleTestCase):
+    def test_per_year_formula_keeps_zero_for_nan_and_inf(self):
+        builder = MetricResultBuilder(Mock(), build_group())
+        data = {
+            "years": ["2020", "2021", "2022", "2023"],
+            "metrics": {
+                "citations": [10, 5, 0, 7],
+                "documents": [3, 0, 0],
+            },
+        }
+
+        result = builder.compute_metrics(data)
+
+        self.assertEqual(result["metrics"]["citations_per_document"], [3.33, 0.0, 0.0, 0.0])
+
+    def test_breakdown_series_are_evaluated_with_a_single_compilation(self):
+        group = build_group(breakdown_variable="country")
+        builder = MetricResultBuilder(Mock(), group)
+        data = {
+            "years": ["2020", "2021"],
+            "breakdown_raw_keys": ["BR", "AR"],
+            "series": [
+                {"name": "BR (citations)", "breakdown_key": "BR", "metric_key": "citations", "data": [9, 4]},
+                {"name": "BR (documents)", "breakdown_key": "BR", "metric_key": "documents", "data": [3, 8]},
+                {"name": "AR (citations)", "breakdown_key": "AR", "metric_key": "citations", "data": [1, 2]},
+                {"name": "AR (documents)", "breakdown_key": "AR", "metric_key": "documents", "data": [4, 0]},
+            ],
+        }
+
+        with patch("indicator.metrics.config.compile_formula", wraps=compile_formula) as compile_mock:
+            result = builder.compute_metrics(data)
+
+        compile_mock.assert_called_once_with("citations / documents")
+        computed = {
+            s["breakdown_key"]: s["data"]
+            for s in result["series"]
+            if s["metric_key"] == "citations_per_document"
+        }
+        self.assertEqual(computed, {"BR": [3.0, 0.5], "AR": [0.25, 0.0]})
+
+    def test_invalid_formula_evaluates_to_zero(self):
+        compiled = compile_formula("citations / (")
+
+        self.assertEqual(compiled.evaluate({"citations": [1, 2]}, 2, 2), [0.0, 0.0])
@@ -0,0 +1,54 @@
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from indicator.metrics.cache import get_result_cache_stats, invalidate_indicator_result_cache
+from indicator.metrics.controller import get_indicator_data
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    INDICATOR_RESULT_CACHE_ENABLED=True,
+)
+class IndicatorResultCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.data_source = Mock(index_name="scielo", metric_config_schema={"document": {}})
+        patches = [
+            patch("indicator.metrics.controller.get_opensearch_client", return_value=Mock()),
+            patch(
+                "indicator.metrics.controller.DataSource.get_by_index_name",
+                return_value=self.data_source,
+            ),
+            patch("indicator.metrics.controller.MetricEngine"),
+        ]
+        mocks = [p.start() for p in patches]
+        for p in patches:
+            self.addCleanup(p.stop)
+        self.engine = mocks[2]
+        self.engine.return_value.run.return_value = ({"years": ["2020"]}, None)
+
+    def test_repeated_request_is_served_from_cache(self):
+        first = get_indicator_data("scielo", {"country": ["BR"]})
+        second = get_indicator_data("scielo", {"country": ["BR"]})
+
+        self.assertEqual(first, second)
+        self.engine.return_value.run.assert_called_once()
+        stats = get_result_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_etl_invalidation_starts_a_new_generation(self):
+        get_indicator_data("scielo", {"country": ["BR"]})
+        invalidate_indicator_result_cache()
+        get_indicator_data("scielo", {"country": ["BR"]})
+
+        self.assertEqual(self.engine.return_value.run.call_count, 2)
+
+    def test_errors_are_not_cached(self):
+        self.engine.return_value.run.return_value = (None, "boom")
+
+        get_indicator_data("scielo", {})
+        get_indicator_data("scielo", {})
+
+        self.assertEqual(self.engine.return_value.run.call_count, 2)
@@ -4,6 +4,7 @@ from search_gateway.client import get_opensearch_client
 from search_gateway.models import DataSource
 from indicator.filters import clean_filters
 from indicator.metrics.engine import MetricEngine
+from indicator.metrics.msearch import MultiSearchPlan, SearchOutcome
 from .normalizers import normalize_int, normalize_float, normalize_option
 from .query import JournalMetricQuery
 from .result import JournalMetricResultBuilder
@@ -219,8 +220,6 @@ class JournalMetricEngine:
         else:
             base_must.append({"term": {self.data_source.get_index_field_name("journal_issn"): issn}})
 
-        index_name = self.data_source.index_name
-
         levels_body = {
             "size": 0,
             "query": self._bool_query(base_must, inherited_must_not),
@@ -234,78 +233,45 @@ class JournalMetricEngine:
             },
         }
 
-        available_category_levels = []
-        try:
-            levels_res = es.search(index=index_name, body=levels_body)
-            buckets = levels_res.get("aggregations", {}).get("category_levels", {}).get("buckets", [])
-            for b in buckets:
-                lvl = str(b.get("key") or "").strip().lower()
-                if lvl in category_levels and lvl not in available_category_levels:
-                    available_category_levels.append(lvl)
-        except Exception:
-            pass
+        # Category levels, categories, the spider chart and (when a category was
+        # requested) the hits are planned for the requested level in one
+        # _msearch; only a fallback level or category costs another round trip.
+        requested_category_id = str(category_id).strip() if category_id not in (None, "") else None
+        plan = MultiSearchPlan(self.data_source.index_name)
+        plan.add(levels_body)
+        level_slots = self._plan_profile_level_searches(
+            plan, base_must, inherited_must_not, selected_category_level, publication_year, requested_category_id,
+        )
+        outcomes = plan.execute(es)
 
+        available_category_levels = self._parse_category_levels(outcomes[0], category_levels)
         if available_category_levels and selected_category_level not in available_category_levels:
             selected_category_level = available_category_levels[0]
+            plan = MultiSearchPlan(self.data_source.index_name)
+            level_slots = self._plan_profile_level_searches(
+                plan, base_must, inherited_must_not, selected_category_level, publication_year, requested_category_id,
+            )
+            outcomes = plan.execute(es)
 
-        categories_must = list(base_must) + [
-            {"term": {self.data_source.get_index_field_name("category_level"): selected_category_level}}
-        ]
-        if publication_year not in (None, ""):
-            categories_must.append({"term": {"publication_year": normalize_int(publication_year, publication_year)}})
-
-        categories_body = {
-            "size": 0,
-            "query": self._bool_query(categories_must, inherited_must_not),
-            "aggs": {
-                "categories": {
-                    "terms": {
-                        "field": self.data_source.get_index_field_name("category_id"),
-                        "size": 2000,
-                        "order": {"publications_total": "desc"},
-                    },
-                    "aggs": {
-                        "publications_total": {"sum": {"field": self.data_source.get_index_field_name("journal_publications_count")}},
-                    },
-                }
-            },
-        }
-
-        available_categories = []
-        try:
-            categories_res = es.search(index=index_name, body=categories_body)
-            buckets = categories_res.get("aggregations", {}).get("categories", {}).get("buckets", [])
-            available_categories = [str(b.get("key")).strip() for b in buckets if b.get("key")]
-        except Exception:
-            pass
+        available_categories = self._parse_available_categories(outcomes[level_slots["categories"]])
+        category_spider = self._parse_category_spider(outcomes[level_slots["spider"]])
 
-        selected_category_id = str(category_id).strip() if category_id not in (None, "") else None
+        selected_category_id = requested_category_id
         if selected_category_id and selected_category_id not in available_categories:
             selected_category_id = None
         if not selected_category_id and available_categories:
             selected_category_id = available_categories[0]
 
-        data_must = list(base_must) + [
-            {"term": {self.data_source.get_index_field_name("category_level"): selected_category_level}}
-        ]
-        if selected_category_id:
-            data_must.append({"term": {self.data_source.get_index_field_name("category_id"): selected_category_id}})
-
-        hits_body = {
-            "size": 1000,
-            "query": self._bool_query(data_must, inherited_must_not),
-            "sort": [
-                {"publication_year": {"order": "asc"}},
-                {self.data_source.get_index_field_name("journal_impact_cohort"): {"order": "desc", "missing": "_last"}},
-            ],
-            "collapse": {"field": "publication_year"},
-        }
+        if "hits" in level_slots and selected_category_id == requested_category_id:
+            hits_res, hits_error = outcomes[level_slots["hits"]]
+        else:
+            plan = MultiSearchPlan(self.data_source.index_name)
+            plan.add(self._profile_hits_body(base_must, inherited_must_not, selected_category_level, selected_category_id))
+            hits_res, hits_error = plan.execute(es)[0]
 
-        try:
-            hits_res = es.search(index=index_name, body=hits_body)
-            hits = hits_res.get("hits", {}).get("hits", [])
-        except Exception as exc:
-            return None, f"Error executing hits search: {exc}"
+        if hits_error:
+            return None, f"Error executing hits search: {hits_error}"
+        hits = hits_res.get("hits", {}).get("hits", [])
 
         if not hits:
             return None, "Not found"
@@ -316,48 +282,6 @@ class JournalMetricEngine:
             relative_metrics=None,
         )
 
-        spider_must = list(base_must) + [
-            {"term": {self.data_source.get_index_field_name("category_level"): selected_category_level}}
-        ]
-        if publication_year not in (None, ""):
-            spider_must.append({"term": {"publication_year": normalize_int(publication_year, publication_year)}})
-
-        spider_body = {
-            "size": 0,
-            "query": self._bool_query(spider_must, inherited_must_not),
-            "aggs": {
-                "by_category": {
-                    "terms": {
-                        "field": self.data_source.get_index_field_name("category_id"),
-                        "size": 2000,
-                    },
-                    "aggs": {
-                        "publications_total": {"sum": {"field": self.data_source.get_index_field_name("journal_publications_count")}},
-                        "citations_total": {"sum": {"field": self.data_source.get_index_field_name("journal_citations_total")}},
-                        "citations_mean": {"avg": {"field": self.data_source.get_index_field_name("journal_citations_mean")}},
-                    },
-                }
-            },
-        }
-
-        category_spider = []
-        try:
-            spider_res = es.search(index=index_name, body=spider_body)
-            buckets = spider_res.get("aggregations", {}).get("by_category", {}).get("buckets", [])
-            for b in buckets:
-                cat = b.get("key")
-                if cat:
-                    category_spider.append({
-                        "category": cat,
-                        "publications_total": normalize_int((b.get("publications_total") or {}).get("value")),
-                        "citations_total": normalize_int((b.get("citations_total") or {}).get("value")),
-                        "citations_mean": normalize_float((b.get("citations_mean") or {}).get("value")),
-                    })
-            category_spider.sort(key=lambda x: x.get("publications_total") or 0, reverse=True)
-            category_spider = category_spider[:12]
-        except Exception:
-            pass
-
         snapshots = sorted([self.result_builder.parse_hit(hit) for hit in hits], key=lambda x: x["publication_year"] or 0)
         years = [str(item["publication_year"]) for item in snapshots]
         latest = snapshots[-1] if snapshots else {}
@@ -406,6 +330,128 @@ class JournalMetricEngine:
 
         return result_data, None
 
+    def _plan_profile_level_searches(
+        self,
+        plan: MultiSearchPlan,
+        base_must: List[Dict[str, Any]],
+        must_not: List[Dict[str, Any]],
+        category_level: str,
+        publication_year: str = None,
+        category_id: str = None,
+    ) -> Dict[str, int]:
+        level_must = list(base_must) + [
+            {"term": {self.data_source.get_index_field_name("category_level"): category_level}}
+        ]
+        year_must = list(level_must)
+        if publication_year not in (None, ""):
+            year_must.append({"term": {"publication_year": normalize_int(publication_year, publication_year)}})
+
+        categories_body = {
+            "size": 0,
+            "query": self._bool_query(year_must, must_not),
+            "aggs": {
+                "categories": {
+                    "terms": {
+                        "field": self.data_source.get_index_field_name("category_id"),
+                        "size": 2000,
+                        "order": {"publications_total": "desc"},
+                    },
+                    "aggs": {
+                        "publications_total": {"sum": {"field": self.data_source.get_index_field_name("journal_publications_count")}},
+                    },
+                }
+            },
+        }
+
+        spider_body = {
+            "size": 0,
+            "query": self._bool_query(year_must, must_not),
+            "aggs": {
+                "by_category": {
+                    "terms": {
+                        "field": self.data_source.get_index_field_name("category_id"),
+                        "size": 2000,
+                    },
+                    "aggs": {
+                        "publications_total": {"sum": {"field": self.data_source.get_index_field_name("journal_publications_count")}},
+                        "citations_total": {"sum": {"field": self.data_source.get_index_field_name("journal_citations_total")}},
+                        "citations_mean": {"avg": {"field": self.data_source.get_index_field_name("journal_citations_mean")}},
+                    },
+                }
+            },
+        }
+
+        slots = {
+            "categories": plan.add(categories_body),
+            "spider": plan.add(spider_body),
+        }
+        if category_id:
+            slots["hits"] = plan.add(self._profile_hits_body(base_must, must_not, category_level, category_id))
+        return slots
+
+    def _profile_hits_body(
+        self,
+        base_must: List[Dict[str, Any]],
+        must_not: List[Dict[str, Any]],
+        category_level: str,
+        category_id: str = None,
+    ) -> Dict[str, Any]:
+        data_must = list(base_must) + [
+            {"term": {self.data_source.get_index_field_name("category_level"): category_level}}
+        ]
+        if category_id:
+            data_must.append({"term": {self.data_source.get_index_field_name("category_id"): category_id}})
+
+        return {
+            "size": 1000,
+            "query": self._bool_query(data_must, must_not),
+            "sort": [
+                {"publication_year": {"order": "asc"}},
+                {self.data_source.get_index_field_name("journal_impact_cohort"): {"order": "desc", "missing": "_last"}},
+            ],
+            "collapse": {"field": "publication_year"},
+        }
+
+    def _parse_category_levels(self, outcome: SearchOutcome, category_levels: List[str]) -> List[str]:
+        response, error = outcome
+        if error:
+            return []
+
+        available_category_levels = []
+        buckets = response.get("aggregations", {}).get("category_levels", {}).get("buckets", [])
+        for b in buckets:
+            lvl = str(b.get("key") or "").strip().lower()
+            if lvl in category_levels and lvl not in available_category_levels:
+                available_category_levels.append(lvl)
+        return available_category_levels
+
+    def _parse_available_categories(self, outcome: SearchOutcome) -> List[str]:
+        response, error = outcome
+        if error:
+            return []
+
+        buckets = response.get("aggregations", {}).get("categories", {}).get("buckets", [])
+        return [str(b.get("key")).strip() for b in buckets if b.get("key")]
+
+    def _parse_category_spider(self, outcome: SearchOutcome) -> List[Dict[str, Any]]:
+        response, error = outcome
+        if error:
+            return []
+
+        category_spider = []
+        buckets = response.get("aggregations", {}).get("by_category", {}).get("buckets", [])
+        for b in buckets:
+            cat = b.get("key")
+            if cat:
+                category_spider.append({
+                    "category": cat,
+                    "publications_total": normalize_int((b.get("publications_total") or {}).get("value")),
+                    "citations_total": normalize_int((b.get("citations_total") or {}).get("value")),
+                    "citations_mean": normalize_float((b.get("citations_mean") or {}).get("value")),
+                })
+        category_spider.sort(key=lambda x: x.get("publications_total") or 0, reverse=True)
+        return category_spider[:12]
+
     def resolve_journal_identity(self, es: Any, issn: str, profile_data: Dict[str, Any] = None) -> Dict[str, Any]:
         profile_data = profile_data or {}
         journal_id = str(profile_data.get("journal_id") or "").strip()
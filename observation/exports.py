@@ -0,0 +1,172 @@
+"""
+Export job state shared by every web and Celery worker.
+
+Jobs are stored in the Django cache (Redis in production) and the generated
+CSV files in the default storage, so status and download requests can be
+served by any process.
+"""
+
+import csv
+import io
+import os
+import tempfile
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile, File
+from django.core.files.storage import default_storage
+
+JOB_CACHE_PREFIX = "observation_export_job"
+SLOT_CACHE_PREFIX = "observation_export_slot"
+
+
+def _job_key(job_id):
+    return f"{JOB_CACHE_PREFIX}:{job_id}"
+
+
+def _job_ttl():
+    return getattr(settings, "OBSERVATION_EXPORT_JOB_TTL", 60 * 60 * 24)
+
+
+def create_job(**fields):
+    job_id = str(uuid.uuid4())
+    job = {
+        "id": job_id,
+        "job_type": "file",
+        "status": "queued",
+        "message": "",
+        "progress_percent": 0,
+        "processed_rows": 0,
+        "total_rows": 0,
+        "file_name": "",
+        "file_path": "",
+        "created_at": int(time.time()),
+        "finished_at": None,
+    }
+    job.update(fields)
+    job["id"] = job_id
+    save_job(job)
+    return job
+
+
+def save_job(job):
+    cache.set(_job_key(job["id"]), job, _job_ttl())
+    return job
+
+
+def get_job(job_id):
+    return cache.get(_job_key(job_id))
+
+
+def get_jobs(job_ids):
+    found = cache.get_many([_job_key(job_id) for job_id in job_ids])
+    return [found[_job_key(job_id)] for job_id in job_ids if _job_key(job_id) in found]
+
+
+def update_job(job_id, **changes):
+    job = get_job(job_id)
+    if not job:
+        return None
+    job.update(changes)
+    return save_job(job)
+
+
+def _export_directory():
+    return getattr(settings, "OBSERVATION_EXPORT_STORAGE_DIR", "observation_exports")
+
+
+def save_job_file(job_id, file_name, content):
+    directory = _export_directory()
+    if isinstance(content, str):
+        content = ContentFile(content.encode("utf-8"))
+    elif isinstance(content, bytes):
+        content = ContentFile(content)
+    else:
+        content = File(content)
+    return default_storage.save(f"{directory}/{job_id}/{file_name}", content)
+
+
+def delete_job_files(job_id):
+    """Deletes the stored files of ``job_id``; returns how many were removed."""
+    directory = f"{_export_directory()}/{job_id}"
+    try:
+        _subdirectories, file_names = default_storage.listdir(directory)
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+    for file_name in file_names:
+        default_storage.delete(f"{directory}/{file_name}")
+    try:
+        # Local storage keeps the emptied job directory behind.
+        os.rmdir(default_storage.path(directory))
+    except (NotImplementedError, OSError):
+        pass
+    return len(file_names)
+
+
+def delete_expired_job_files():
+    """
+    Deletes the files of jobs whose state already expired from the cache
+    (OBSERVATION_EXPORT_JOB_TTL), since they can no longer be downloaded.
+    """
+    try:
+        job_ids, _file_names = default_storage.listdir(_export_directory())
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+    active = {job["id"] for job in get_jobs(job_ids)}
+    return sum(delete_job_files(job_id) for job_id in job_ids if job_id not in active)
+
+
+class CsvSpool:
+    """
+    CSV rows written to an anonymous temporary file as they are produced and
+    copied to storage in chunks, so an export never holds the whole file in memory.
+    """
+
+    def __init__(self):
+        self._raw = tempfile.TemporaryFile()
+        self._text = io.TextIOWrapper(self._raw, encoding="utf-8", newline="")
+        self.writer = csv.writer(self._text)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def save(self, job_id, file_name):
+        self._text.flush()
+        self._raw.seek(0)
+        return save_job_file(job_id, file_name, self._raw)
+
+    def close(self):
+        self._text.close()
+
+
+def open_job_file(job):
+    file_path = (job or {}).get("file_path")
+    if not file_path or not default_storage.exists(file_path):
+        return None
+    return default_storage.open(file_path, "rb")
+
+
+def acquire_export_slot(job_id):
+    """
+    Claims one of OBSERVATION_EXPORT_MAX_CONCURRENT slots for ``job_id``.
+
+    Slots are cache keys with a timeout, so a slot held by a killed worker is
+    released once OBSERVATION_EXPORT_SLOT_TIMEOUT expires.
+    """
+    max_concurrent = max(1, int(getattr(settings, "OBSERVATION_EXPORT_MAX_CONCURRENT", 2)))
+    timeout = getattr(settings, "OBSERVATION_EXPORT_SLOT_TIMEOUT", 60 * 60)
+    for slot in range(max_concurrent):
+        slot_key = f"{SLOT_CACHE_PREFIX}:{slot}"
+        if cache.get(slot_key) == job_id or cache.add(slot_key, job_id, timeout=timeout):
+            return slot_key
+    return None
+
+
+def release_export_slot(slot_key, job_id):
+    if slot_key and cache.get(slot_key) == job_id:
+        cache.delete(slot_key)
@@ -0,0 +1,20 @@
+import environ
+
+_env = environ.Env()
+
+# Observation CSV exports run as Celery tasks; job state lives in the cache
+# and the generated files in the default storage.
+OBSERVATION_EXPORT_MAX_CONCURRENT = _env.int("OBSERVATION_EXPORT_MAX_CONCURRENT", default=2)
+OBSERVATION_EXPORT_SLOT_TIMEOUT = _env.int(
+    "OBSERVATION_EXPORT_SLOT_TIMEOUT",
+    default=60 * 60,
+)
+OBSERVATION_EXPORT_RETRY_SECONDS = _env.int("OBSERVATION_EXPORT_RETRY_SECONDS", default=10)
+OBSERVATION_EXPORT_JOB_TTL = _env.int(
+    "OBSERVATION_EXPORT_JOB_TTL",
+    default=60 * 60 * 24,
+)
+OBSERVATION_EXPORT_STORAGE_DIR = _env.str(
+    "OBSERVATION_EXPORT_STORAGE_DIR",
+    default="observation_exports",
+)
@@ -0,0 +1,67 @@
+import logging
+
+from django.conf import settings
+from django.http import QueryDict
+from django.utils import translation
+from django.utils.translation import gettext as _
+
+from config import celery_app
+from observation.exports import (
+    acquire_export_slot,
+    delete_expired_job_files,
+    release_export_slot,
+    update_job,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _sweep_expired_exports():
+    try:
+        delete_expired_job_files()
+    except Exception:
+        logger.exception("Failed to delete expired observation export files")
+
+
+def _wait_for_slot(task, job_id):
+    slot_key = acquire_export_slot(job_id)
+    if slot_key:
+        # Exports also sweep expired files, so storage stays bounded even
+        # without the periodic cleanup task scheduled.
+        _sweep_expired_exports()
+        return slot_key
+    update_job(job_id, status="queued", message=_("Waiting for a free export slot..."))
+    raise task.retry(countdown=getattr(settings, "OBSERVATION_EXPORT_RETRY_SECONDS", 10))
+
+
+@celery_app.task(bind=True, max_retries=None, name="[Observation] Export dimension CSV")
+def run_observation_export(self, job_id, language=None, **kwargs):
+    from observation.views import _run_export_job
+
+    with translation.override(language):
+        slot_key = _wait_for_slot(self, job_id)
+        try:
+            _run_export_job(job_id, **kwargs)
+        finally:
+            release_export_slot(slot_key, job_id)
+
+
+@celery_app.task(bind=True, max_retries=None, name="[Observation] Export dimension CSV files")
+def run_observation_chunked_export(self, batch_job_id, query_string, language=None, **kwargs):
+    from observation.views import _run_chunked_export_async
+
+    with translation.override(language):
+        slot_key = _wait_for_slot(self, batch_job_id)
+        try:
+            _run_chunked_export_async(
+                batch_job_id=batch_job_id,
+                query_source=QueryDict(query_string, mutable=False),
+                **kwargs,
+            )
+        finally:
+            release_export_slot(slot_key, batch_job_id)
+
+
+@celery_app.task(name="[Observation] Delete expired export files")
+def delete_expired_observation_exports():
+    return delete_expired_job_files()
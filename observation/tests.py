@@ -1,2 +1,175 @@
-from django.test import TestCase
+import tempfile
+from unittest.mock import Mock, patch
 
+from celery.exceptions import Retry
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.test import RequestFactory, TestCase, override_settings
+
+from observation import views
+from observation.exports import acquire_export_slot, delete_expired_job_files, get_job, save_job_file
+from observation.tasks import _wait_for_slot, run_observation_export
+
+DIMENSION = {"slug": "country", "menu_label": "Country", "row_label": "Country"}
+TABLE_RESULT = {
+    "columns": ["2020", "2021"],
+    "rows": [{"key": "BR", "label": "Brazil", "values": {"2020": 3, "2021": 5}}],
+}
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    OBSERVATION_EXPORT_MAX_CONCURRENT=1,
+)
+class ObservationExportJobTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        media_override = override_settings(MEDIA_ROOT=media_root.name)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+        self.factory = RequestFactory()
+
+    def _task_kwargs(self, job_id):
+        return {
+            "job_id": job_id,
+            "query_string": "page_id=1",
+            "index_name": "scientific_production",
+            "dimension": DIMENSION,
+            "progress_step": 100,
+        }
+
+    @patch("observation.views._build_dimension_table_result", return_value=TABLE_RESULT)
+    @patch("observation.views.SearchGatewayService")
+    def test_export_task_stores_file_served_by_download(self, _service, _table):
+        job = views._store_pending_csv_job(dimension=DIMENSION, file_name="export.csv", message="")
+
+        run_observation_export.apply(kwargs=self._task_kwargs(job["id"]))
+
+        status = views.export_status(self.factory.get("/"), job["id"])
+        self.assertIn(b'"status": "done"', status.content)
+        response = views.export_download(self.factory.get("/"), job["id"])
+        content = b"".join(response.streaming_content).decode("utf-8")
+        self.assertEqual(content.splitlines(), ["Country,2020,2021", "Brazil,3,5"])
+        self.assertIsNone(cache.get("observation_export_slot:0"))
+
+    @patch("observation.views._iter_dimension_table_pages_all_rows")
+    @patch("observation.views.SearchGatewayService")
+    def test_all_rows_export_writes_pages_as_they_arrive(self, _service, iter_pages):
+        years = views._observation_year_columns()
+        pages = [
+            [{"key": "BR", "label": "Brazil", "values": {year: 1 for year in years}}],
+            [{"key": "AR", "label": "Argentina", "values": {year: 2 for year in years}}],
+        ]
+        iter_pages.return_value = iter(pages)
+        job = views._store_pending_csv_job(dimension=DIMENSION, file_name="all.csv", message="")
+
+        run_observation_export.apply(kwargs={**self._task_kwargs(job["id"]), "export_scope": "all"})
+
+        finished = get_job(job["id"])
+        self.assertEqual((finished["status"], finished["total_rows"]), ("done", 2))
+        response = views.export_download(self.factory.get("/"), job["id"])
+        lines = b"".join(response.streaming_content).decode("utf-8").splitlines()
+        self.assertEqual(lines[0], ",".join(["Country"] + years))
+        self.assertEqual([line.split(",")[0] for line in lines[1:]], ["Brazil", "Argentina"])
+
+    def test_expired_job_files_are_deleted(self):
+        active = views._store_pending_csv_job(dimension=DIMENSION, file_name="active.csv", message="")
+        active_path = save_job_file(active["id"], "active.csv", "a,b\n")
+        expired_path = save_job_file("expired-job", "expired.csv", "a,b\n")
+
+        deleted = delete_expired_job_files()
+
+        self.assertEqual(deleted, 1)
+        self.assertTrue(default_storage.exists(active_path))
+        self.assertFalse(default_storage.exists(expired_path))
+        self.assertEqual(delete_expired_job_files(), 0)
+
+    def test_export_task_waits_for_a_free_slot(self):
+        job = views._store_pending_csv_job(dimension=DIMENSION, file_name="export.csv", message="")
+        acquire_export_slot("another-job")
+        task = Mock()
+        task.retry.side_effect = Retry()
+
+        with self.assertRaises(Retry):
+            _wait_for_slot(task, job["id"])
+
+        task.retry.assert_called_once_with(countdown=10)
+        self.assertEqual(get_job(job["id"])["message"], "Waiting for a free export slot...")
+        self.assertIsNone(acquire_export_slot(job["id"]))
+
+    @patch("observation.views.run_observation_export")
+    @patch("observation.views._resolve_observation_dimension", return_value=DIMENSION)
+    @patch("observation.views.SearchGatewayService")
+    def test_export_start_enqueues_task_instead_of_thread(self, _service, _dimension, export_task):
+        response = views.export_start(self.factory.get("/", {"page_id": "1"}))
+
+        self.assertEqual(response.status_code, 200)
+        export_task.apply_async.assert_called_once()
+        job_id = export_task.apply_async.call_args.kwargs["kwargs"]["job_id"]
+        self.assertEqual(get_job(job_id)["status"], "queued")
+
+    def test_download_of_unfinished_job_is_rejected(self):
+        job = views._store_pending_csv_job(dimension=DIMENSION, file_name="export.csv", message="")
+
+        response = views.export_download(self.factory.get("/"), job["id"])
+
+        self.assertEqual(response.status_code, 409)
+
+
+class DimensionTableFieldResolutionTests(TestCase):
+    @patch("observation.views.extract_applied_filters", return_value={})
+    @patch("observation.views.resolve_aggregatable_candidates")
+    def test_empty_result_runs_a_single_aggregation_on_the_resolved_fields(self, resolve, _filters):
+        resolve.side_effect = lambda client, index_name, candidates: [f"{candidates[0]}.keyword"]
+        service = Mock()
+        service.data_source.field_settings_dict = {
+            "country": {"index_field_name": "country"},
+            "publication_year": {"index_field_name": "publication_year"},
+        }
+        service.search_aggregation.return_value = {"columns": [], "rows": [], "grand_total": 0}
+        service.client.search.return_value = {"aggregations": {"row_total": {"value": 0}}}
+
+        result = views._build_dimension_table_result(
+            {},
+            service,
+            {"slug": "country", "value_metric": "documents"},
+        )
+
+        self.assertEqual(result["rows"], [])
+        service.search_aggregation.assert_called_once()
+        aggs = service.search_aggregation.call_args.kwargs["aggs"]
+        self.assertEqual(aggs["by_row"]["terms"]["field"], "country.keyword")
+        self.assertEqual(
+            [call.args[2] for call in resolve.call_args_list],
+            [["country", "country"], ["publication_year", "publication_year"]],
+        )
+
+    @patch("observation.views.extract_applied_filters", return_value={})
+    @patch("observation.views.resolve_aggregatable_candidates")
+    def test_text_field_is_retried_once_with_keyword_variant(self, resolve, _filters):
+        resolve.side_effect = lambda client, index_name, candidates: list(candidates)
+        service = Mock()
+        service.data_source.field_settings_dict = {
+            "country": {"index_field_name": "country"},
+            "publication_year": {"index_field_name": "publication_year"},
+        }
+        fielddata_error = Exception(
+            "illegal_argument_exception: Text fields are not optimised for operations that require "
+            "per-document field data like aggregations and sorting, so these operations are disabled "
+            "by default. Please use a keyword field instead. Alternatively, set fielddata=true on "
+            "[country] in order to load field data by uninverting the inverted index."
+        )
+        service.search_aggregation.side_effect = [
+            fielddata_error,
+            {"columns": [], "rows": [], "grand_total": 0},
+        ]
+        service.client.search.return_value = {"aggregations": {"row_total": {"value": 0}}}
+
+        views._build_dimension_table_result({}, service, {"slug": "country", "value_metric": "documents"})
+
+        self.assertEqual(service.search_aggregation.call_count, 2)
+        aggs = service.search_aggregation.call_args.kwargs["aggs"]
+        self.assertEqual(aggs["by_row"]["terms"]["field"], "country.keyword")
+        self.assertEqual(aggs["by_row"]["aggs"]["by_col"]["terms"]["field"], "publication_year")
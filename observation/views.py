@@ -4,26 +4,38 @@ No changes to the search application.
 """
 import json
 import logging
+import re
 import traceback
 import time
-import uuid
 import builtins
-import threading
 from copy import deepcopy
+from functools import partial
 from io import StringIO
 import csv
 
 from django.conf import settings
-from django.http import HttpResponse, JsonResponse
+from django.http import FileResponse, HttpResponse, JsonResponse
+from django.utils.translation import get_language
 from django.utils.translation import gettext as _
 from django.views.decorators.http import require_GET
 
+from observation.exports import (
+    CsvSpool,
+    create_job,
+    get_job,
+    get_jobs,
+    open_job_file,
+    save_job,
+    update_job,
+)
 from observation.models import ObservationPage
+from observation.tasks import run_observation_chunked_export, run_observation_export
 from observation.dimension_groups import (
     dimension_value_metric,
     normalize_dimension_level,
     resolve_journal_cardinality_field,
 )
+from search_gateway.field_resolution import resolve_aggregatable_candidates
 from search_gateway.filter_mapping import get_mapped_filters
 from search_gateway.query import build_bool_query_from_search_params
 from search_gateway.request_filters import (
@@ -37,8 +49,6 @@ logger = logging.getLogger(__name__)
 OBSERVATION_SEARCH_FORM_KEY = "search"
 OBSERVATION_YEAR_START = 2019
 OBSERVATION_YEAR_END = 2025
-EXPORT_JOBS = {}
-EXPORT_JOBS_LOCK = threading.Lock()
 
 
 def _get_index_name(request):
@@ -169,19 +179,14 @@ def _composite_col_agg(col_field, col_size, value_metric, journal_field):
     return col_agg
 
 
-def _expand_agg_field_candidates(candidates):
-    expanded = []
-    for candidate in candidates:
-        cleaned = str(candidate or "").strip()
-        if not cleaned:
-            continue
-        variants = [cleaned]
-        if not cleaned.endswith(".keyword"):
-            variants.append(f"{cleaned}.keyword")
-        for variant in variants:
-            if variant not in expanded:
-                expanded.append(variant)
-    return expanded
+def _resolve_agg_field(service, configured_field, field_name):
+    """First aggregatable field for a dimension axis, resolved once from the mapping."""
+    candidates = resolve_aggregatable_candidates(
+        service.client,
+        service.index_name,
+        [configured_field, field_name],
+    )
+    return candidates[0] if candidates else None
 
 
 def _is_text_fielddata_error(exc):
@@ -192,6 +197,30 @@ def _is_text_fielddata_error(exc):
     )
 
 
+def _keyword_retry_fields(exc, row_field, col_field):
+    """
+    Row and column fields to retry once with after a text fielddata error,
+    which happens when the mapping could not be read to resolve them. Returns
+    None when the error is another one or there is nothing left to switch.
+    """
+    if not _is_text_fielddata_error(exc):
+        return None
+    match = re.search(r"fielddata=true on \[([^\]]+)\]", str(exc))
+    text_field = match.group(1) if match else row_field
+    fields = tuple(
+        f"{field}.keyword" if field == text_field and not field.endswith(".keyword") else field
+        for field in (row_field, col_field)
+    )
+    if fields == (row_field, col_field):
+        return None
+    logger.info(
+        "Retrying observation aggregation with keyword field: row=%s col=%s",
+        fields[0],
+        fields[1],
+    )
+    return fields
+
+
 def _resolve_observation_dimension(request):
     page_id = request.GET.get("page_id")
     dimension_slug = request.GET.get("dimension_slug")
@@ -462,70 +491,42 @@ def _build_dimension_table_result(query_source, service, dimension):
             parse_config=parse_config,
         )
 
-    row_candidates = _expand_agg_field_candidates(
-        [row_field, row_field_name, "author_country_codes", "country"]
-    )
-    col_candidates = _expand_agg_field_candidates(
-        [col_field, col_field_name, "publication_year"]
-    )
-
-    result = {"columns": [], "rows": [], "grand_total": 0}
-    used_pair = None
-    for row_candidate in row_candidates:
-        for col_candidate in col_candidates:
-            try:
-                candidate_result = _run_aggregation(row_candidate, col_candidate)
-            except Exception as exc:
-                if _is_text_fielddata_error(exc):
-                    logger.info(
-                        "Skipping aggregation candidate pair row=%s col=%s due to text fielddata restriction",
-                        row_candidate,
-                        col_candidate,
-                    )
-                    continue
-                raise
-            if (candidate_result.get("rows") or []):
-                result = candidate_result
-                used_pair = (row_candidate, col_candidate)
-                break
-            if not result.get("rows"):
-                result = candidate_result
-        if used_pair:
-            break
-    if used_pair and (used_pair[0] != row_field or used_pair[1] != col_field):
-        logger.info(
-            "Observation export/table fallback fields in use: row=%s col=%s (configured row=%s col=%s)",
-            used_pair[0],
-            used_pair[1],
-            row_field,
-            col_field,
-        )
+    row_field = _resolve_agg_field(service, row_field, row_field_name)
+    col_field = _resolve_agg_field(service, col_field, col_field_name)
+    try:
+        result = _run_aggregation(row_field, col_field)
+    except Exception as exc:
+        retry_fields = _keyword_retry_fields(exc, row_field, col_field)
+        if not retry_fields:
+            raise
+        row_field, col_field = retry_fields
+        result = _run_aggregation(row_field, col_field)
     result["row_total"] = _estimate_dimension_row_total(
         service,
         query_text=text_search,
         query_clauses=query_clauses,
         selected_filters=selected_filters,
-        row_field=(used_pair[0] if used_pair else row_field),
+        row_field=row_field,
     )
     labeled_result = _apply_lookup_labels_to_rows(
         service,
         row_field_name,
         result,
-        row_index_field=(used_pair[0] if used_pair else row_field),
+        row_index_field=row_field,
     )
     return _normalize_year_columns_result(labeled_result)
 
 
-def _build_dimension_table_result_all_rows(
+def _iter_dimension_table_pages_all_rows(
     query_source,
     service,
     dimension,
     split_size=1000,
-    progress_callback=None,
 ):
     """
-    Build the same row/column structure used by the table, but paginating all row buckets
-    with composite aggregation so exports are not capped by terms size.
+    Yield the table rows page by page, paginating all row buckets with a
+    composite aggregation so exports are neither capped by terms size nor held
+    in memory. Each page already carries lookup labels and the year columns.
     """
     applied_filters = extract_applied_filters(
         query_source,
@@ -561,135 +562,75 @@ def _build_dimension_table_result_all_rows(
         filters=mapped_filters,
     )
 
-    row_transform = row_cfg.get("settings", {}).get("display_transform")
-
-    def _col_sort_key(key):
-        try:
-            return (0, int(key))
-        except (TypeError, ValueError):
-            return (1, str(key))
-
-    row_candidates = _expand_agg_field_candidates(
-        [configured_row_field, row_field_name, "author_country_codes", "country"]
-    )
-    col_candidates = _expand_agg_field_candidates(
-        [configured_col_field, col_field_name, "publication_year"]
-    )
+    row_field = _resolve_agg_field(service, configured_row_field, row_field_name)
+    col_field = _resolve_agg_field(service, configured_col_field, col_field_name)
+    if not row_field or not col_field:
+        return
 
     page_size = max(100, int(split_size or 1000))
-    best_result = {"columns": [], "rows": [], "grand_total": 0}
-    used_pair = None
-    processed_rows = 0
-
-    for row_field in row_candidates:
-        for col_field in col_candidates:
-            after_key = None
-            rows = []
-            col_keys = set()
-            grand_total = 0
-            try:
-                while True:
-                    composite = {
-                        "size": page_size,
-                        "sources": [{"row_key": {"terms": {"field": row_field}}}],
-                    }
-                    if after_key:
-                        composite["after"] = after_key
-                    aggs = {
-                        "by_row": {
-                            "composite": composite,
-                            "aggs": {
-                                "by_col": _composite_col_agg(
-                                    col_field,
-                                    col_size,
-                                    value_metric,
-                                    journal_field,
-                                ),
-                            },
-                        }
-                    }
-                    body = {
-                        "size": 0,
-                        "track_total_hits": True,
-                        "query": {"bool": bool_query},
-                        "aggs": aggs,
-                    }
-                    response = service.client.search(
-                        index=service.index_name,
-                        body=body,
-                        request_cache=True,
-                        request_timeout=service.request_timeout,
-                    )
-                    row_agg = (response.get("aggregations") or {}).get("by_row") or {}
-                    buckets = row_agg.get("buckets") or []
-                    if not buckets:
-                        break
-                    for rb in buckets:
-                        raw_key = ((rb.get("key") or {}).get("row_key"))
-                        if row_transform:
-                            label = raw_key
-                        else:
-                            label = raw_key
-                        values = {}
-                        for cb in (rb.get("by_col") or {}).get("buckets", []) or []:
-                            ck = cb.get("key")
-                            if ck is None:
-                                continue
-                            values[str(ck)] = _cell_count_from_bucket(cb, value_metric)
-                            col_keys.add(ck)
-                        rows.append({"key": raw_key, "label": label, "values": values})
-                        if value_metric != "journals":
-                            grand_total += int(rb.get("doc_count") or 0)
-                        processed_rows += 1
-                    if callable(progress_callback):
-                        progress_callback(processed_rows)
-                    after_key = row_agg.get("after_key")
-                    if not after_key:
-                        break
-            except Exception as exc:
-                if _is_text_fielddata_error(exc):
-                    logger.info(
-                        "Skipping composite aggregation candidate pair row=%s col=%s due to text fielddata restriction",
-                        row_field,
+    after_key = None
+    while True:
+        composite = {
+            "size": page_size,
+            "sources": [{"row_key": {"terms": {"field": row_field}}}],
+        }
+        if after_key:
+            composite["after"] = after_key
+        aggs = {
+            "by_row": {
+                "composite": composite,
+                "aggs": {
+                    "by_col": _composite_col_agg(
                         col_field,
-                    )
-                    continue
+                        col_size,
+                        value_metric,
+                        journal_field,
+                    ),
+                },
+            }
+        }
+        body = {
+            "size": 0,
+            "query": {"bool": bool_query},
+            "aggs": aggs,
+        }
+        try:
+            response = service.client.search(
+                index=service.index_name,
+                body=body,
+                request_cache=True,
+                request_timeout=service.request_timeout,
+            )
+        except Exception as exc:
+            retry_fields = None if after_key else _keyword_retry_fields(exc, row_field, col_field)
+            if not retry_fields:
                 raise
-
-            columns = [str(c) for c in sorted(col_keys, key=_col_sort_key)]
-            if value_metric == "journals" and journal_field:
-                grand_total = _estimate_grand_total_journals(
-                    service,
-                    query_text=text_search,
-                    query_clauses=query_clauses,
-                    selected_filters=selected_filters,
-                    journal_field=journal_field,
-                )
-            candidate_result = {"columns": columns, "rows": rows, "grand_total": grand_total}
-            if rows:
-                used_pair = (row_field, col_field)
-                best_result = candidate_result
-                break
-            if not best_result.get("rows"):
-                best_result = candidate_result
-        if used_pair:
-            break
-
-    if used_pair and (used_pair[0] != configured_row_field or used_pair[1] != configured_col_field):
-        logger.info(
-            "Observation export(all rows) fallback fields in use: row=%s col=%s (configured row=%s col=%s)",
-            used_pair[0],
-            used_pair[1],
-            configured_row_field,
-            configured_col_field,
+            row_field, col_field = retry_fields
+            continue
+        row_agg = (response.get("aggregations") or {}).get("by_row") or {}
+        buckets = row_agg.get("buckets") or []
+        if not buckets:
+            return
+        rows = []
+        for rb in buckets:
+            raw_key = ((rb.get("key") or {}).get("row_key"))
+            values = {}
+            for cb in (rb.get("by_col") or {}).get("buckets", []) or []:
+                ck = cb.get("key")
+                if ck is None:
+                    continue
+                values[str(ck)] = _cell_count_from_bucket(cb, value_metric)
+            rows.append({"key": raw_key, "label": raw_key, "values": values})
+        rows = _resolve_lookup_labels_for_export_rows(
+            service,
+            row_field_name,
+            rows,
+            row_index_field=row_field,
         )
-    labeled_result = _apply_lookup_labels_to_rows(
-        service,
-        row_field_name,
-        best_result,
-        row_index_field=(used_pair[0] if used_pair else configured_row_field),
-    )
-    return _normalize_year_columns_result(labeled_result)
+        yield _normalize_year_columns_result({"rows": rows})["rows"]
+        after_key = row_agg.get("after_key")
+        if not after_key:
+            return
 
 
 def _job_snapshot(job):
@@ -724,18 +665,14 @@ def _run_export_job(
     query_string,
     index_name,
     dimension,
-    batch_size,
     progress_step,
     export_scope="current",
     split_size=1000,
 ):
     stage = "initializing"
-    job = EXPORT_JOBS.get(job_id)
+    job = update_job(job_id, status="running", message=_("Preparing CSV data..."))
     if not job:
         return
-    job["status"] = "running"
-    job["message"] = _("Preparing CSV data...")
-    EXPORT_JOBS[job_id] = job
 
     try:
         from django.http import QueryDict
@@ -749,237 +686,187 @@ def _run_export_job(
 
         stage = "build_table_result"
         scope_is_all = str(export_scope or "current").strip().lower() == "all"
-        discovery_pages = {"count": 0}
-
-        def _update_discovery_progress(discovered_rows):
-            if not scope_is_all:
-                return
-            if discovered_rows <= 0:
-                return
-            discovery_pages["count"] += 1
-            # Keep discovery phase under 70%, then writing phase fills to 100%.
-            discovery_progress = min(70, 5 + (discovery_pages["count"] * 2))
-            current = EXPORT_JOBS.get(job_id)
-            if not current:
-                return
-            current["processed_rows"] = int(discovered_rows)
-            current["total_rows"] = max(int(discovered_rows), int(current.get("total_rows") or 0))
-            current["progress_percent"] = max(int(current.get("progress_percent") or 0), discovery_progress)
-            current["message"] = _("Collecting rows for single CSV... %(rows)s") % {
-                "rows": discovered_rows,
-            }
-            EXPORT_JOBS[job_id] = current
-
-        if str(export_scope or "current").strip().lower() == "all":
-            result = _build_dimension_table_result_all_rows(
-                request_get,
-                service,
-                dimension,
-                split_size=split_size,
-                progress_callback=_update_discovery_progress,
-            )
-        else:
-            result = _build_dimension_table_result(request_get, service, dimension)
-        stage = "extract_rows"
-        columns = tuple(result.get("columns") or [])
-        rows = tuple(result.get("rows") or [])
-        total_rows = len(rows)
-
-        job = EXPORT_JOBS[job_id]
-        job["total_rows"] = total_rows
-        job["processed_rows"] = 0
-        job["progress_percent"] = 0
-        job["message"] = _("Formatting CSV...")
-        EXPORT_JOBS[job_id] = job
-
-        stage = "prepare_csv"
-        output = StringIO()
-        writer = csv.writer(output)
-        row_label = dimension.get("row_label") or _("Row")
-        if columns:
-            writer.writerow([row_label] + builtins.list(columns))
-        else:
-            writer.writerow([row_label, _("Message")])
-            if total_rows == 0:
-                writer.writerow(["-", _("No data returned for selected dimension and filters")])
-
-        stage = "write_csv_rows"
-        processed = 0
         step = max(1, int(progress_step or 100))
-        chunk_size = max(1, int(batch_size or 1000))
-        for chunk_start in range(0, total_rows, chunk_size):
-            chunk = rows[chunk_start:chunk_start + chunk_size]
-            for row in chunk:
-                values = row.get("values") or {}
-                writer.writerow(
-                    [row.get("label") or row.get("key") or ""]
-                    + [values.get(col, 0) for col in columns]
+
+        with CsvSpool() as spool:
+            if scope_is_all:
+                stage = "write_csv_pages"
+                columns = _observation_year_columns()
+                spool.writer.writerow(_csv_header_row(dimension, columns))
+                total_rows = 0
+                pages = 0
+                for page_rows in _iter_dimension_table_pages_all_rows(
+                    request_get,
+                    service,
+                    dimension,
+                    split_size=split_size,
+                ):
+                    spool.writer.writerows(_csv_data_row(row, columns) for row in page_rows)
+                    total_rows += len(page_rows)
+                    pages += 1
+                    update_job(
+                        job_id,
+                        processed_rows=total_rows,
+                        total_rows=total_rows,
+                        progress_percent=min(95, 5 + (pages * 2)),
+                        message=_("Collecting rows for single CSV... %(rows)s") % {
+                            "rows": total_rows,
+                        },
+                    )
+            else:
+                result = _build_dimension_table_result(request_get, service, dimension)
+                stage = "extract_rows"
+                columns = tuple(result.get("columns") or [])
+                rows = tuple(result.get("rows") or [])
+                total_rows = len(rows)
+
+                update_job(
+                    job_id,
+                    total_rows=total_rows,
+                    processed_rows=0,
+                    progress_percent=0,
+                    message=_("Formatting CSV..."),
                 )
-                processed += 1
-                if processed % step == 0 or processed == total_rows:
-                    current = EXPORT_JOBS[job_id]
-                    current["processed_rows"] = processed
-                    if scope_is_all:
-                        current["progress_percent"] = 70 + int((processed * 30) / max(total_rows, 1))
-                    else:
-                        current["progress_percent"] = int((processed * 100) / max(total_rows, 1))
-                    current["message"] = _("Generating CSV... %(processed)s/%(total)s") % {
-                        "processed": processed,
-                        "total": total_rows,
-                    }
-                    EXPORT_JOBS[job_id] = current
-            time.sleep(0.01)
+
+                stage = "write_csv_rows"
+                if columns:
+                    spool.writer.writerow(_csv_header_row(dimension, columns))
+                else:
+                    spool.writer.writerow(_csv_header_row(dimension, [_("Message")]))
+                    if total_rows == 0:
+                        spool.writer.writerow(["-", _("No data returned for selected dimension and filters")])
+
+                for processed, row in enumerate(rows, start=1):
+                    spool.writer.writerow(_csv_data_row(row, columns))
+                    if processed % step == 0 or processed == total_rows:
+                        update_job(
+                            job_id,
+                            processed_rows=processed,
+                            progress_percent=int((processed * 100) / max(total_rows, 1)),
+                            message=_("Generating CSV... %(processed)s/%(total)s") % {
+                                "processed": processed,
+                                "total": total_rows,
+                            },
+                        )
+
+            stage = "store_csv"
+            file_path = spool.save(job_id, job.get("file_name") or "observation.csv")
 
         stage = "finalize_job"
-        done = EXPORT_JOBS[job_id]
-        done["status"] = "done"
-        done["csv_content"] = output.getvalue()
-        done["processed_rows"] = total_rows
-        done["progress_percent"] = 100
-        done["message"] = _("CSV ready (%(rows)s rows)") % {"rows": total_rows}
-        done["finished_at"] = int(time.time())
-        EXPORT_JOBS[job_id] = done
+        update_job(
+            job_id,
+            status="done",
+            file_path=file_path,
+            processed_rows=total_rows,
+            progress_percent=100,
+            message=_("CSV ready (%(rows)s rows)") % {"rows": total_rows},
+            finished_at=int(time.time()),
+        )
     except Exception as exc:
         logger.exception("Observation export failed: %s", exc)
-        failed = EXPORT_JOBS.get(job_id)
-        if not failed:
-            return
-        failed["status"] = "error"
-        failed["message"] = f"{type(exc).__name__} at {stage}: {exc}"
-        failed["debug"] = traceback.format_exc(limit=6)
-        failed["finished_at"] = int(time.time())
-        EXPORT_JOBS[job_id] = failed
+        update_job(
+            job_id,
+            status="error",
+            message=f"{type(exc).__name__} at {stage}: {exc}",
+            debug=traceback.format_exc(limit=6),
+            finished_at=int(time.time()),
+        )
+
+
+def _job_dimension_fields(dimension):
+    slug = dimension.get("slug") or ""
+    return {
+        "dimension_slug": slug,
+        "dimension_label": dimension.get("menu_label") or slug or _("Dimension"),
+    }
 
 
 def _store_done_csv_job(
     *,
     dimension,
     file_name,
-    csv_content,
+    write_csv,
     total_rows,
     parent_id=None,
     sequence=None,
     range_start=None,
     range_end=None,
 ):
-    job_id = str(uuid.uuid4())
-    slug = dimension.get("slug") or ""
-    label = dimension.get("menu_label") or slug or _("Dimension")
-    safe_csv_content = csv_content
-    if not isinstance(safe_csv_content, str) or not safe_csv_content.strip():
-        fallback = StringIO()
-        fallback_writer = csv.writer(fallback)
-        fallback_writer.writerow([_("Message")])
-        fallback_writer.writerow([_("No data available for export")])
-        safe_csv_content = fallback.getvalue()
-    with EXPORT_JOBS_LOCK:
-        EXPORT_JOBS[job_id] = {
-        "id": job_id,
-        "job_type": "file",
-        "parent_id": parent_id,
-        "sequence": sequence,
-        "range_start": range_start,
-        "range_end": range_end,
-        "status": "done",
-        "message": _("CSV ready (%(rows)s rows)") % {"rows": total_rows},
-        "progress_percent": 100,
-        "processed_rows": total_rows,
-        "total_rows": total_rows,
-        "file_name": file_name,
-        "dimension_slug": slug,
-        "dimension_label": label,
-        "created_at": int(time.time()),
-        "finished_at": int(time.time()),
-        "csv_content": safe_csv_content,
-        }
-        return _job_snapshot(EXPORT_JOBS[job_id])
+    job = create_job(
+        job_type="file",
+        parent_id=parent_id,
+        sequence=sequence,
+        range_start=range_start,
+        range_end=range_end,
+        status="running",
+        message=_("CSV ready (%(rows)s rows)") % {"rows": total_rows},
+        progress_percent=100,
+        processed_rows=total_rows,
+        total_rows=total_rows,
+        file_name=file_name,
+        **_job_dimension_fields(dimension),
+    )
+    with CsvSpool() as spool:
+        write_csv(spool.writer)
+        file_path = spool.save(job["id"], file_name)
+    job = update_job(
+        job["id"],
+        status="done",
+        file_path=file_path,
+        finished_at=int(time.time()),
+    )
+    return _job_snapshot(job)
 
 
 def _store_pending_csv_job(*, dimension, file_name, message):
-    job_id = str(uuid.uuid4())
-    slug = dimension.get("slug") or ""
-    label = dimension.get("menu_label") or slug or _("Dimension")
-    with EXPORT_JOBS_LOCK:
-        EXPORT_JOBS[job_id] = {
-            "id": job_id,
-            "job_type": "file",
-            "status": "queued",
-            "message": message,
-            "progress_percent": 0,
-            "processed_rows": 0,
-            "total_rows": 0,
-            "file_name": file_name,
-            "dimension_slug": slug,
-            "dimension_label": label,
-            "created_at": int(time.time()),
-            "finished_at": None,
-            "csv_content": "",
-        }
-        return _job_snapshot(EXPORT_JOBS[job_id])
+    job = create_job(
+        job_type="file",
+        status="queued",
+        message=message,
+        file_name=file_name,
+        **_job_dimension_fields(dimension),
+    )
+    return _job_snapshot(job)
 
 
 def _store_error_job(*, dimension, message, debug=""):
-    job_id = str(uuid.uuid4())
-    slug = dimension.get("slug") or ""
-    label = dimension.get("menu_label") or slug or _("Dimension")
-    with EXPORT_JOBS_LOCK:
-        EXPORT_JOBS[job_id] = {
-        "id": job_id,
-        "job_type": "file",
-        "status": "error",
-        "message": message,
-        "progress_percent": 0,
-        "processed_rows": 0,
-        "total_rows": 0,
-        "file_name": "",
-        "dimension_slug": slug,
-        "dimension_label": label,
-        "created_at": int(time.time()),
-        "finished_at": int(time.time()),
-        "csv_content": "",
-        "debug": debug or "",
-        }
-        return _job_snapshot(EXPORT_JOBS[job_id])
+    job = create_job(
+        job_type="file",
+        status="error",
+        message=message,
+        finished_at=int(time.time()),
+        debug=debug or "",
+        **_job_dimension_fields(dimension),
+    )
+    return _job_snapshot(job)
 
 
 def _store_batch_job(*, dimension, message):
-    job_id = str(uuid.uuid4())
-    slug = dimension.get("slug") or ""
-    label = dimension.get("menu_label") or slug or _("Dimension")
-    with EXPORT_JOBS_LOCK:
-        EXPORT_JOBS[job_id] = {
-            "id": job_id,
-            "job_type": "batch",
-            "status": "running",
-            "message": message,
-            "progress_percent": 0,
-            "processed_rows": 0,
-            "total_rows": 0,
-            "file_name": "",
-            "dimension_slug": slug,
-            "dimension_label": label,
-            "created_at": int(time.time()),
-            "finished_at": None,
-            "csv_content": "",
-            "ready_file_ids": [],
-        }
-        return _job_snapshot(EXPORT_JOBS[job_id])
+    job = create_job(
+        job_type="batch",
+        status="queued",
+        message=message,
+        ready_file_ids=[],
+        **_job_dimension_fields(dimension),
+    )
+    return _job_snapshot(job)
 
 
-def _build_csv_content(*, dimension, columns, rows):
-    output = StringIO()
-    writer = csv.writer(output)
-    row_label = dimension.get("row_label") or _("Row")
+def _csv_header_row(dimension, columns):
+    return [dimension.get("row_label") or _("Row")] + builtins.list(columns)
+
+
+def _csv_data_row(row, columns):
+    values = row.get("values") or {}
+    return [row.get("label") or row.get("key") or ""] + [values.get(col, 0) for col in columns]
+
+
+def _write_csv_content(writer, *, dimension, columns, rows):
     if columns:
-        writer.writerow([row_label] + builtins.list(columns))
-        for row in rows:
-            values = row.get("values") or {}
-            writer.writerow(
-                [row.get("label") or row.get("key") or ""]
-                + [values.get(col, 0) for col in columns]
-            )
+        writer.writerow(_csv_header_row(dimension, columns))
+        writer.writerows(_csv_data_row(row, columns) for row in rows)
     elif rows:
-        writer.writerow([row_label, _("Total")])
+        writer.writerow(_csv_header_row(dimension, [_("Total")]))
         for row in rows:
             values = row.get("values") or {}
             total = 0
@@ -990,9 +877,8 @@ def _build_csv_content(*, dimension, columns, rows):
                     continue
             writer.writerow([row.get("label") or row.get("key") or "", total])
     else:
-        writer.writerow([row_label, _("Message")])
+        writer.writerow(_csv_header_row(dimension, [_("Message")]))
         writer.writerow(["-", _("No data returned for selected dimension and filters")])
-    return output.getvalue()
 
 
 def _normalize_csv_value(value):
@@ -1003,13 +889,11 @@ def _normalize_csv_value(value):
     return json.dumps(value, ensure_ascii=False)
 
 
-def _build_documents_csv_content(rows):
-    output = StringIO()
-    writer = csv.writer(output)
+def _write_documents_csv_content(writer, rows):
     if not rows:
         writer.writerow([_("Message")])
         writer.writerow([_("No documents returned for selected dimension and filters")])
-        return output.getvalue()
+        return
 
     header_keys = []
     seen = set()
@@ -1020,9 +904,10 @@ def _build_documents_csv_content(rows):
                 header_keys.append(str(key))
 
     writer.writerow(header_keys)
-    for source in rows:
-        writer.writerow([_normalize_csv_value(source.get(key)) for key in header_keys])
-    return output.getvalue()
+    writer.writerows(
+        [_normalize_csv_value(source.get(key)) for key in header_keys]
+        for source in rows
+    )
 
 
 def _build_document_export_jobs(*, dimension, query_source, index_name, split_size):
@@ -1071,13 +956,12 @@ def _build_document_export_jobs(*, dimension, query_source, index_name, split_si
             if not hits:
                 break
             sources = [hit.get("_source") or {} for hit in hits]
-            csv_content = _build_documents_csv_content(sources)
             file_name = f"observation_{file_slug}_{int(time.time())}_part_{part_idx:03d}.csv"
             jobs.append(
                 _store_done_csv_job(
                     dimension=dimension,
                     file_name=file_name,
-                    csv_content=csv_content,
+                    write_csv=partial(_write_documents_csv_content, rows=sources),
                     total_rows=len(sources),
                     sequence=part_idx,
                     range_start=((part_idx - 1) * split_size) + 1,
@@ -1103,6 +987,9 @@ def _build_document_export_jobs(*, dimension, query_source, index_name, split_si
 
 
 def _run_chunked_export_async(*, batch_job_id, dimension, query_source, index_name, split_size):
+    if not update_job(batch_job_id, status="running"):
+        return
+
     try:
         service = SearchGatewayService(index_name=index_name)
         data_source = service.data_source
@@ -1142,16 +1029,10 @@ def _run_chunked_export_async(*, batch_job_id, dimension, query_source, index_na
         if value_metric == "journals":
             journal_field = resolve_journal_cardinality_field(field_settings)
 
-        row_candidates = []
-        for candidate in [configured_row_field, row_field_name, "author_country_codes", "country"]:
-            cleaned = str(candidate or "").strip()
-            if cleaned and cleaned not in row_candidates:
-                row_candidates.append(cleaned)
-        col_candidates = []
-        for candidate in [configured_col_field, col_field_name, "publication_year"]:
-            cleaned = str(candidate or "").strip()
-            if cleaned and cleaned not in col_candidates:
-                col_candidates.append(cleaned)
+        row_field = _resolve_agg_field(service, configured_row_field, row_field_name)
+        col_field = _resolve_agg_field(service, configured_col_field, col_field_name)
+        if not row_field or not col_field:
+            raise ValueError("No aggregatable fields for selected dimension")
 
         def _estimate_total_rows(row_field):
             body = {
@@ -1172,119 +1053,111 @@ def _run_chunked_export_async(*, batch_job_id, dimension, query_source, index_na
         processed_rows = 0
         part_idx = 1
         file_slug = (dimension.get("slug") or "dimension").strip() or "dimension"
-        used_pair = None
         buffer_rows = []
-        columns = []
-        estimated_total = 0
-
-        for row_field in row_candidates:
-            for col_field in col_candidates:
-                columns = _observation_year_columns()
-                estimated_total = _estimate_total_rows(row_field)
-                after_key = None
-                found_any = False
-                while True:
-                    composite = {
-                        "size": page_size,
-                        "sources": [{"row_key": {"terms": {"field": row_field}}}],
-                    }
-                    if after_key:
-                        composite["after"] = after_key
-                    body = {
-                        "size": 0,
-                        "query": {"bool": bool_query},
+        columns = _observation_year_columns()
+        estimated_total = None
+        after_key = None
+        while True:
+            composite = {
+                "size": page_size,
+                "sources": [{"row_key": {"terms": {"field": row_field}}}],
+            }
+            if after_key:
+                composite["after"] = after_key
+            body = {
+                "size": 0,
+                "query": {"bool": bool_query},
+                "aggs": {
+                    "by_row": {
+                        "composite": composite,
                         "aggs": {
-                            "by_row": {
-                                "composite": composite,
-                                "aggs": {
-                                    "by_col": _composite_col_agg(
-                                        col_field,
-                                        col_size,
-                                        value_metric,
-                                        journal_field,
-                                    ),
-                                },
-                            }
+                            "by_col": _composite_col_agg(
+                                col_field,
+                                col_size,
+                                value_metric,
+                                journal_field,
+                            ),
                         },
                     }
-                    response = service.client.search(
-                        index=service.index_name,
-                        body=body,
-                        request_cache=True,
-                        request_timeout=service.request_timeout,
+                },
+            }
+            try:
+                response = service.client.search(
+                    index=service.index_name,
+                    body=body,
+                    request_cache=True,
+                    request_timeout=service.request_timeout,
+                )
+            except Exception as exc:
+                retry_fields = None if after_key else _keyword_retry_fields(exc, row_field, col_field)
+                if not retry_fields:
+                    raise
+                row_field, col_field = retry_fields
+                continue
+            if estimated_total is None:
+                estimated_total = _estimate_total_rows(row_field)
+            row_agg = (response.get("aggregations") or {}).get("by_row") or {}
+            buckets = row_agg.get("buckets") or []
+            if not buckets:
+                break
+            for rb in buckets:
+                raw_key = ((rb.get("key") or {}).get("row_key"))
+                values = {}
+                for cb in (rb.get("by_col") or {}).get("buckets", []) or []:
+                    ck = cb.get("key")
+                    if ck is None:
+                        continue
+                    values[str(ck)] = _cell_count_from_bucket(cb, value_metric)
+                buffer_rows.append({"key": raw_key, "label": raw_key, "values": values})
+                if len(buffer_rows) >= split_size:
+                    chunk_rows = builtins.list(buffer_rows[:split_size])
+                    del buffer_rows[:split_size]
+                    chunk_rows = _resolve_lookup_labels_for_export_rows(
+                        service,
+                        row_field_name,
+                        chunk_rows,
+                        row_index_field=row_field,
                     )
-                    row_agg = (response.get("aggregations") or {}).get("by_row") or {}
-                    buckets = row_agg.get("buckets") or []
-                    if not buckets:
-                        break
-                    found_any = True
-                    for rb in buckets:
-                        raw_key = ((rb.get("key") or {}).get("row_key"))
-                        values = {}
-                        for cb in (rb.get("by_col") or {}).get("buckets", []) or []:
-                            ck = cb.get("key")
-                            if ck is None:
-                                continue
-                            values[str(ck)] = _cell_count_from_bucket(cb, value_metric)
-                        buffer_rows.append({"key": raw_key, "label": raw_key, "values": values})
-                        if len(buffer_rows) >= split_size:
-                            chunk_rows = builtins.list(buffer_rows[:split_size])
-                            del buffer_rows[:split_size]
-                            chunk_rows = _resolve_lookup_labels_for_export_rows(
-                                service,
-                                row_field_name,
-                                chunk_rows,
-                                row_index_field=row_field,
-                            )
-                            range_start = processed_rows + 1
-                            processed_rows += len(chunk_rows)
-                            range_end = processed_rows
-                            csv_content = _build_csv_content(
-                                dimension=dimension,
-                                columns=columns,
-                                rows=chunk_rows,
-                            )
-                            file_name = f"observation_{file_slug}_{int(time.time())}_part_{part_idx:03d}.csv"
-                            child_snapshot = _store_done_csv_job(
-                                dimension=dimension,
-                                file_name=file_name,
-                                csv_content=csv_content,
-                                total_rows=len(chunk_rows),
-                                parent_id=batch_job_id,
-                                sequence=part_idx,
-                                range_start=range_start,
-                                range_end=range_end,
-                            )
-                            with EXPORT_JOBS_LOCK:
-                                batch = EXPORT_JOBS.get(batch_job_id)
-                                if not batch:
-                                    break
-                                ready_ids = batch.get("ready_file_ids") or []
-                                ready_ids.append(child_snapshot["id"])
-                                batch["ready_file_ids"] = ready_ids
-                                batch["processed_rows"] = processed_rows
-                                batch["total_rows"] = estimated_total
-                                if estimated_total > 0:
-                                    batch["progress_percent"] = min(99, int((processed_rows * 100) / estimated_total))
-                                batch["message"] = _("Generating CSV files... %(processed)s/%(total)s") % {
-                                    "processed": processed_rows,
-                                    "total": estimated_total or processed_rows,
-                                }
-                                EXPORT_JOBS[batch_job_id] = batch
-                            part_idx += 1
-                    after_key = row_agg.get("after_key")
-                    if not after_key:
+                    range_start = processed_rows + 1
+                    processed_rows += len(chunk_rows)
+                    range_end = processed_rows
+                    file_name = f"observation_{file_slug}_{int(time.time())}_part_{part_idx:03d}.csv"
+                    child_snapshot = _store_done_csv_job(
+                        dimension=dimension,
+                        file_name=file_name,
+                        write_csv=partial(
+                            _write_csv_content,
+                            dimension=dimension,
+                            columns=columns,
+                            rows=chunk_rows,
+                        ),
+                        total_rows=len(chunk_rows),
+                        parent_id=batch_job_id,
+                        sequence=part_idx,
+                        range_start=range_start,
+                        range_end=range_end,
+                    )
+                    batch = get_job(batch_job_id)
+                    if not batch:
                         break
-                if found_any:
-                    used_pair = (row_field, col_field)
-                    break
-                buffer_rows = []
-                processed_rows = 0
-                part_idx = 1
-            if used_pair:
+                    ready_ids = batch.get("ready_file_ids") or []
+                    ready_ids.append(child_snapshot["id"])
+                    batch["ready_file_ids"] = ready_ids
+                    batch["processed_rows"] = processed_rows
+                    batch["total_rows"] = estimated_total
+                    if estimated_total > 0:
+                        batch["progress_percent"] = min(99, int((processed_rows * 100) / estimated_total))
+                    batch["message"] = _("Generating CSV files... %(processed)s/%(total)s") % {
+                        "processed": processed_rows,
+                        "total": estimated_total or processed_rows,
+                    }
+                    save_job(batch)
+                    part_idx += 1
+            after_key = row_agg.get("after_key")
+            if not after_key:
                 break
 
-        if not used_pair or (processed_rows == 0 and not buffer_rows):
+        if processed_rows == 0 and not buffer_rows:
             raise ValueError("No rows returned by backend for selected dimension and filters")
 
         if buffer_rows:
@@ -1293,55 +1166,52 @@ def _run_chunked_export_async(*, batch_job_id, dimension, query_source, index_na
                 service,
                 row_field_name,
                 chunk_rows,
-                row_index_field=(used_pair[0] if used_pair else configured_row_field),
+                row_index_field=row_field,
             )
             range_start = processed_rows + 1
             processed_rows += len(chunk_rows)
             range_end = processed_rows
-            csv_content = _build_csv_content(
-                dimension=dimension,
-                columns=columns,
-                rows=chunk_rows,
-            )
             file_name = f"observation_{file_slug}_{int(time.time())}_part_{part_idx:03d}.csv"
             child_snapshot = _store_done_csv_job(
                 dimension=dimension,
                 file_name=file_name,
-                csv_content=csv_content,
+                write_csv=partial(
+                    _write_csv_content,
+                    dimension=dimension,
+                    columns=columns,
+                    rows=chunk_rows,
+                ),
                 total_rows=len(chunk_rows),
                 parent_id=batch_job_id,
                 sequence=part_idx,
                 range_start=range_start,
                 range_end=range_end,
             )
-            with EXPORT_JOBS_LOCK:
-                batch = EXPORT_JOBS.get(batch_job_id)
-                if batch:
-                    ready_ids = batch.get("ready_file_ids") or []
-                    ready_ids.append(child_snapshot["id"])
-                    batch["ready_file_ids"] = ready_ids
-                    EXPORT_JOBS[batch_job_id] = batch
-
-        with EXPORT_JOBS_LOCK:
-            batch = EXPORT_JOBS.get(batch_job_id)
+            batch = get_job(batch_job_id)
             if batch:
-                batch["status"] = "done"
-                batch["progress_percent"] = 100
-                batch["finished_at"] = int(time.time())
-                batch["message"] = _("All CSV files are ready")
-                batch["total_rows"] = max(estimated_total, processed_rows)
-                batch["processed_rows"] = processed_rows
-                EXPORT_JOBS[batch_job_id] = batch
+                ready_ids = batch.get("ready_file_ids") or []
+                ready_ids.append(child_snapshot["id"])
+                batch["ready_file_ids"] = ready_ids
+                save_job(batch)
+
+        update_job(
+            batch_job_id,
+            status="done",
+            progress_percent=100,
+            finished_at=int(time.time()),
+            message=_("All CSV files are ready"),
+            total_rows=max(estimated_total, processed_rows),
+            processed_rows=processed_rows,
+        )
     except Exception as exc:
         logger.exception("Async chunked export failed: %s", exc)
-        with EXPORT_JOBS_LOCK:
-            batch = EXPORT_JOBS.get(batch_job_id)
-            if batch:
-                batch["status"] = "error"
-                batch["finished_at"] = int(time.time())
-                batch["message"] = f"{type(exc).__name__}: {exc}"
-                batch["debug"] = traceback.format_exc(limit=6)
-                EXPORT_JOBS[batch_job_id] = batch
+        update_job(
+            batch_job_id,
+            status="error",
+            finished_at=int(time.time()),
+            message=f"{type(exc).__name__}: {exc}",
+            debug=traceback.format_exc(limit=6),
+        )
 
 @require_GET
 def list(request):
@@ -1473,18 +1343,16 @@ def export_start(request):
                 dimension=normalized_dimension,
                 message=_("Starting backend export..."),
             )
-            worker = threading.Thread(
-                target=_run_chunked_export_async,
+            run_observation_chunked_export.apply_async(
                 kwargs={
                     "batch_job_id": batch_snapshot["id"],
+                    "query_string": query_source.urlencode(),
+                    "language": get_language(),
                     "dimension": normalized_dimension,
-                    "query_source": query_source,
                     "index_name": index_name,
                     "split_size": split_size,
                 },
-                daemon=True,
             )
-            worker.start()
             jobs.append(batch_snapshot)
             continue
 
@@ -1495,58 +1363,57 @@ def export_start(request):
             file_name=file_name,
             message=_("Starting backend export..."),
         )
-        worker = threading.Thread(
-            target=_run_export_job,
+        run_observation_export.apply_async(
             kwargs={
                 "job_id": file_job["id"],
+                "language": get_language(),
                 "query_string": query_source.urlencode(),
                 "index_name": index_name,
                 "dimension": normalized_dimension,
-                "batch_size": batch_size,
                 "progress_step": progress_step,
                 "export_scope": scope,
                 "split_size": split_size,
             },
-            daemon=True,
         )
-        worker.start()
         jobs.append(file_job)
     return JsonResponse({"jobs": jobs})
 
 
 @require_GET
 def export_status(request, job_id):
-    with EXPORT_JOBS_LOCK:
-        job = EXPORT_JOBS.get(job_id)
-        if not job:
-            return JsonResponse({"error": "Job not found"}, status=404)
-        payload = {"job": _job_snapshot(job)}
-        if job.get("job_type") == "batch":
-            ready_jobs = []
-            for child_id in job.get("ready_file_ids") or []:
-                child = EXPORT_JOBS.get(child_id)
-                if child:
-                    ready_jobs.append(_job_snapshot(child))
-            payload["ready_jobs"] = ready_jobs
+    job = get_job(job_id)
+    if not job:
+        return JsonResponse({"error": "Job not found"}, status=404)
+    payload = {"job": _job_snapshot(job)}
+    if job.get("job_type") == "batch":
+        payload["ready_jobs"] = [
+            _job_snapshot(child) for child in get_jobs(job.get("ready_file_ids") or [])
+        ]
     return JsonResponse(payload)
 
 
 @require_GET
 def export_download(request, job_id):
-    with EXPORT_JOBS_LOCK:
-        job = EXPORT_JOBS.get(job_id)
+    job = get_job(job_id)
     if not job:
         return JsonResponse({"error": "Job not found"}, status=404)
     if job.get("status") != "done":
         return JsonResponse({"error": "Job is not ready yet"}, status=409)
-    csv_content = job.get("csv_content", "")
-    if not isinstance(csv_content, str) or not csv_content.strip():
+    file_name = job.get("file_name") or "observation.csv"
+    csv_file = open_job_file(job)
+    if csv_file is None:
         fallback = StringIO()
         fallback_writer = csv.writer(fallback)
         fallback_writer.writerow([_("Message")])
         fallback_writer.writerow([_("No data available for export")])
-        csv_content = fallback.getvalue()
-    response = HttpResponse(csv_content, content_type="text/csv; charset=utf-8")
-    response["Content-Disposition"] = f'attachment; filename="{job.get("file_name", "observation.csv")}"'
+        response = HttpResponse(fallback.getvalue(), content_type="text/csv; charset=utf-8")
+        response["Content-Disposition"] = f'attachment; filename="{file_name}"'
+    else:
+        response = FileResponse(
+            csv_file,
+            as_attachment=True,
+            filename=file_name,
+            content_type="text/csv; charset=utf-8",
+        )
     response["Cache-Control"] = "no-store"
     return response
@@ -1,9 +1,12 @@
 from scholarly_articles.tasks import load_unpaywall
 
 
-def run(user_id, file_path):
+def run(user_id, file_path, shards=None):
     if file_path and user_id:
-        load_unpaywall.apply_async(args=(user_id, file_path))
+        load_unpaywall.apply_async(
+            args=(user_id, file_path),
+            kwargs={"shards": int(shards) if shards else None},
+        )
     elif not file_path:
         print("The path to unpaywall file is required.")
     elif not user_id:
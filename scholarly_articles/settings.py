@@ -6,3 +6,16 @@ URL_API_CROSSREF = _env.str(
     "API_CROSSREF",
     default="https://api.crossref.org/works",
 )
+
+# Affiliation completion: institution names compiled per matcher pass and
+# affiliations written per bulk_update
+AFFILIATION_MATCH_PATTERNS_PER_PASS = _env.int(
+    "AFFILIATION_MATCH_PATTERNS_PER_PASS",
+    default=20000,
+)
+AFFILIATION_MATCH_BATCH_SIZE = _env.int("AFFILIATION_MATCH_BATCH_SIZE", default=1000)
+
+# Unpaywall snapshot loading: lines merged per staging COPY, and byte ranges
+# of an uncompressed file loaded by separate tasks (1 loads it in one task)
+UNPAYWALL_LOAD_BATCH_SIZE = _env.int("UNPAYWALL_LOAD_BATCH_SIZE", default=5000)
+UNPAYWALL_LOAD_SHARDS = _env.int("UNPAYWALL_LOAD_SHARDS", default=1)
@@ -11,6 +11,7 @@ from scholarly_articles import models, utils
 from scholarly_articles.crossref import crossref
 from scholarly_articles.unpaywall import (
     affiliation,
+    bulk_load,
     load_data,
     supplementary,
     unpaywall,
@@ -23,7 +24,7 @@ User = get_user_model()
 
 
 @celery_app.task()
-def load_unpaywall(user_id, file_path):
+def load_unpaywall(user_id, file_path, shards=None):
     """
     Load the data from unpaywall file.
 
@@ -31,17 +32,28 @@ def load_unpaywall(user_id, file_path):
 
     Param file_path: String with the path of the JSON like file compressed or not.
     Param user: The user id passed by kwargs on tasks.kwargs
+    Param shards: Number of byte ranges of an uncompressed file loaded by
+        separate load_unpaywall_shard tasks (defaults to UNPAYWALL_LOAD_SHARDS)
     """
     user = User.objects.get(id=user_id)
+    shards = shards or getattr(settings, "UNPAYWALL_LOAD_SHARDS", 1)
 
-    try:
-        with gzip.open(file_path, "rb") as f:
-            for line, row in enumerate(f):
-                unpaywall.load(line, row, user)
-    except OSError:
-        with open(file_path, "rb") as f:
-            for line, row in enumerate(f):
-                unpaywall.load(line, row, user)
+    if shards > 1 and not bulk_load.is_gzip(file_path):
+        for start, end in bulk_load.byte_ranges(file_path, shards):
+            load_unpaywall_shard.apply_async(args=(user_id, file_path, start, end))
+        return
+
+    return bulk_load.load_file(file_path, user)
+
+
+@celery_app.task()
+def load_unpaywall_shard(user_id, file_path, start, end):
+    """
+    Load the lines of an uncompressed unpaywall file starting in [start, end).
+    """
+    user = User.objects.get(id=user_id)
+
+    return bulk_load.load_file(file_path, user, start=start, end=end)
 
 
 @celery_app.task()
@@ -1,3 +1,146 @@
-from django.test import TestCase
+import gzip
+import os
+import tempfile
 
-# Create your tests here.
+import orjson
+from django.test import SimpleTestCase, TestCase
+
+from core.users.models import User
+from core.utils.multi_pattern import MultiPatternMatcher
+from institution.models import Institution
+from location.models import Location
+from scholarly_articles.models import Affiliations, ErrorLog, RawUnpaywall
+from scholarly_articles.unpaywall import bulk_load
+from scholarly_articles.unpaywall.affiliation import complete_affiliation_data
+from usefulmodels.models import Country
+
+
+class MultiPatternMatcherTests(SimpleTestCase):
+    def test_finds_overlapping_patterns_in_one_pass(self):
+        matcher = MultiPatternMatcher()
+        for position, pattern in enumerate(["he", "she", "his", "hers"]):
+            matcher.add(pattern, position)
+
+        self.assertEqual(sorted(matcher.iter_matches("uSHErs")), [0, 1, 3])
+        self.assertEqual(matcher.first("ahishers"), 0)
+        self.assertIsNone(matcher.first("xyz"))
+
+    def test_case_sensitive_matcher_keeps_case(self):
+        matcher = MultiPatternMatcher(case_sensitive=True)
+        matcher.add(" BRA,", 0)
+
+        self.assertEqual(matcher.first("USP, São Paulo BRA, 01000"), 0)
+        self.assertIsNone(matcher.first("USP, São Paulo bra, 01000"))
+
+
+class CompleteAffiliationDataTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="tester", password="secret")
+        self.brazil, self.france = Country.objects.bulk_create(
+            [
+                Country(creator=self.user, name_en="Brazil", name_pt="Brasil", acron3="BRA", acron2="BR"),
+                Country(creator=self.user, name_en="France", name_pt="França", acron3="FRA", acron2="FR"),
+            ]
+        )
+        (paris,) = Location.objects.bulk_create([Location(creator=self.user, country=self.france)])
+        self.usp, _ = Institution.objects.bulk_create(
+            [
+                Institution(creator=self.user, name="Universidade de São Paulo", source="MEC"),
+                Institution(creator=self.user, name="Sorbonne", source="ROR", location=paris),
+            ]
+        )
+
+    def test_completes_official_and_country_in_priority_order(self):
+        official, ror, by_name, by_acronym, untouched = Affiliations.objects.bulk_create(
+            [
+                Affiliations(name="Faculdade de Medicina, UNIVERSIDADE DE SÃO PAULO, Brasil"),
+                Affiliations(name="Sorbonne Université, Brazil"),
+                Affiliations(name="Hospital Central, Rio de Janeiro, Brasil"),
+                Affiliations(name="Institut Pasteur, Lille FRA"),
+                Affiliations(name="Unknown lab"),
+            ]
+        )
+
+        complete_affiliation_data()
+
+        official.refresh_from_db()
+        ror.refresh_from_db()
+        by_name.refresh_from_db()
+        by_acronym.refresh_from_db()
+        untouched.refresh_from_db()
+        self.assertEqual(official.official, self.usp)
+        self.assertIsNone(official.country)
+        self.assertEqual(ror.country, self.france)
+        self.assertEqual(by_name.country, self.brazil)
+        self.assertEqual(by_acronym.country, self.france)
+        self.assertIsNone(untouched.country)
+
+
+class UnpaywallBulkLoadTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="loader", password="secret")
+        RawUnpaywall.objects.create(
+            doi="10.1/existing",
+            harvesting_creation="2020-01-01",
+            resource_type="journal-article",
+            update="2020-01-01",
+        )
+
+    def _write(self, lines, compress=False):
+        handle, path = tempfile.mkstemp(suffix=".jsonl.gz" if compress else ".jsonl")
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        content = b"".join(lines)
+        with (gzip.open(path, "wb") if compress else open(path, "wb")) as f:
+            f.write(content)
+        return path
+
+    def _line(self, **row):
+        return orjson.dumps(row) + b"\n"
+
+    def test_load_file_upserts_batches_and_falls_back_for_bad_lines(self):
+        path = self._write(
+            [
+                self._line(doi="10.1/existing", genre="journal-article", year=2021, is_paratext=True, updated=None),
+                self._line(doi="10.1/new", genre="book", year=2020, updated="2021-04-02T00:47:21"),
+                b"{not json\n",
+                self._line(doi="10.1/new", genre="journal-article", year=2020, updated="2022-05-06T00:00:00"),
+                self._line(genre="journal-article"),
+            ],
+            compress=True,
+        )
+
+        stats = bulk_load.load_file(path, self.user, batch_size=3)
+
+        self.assertEqual(stats["read"], 5)
+        self.assertEqual(stats["inserted"], 1)
+        self.assertEqual(stats["updated"], 2)
+        self.assertEqual(stats["fallback"], 1)
+        self.assertGreater(stats["rows_per_second"], 0)
+        existing = RawUnpaywall.objects.get(doi="10.1/existing")
+        self.assertEqual(existing.year, "2021")
+        self.assertTrue(existing.is_paratext)
+        self.assertEqual(existing.update, "2020-01-01")
+        self.assertEqual(existing.harvesting_creation, "2020-01-01")
+        new = RawUnpaywall.objects.get(doi="10.1/new")
+        self.assertEqual(new.resource_type, "journal-article")
+        self.assertEqual(new.update, "2022-05-06")
+        self.assertEqual(new.json["genre"], "journal-article")
+        self.assertEqual(ErrorLog.objects.get().data_reference, "line:3")
+
+    def test_byte_ranges_load_every_line_exactly_once(self):
+        path = self._write(
+            [self._line(doi=f"10.1/doc-{index}", genre="journal-article", year=2020) for index in range(10)]
+        )
+
+        read = [
+            bulk_load.load_file(path, self.user, start=start, end=end, batch_size=2)["read"]
+            for start, end in bulk_load.byte_ranges(path, 3)
+        ]
+
+        self.assertEqual(len(read), 3)
+        self.assertEqual(sum(read), 10)
+        self.assertEqual(
+            RawUnpaywall.objects.filter(doi__startswith="10.1/doc-").count(),
+            10,
+        )
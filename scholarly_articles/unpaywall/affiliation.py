@@ -1,7 +1,8 @@
 import logging
 
-from django.db.models import Q
+from django.conf import settings
 
+from core.utils.multi_pattern import MultiPatternMatcher
 from scholarly_articles.models import Affiliations
 from usefulmodels.models import Country
 from institution.models import Institution
@@ -13,61 +14,103 @@ def complete_affiliation_data():
     com dados de países obtidos de bases auxiliares e da lista controlada
     de nomes de países
     É necessário seguir esta ordem de tentativas para completar os dados
+
+    Os nomes de cada etapa são compilados em um autômato (Aho-Corasick) e as
+    afiliações pendentes são lidas uma vez por autômato; vence o primeiro
+    candidato na ordem de iteração, como nas consultas por instituição.
     """
-    for institution in Institution.objects.filter(source="MEC").iterator():
-        for aff in Affiliations.objects.filter(
-            official__isnull=True, name__icontains=institution.name
-        ).iterator():
-            aff.official = institution
-            aff.save()
-            logging.info(aff.name)
+    for match, candidates in _iter_institution_matchers(
+        Institution.objects.filter(source="MEC").values_list("name", "id")
+    ):
+        _apply_matches(
+            Affiliations.objects.filter(official__isnull=True),
+            match,
+            lambda aff, position: setattr(aff, "official_id", candidates[position]),
+            "official",
+        )
 
     # first iteration to identify country by institution ROR
-    for institution_ror in Institution.objects.filter(source="ROR").iterator():
-        for aff in Affiliations.objects.filter(
-            official__isnull=True,
-            country__isnull=True,
-            name__icontains=institution_ror.name,
-        ).iterator():
-            aff.country = institution_ror.location.country
-            aff.save()
-            logging.info(aff.name)
+    for match, candidates in _iter_institution_matchers(
+        Institution.objects.filter(
+            source="ROR", location__country__isnull=False
+        ).values_list("name", "location__country_id")
+    ):
+        _apply_matches(
+            Affiliations.objects.filter(official__isnull=True, country__isnull=True),
+            match,
+            lambda aff, position: setattr(aff, "country_id", candidates[position]),
+            "country",
+        )
 
+    # second, third and fourth iterations to identify country by declared
+    # name and by acronyms with 3 and 2 chars, country by country
+    name_matcher = MultiPatternMatcher()
+    acronym_matcher = MultiPatternMatcher(case_sensitive=True)
+    countries = []
     for country in Country.objects.iterator():
         logging.info((country.name_en, country.name_pt, country.acron3))
+        position = len(countries)
+        countries.append(country.id)
+        for name in (country.name_en, country.name_pt):
+            name_matcher.add(name, position)
+        for acronym in (country.acron3, country.acron2):
+            if acronym:
+                for suffix in (",", ";", ".", "\0"):
+                    acronym_matcher.add(f" {acronym}{suffix}", position)
+
+    def first_country(name):
+        positions = [
+            position
+            for position in (name_matcher.first(name), acronym_matcher.first(f"{name}\0"))
+            if position is not None
+        ]
+        return min(positions) if positions else None
+
+    _apply_matches(
+        Affiliations.objects.filter(official__isnull=True, country__isnull=True),
+        first_country,
+        lambda aff, position: setattr(aff, "country_id", countries[position]),
+        "country",
+    )
 
-        # second iteration to identify country by declared name
-        for aff in Affiliations.objects.filter(
-            Q(name__icontains=country.name_en) | Q(name__icontains=country.name_pt),
-            country__isnull=True,
-            official__isnull=True,
-        ).iterator():
-            aff.country = country
-            aff.save()
-            logging.info(aff.name)
 
-        # third iteration to identify country by declared acronym with 3 char
-        for aff in Affiliations.objects.filter(
-            Q(name__contains=" " + country.acron3 + ",")
-            | Q(name__contains=" " + country.acron3 + ";")
-            | Q(name__contains=" " + country.acron3 + ".")
-            | Q(name__endswith=" " + country.acron3),
-            country__isnull=True,
-            official__isnull=True,
-        ).iterator():
-            aff.country = country
-            aff.save()
-            logging.info(aff.name)
+def _iter_institution_matchers(names_and_values):
+    """
+    Autômatos com até AFFILIATION_MATCH_PATTERNS_PER_PASS nomes cada, na ordem
+    do queryset, e o valor a gravar para cada posição.
+    """
+    patterns_per_pass = getattr(settings, "AFFILIATION_MATCH_PATTERNS_PER_PASS", 20000)
+    matcher = MultiPatternMatcher()
+    candidates = []
+    for name, value in names_and_values.iterator():
+        if not name:
+            continue
+        matcher.add(name, len(candidates))
+        candidates.append(value)
+        if len(candidates) >= patterns_per_pass:
+            yield matcher.first, candidates
+            matcher = MultiPatternMatcher()
+            candidates = []
+    if candidates:
+        yield matcher.first, candidates
+
 
-        # fourth iteration to identify country by declared acronym with 2 char
-        for aff in Affiliations.objects.filter(
-            Q(name__contains=" " + country.acron2 + ",")
-            | Q(name__contains=" " + country.acron2 + ";")
-            | Q(name__contains=" " + country.acron2 + ".")
-            | Q(name__endswith=" " + country.acron2),
-            country__isnull=True,
-            official__isnull=True,
-        ).iterator():
-            aff.country = country
-            aff.save()
-            logging.info(aff.name)
+def _apply_matches(queryset, match, assign, field):
+    batch_size = getattr(settings, "AFFILIATION_MATCH_BATCH_SIZE", 1000)
+    changed = []
+    updated = 0
+    pending = queryset.exclude(name__isnull=True).values_list("id", "name")
+    for aff_id, name in pending.iterator(chunk_size=batch_size):
+        position = match(name)
+        if position is None:
+            continue
+        aff = Affiliations(id=aff_id, name=name)
+        assign(aff, position)
+        changed.append(aff)
+        logging.info(name)
+        if len(changed) >= batch_size:
+            updated += Affiliations.objects.bulk_update(changed, [field])
+            changed = []
+    if changed:
+        updated += Affiliations.objects.bulk_update(changed, [field])
+    return updated
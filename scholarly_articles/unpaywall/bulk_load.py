@@ -0,0 +1,228 @@
+"""
+Bulk loader for Unpaywall snapshot files.
+
+Lines are parsed with orjson in batches, copied into a temporary staging
+table and merged into RawUnpaywall with one UPDATE and one INSERT per batch.
+Uncompressed files can be split into byte ranges loaded by separate workers.
+"""
+
+import gzip
+import io
+import logging
+import math
+import os
+import time
+from datetime import date
+
+import orjson
+from django.conf import settings
+from django.db import connection, transaction
+
+from scholarly_articles import models
+from scholarly_articles.unpaywall import unpaywall
+
+logger = logging.getLogger(__name__)
+
+STAGING_TABLE = "unpaywall_staging"
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def is_gzip(file_path):
+    with open(file_path, "rb") as f:
+        return f.read(2) == GZIP_MAGIC
+
+
+def byte_ranges(file_path, shards):
+    """Splits an uncompressed file in ``shards`` contiguous (start, end) ranges."""
+    size = os.path.getsize(file_path)
+    step = max(1, math.ceil(size / max(1, shards)))
+    return [(start, min(size, start + step)) for start in range(0, size, step)]
+
+
+def iter_lines(file_path, start=0, end=None):
+    """
+    Yields (reference, raw line) for the lines starting inside [start, end).
+    The reference is the line number, or the byte offset of the line when the
+    range does not begin at the start of the file.
+
+    A range that does not begin at the start of the file skips the partial
+    line it lands on, which belongs to the previous range.
+    """
+    if is_gzip(file_path):
+        if start or end is not None:
+            raise ValueError("Byte ranges are only supported for uncompressed files.")
+        with gzip.open(file_path, "rb") as f:
+            for line, row in enumerate(f):
+                yield line, row
+        return
+
+    with open(file_path, "rb") as f:
+        position = start
+        if start:
+            f.seek(start - 1)
+            position = start - 1 + len(f.readline())
+        line = 0
+        for row in f:
+            if end is not None and position >= end:
+                break
+            yield (line if not start else position), row
+            position += len(row)
+            line += 1
+
+
+def _copy_value(value):
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def parse_batch(rows):
+    """
+    Splits raw lines in staging records and lines left to the per-line loader,
+    which records their errors as before.
+    """
+    records = []
+    rejected = []
+    for reference, raw in rows:
+        try:
+            row = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            rejected.append((reference, raw))
+            continue
+        if not isinstance(row, dict):
+            rejected.append((reference, raw))
+            continue
+        doi = row.get("doi")
+        if not doi:
+            continue
+        if not row.get("genre") or not isinstance(row.get("is_paratext"), (bool, type(None))):
+            rejected.append((reference, raw))
+            continue
+        updated = row.get("updated")
+        records.append(
+            (
+                len(records),
+                doi,
+                row.get("is_paratext"),
+                row.get("year"),
+                row.get("genre"),
+                updated[:10] if isinstance(updated, str) else None,
+                orjson.dumps(row).decode("utf-8"),
+            )
+        )
+    return records, rejected
+
+
+def _merge_sql():
+    quote = connection.ops.quote_name
+    table = quote(models.RawUnpaywall._meta.db_table)
+    update = quote("update")
+    latest = (
+        f"SELECT DISTINCT ON (doi) * FROM {STAGING_TABLE} "
+        "ORDER BY doi, seq DESC"
+    )
+    update_sql = (
+        f"UPDATE {table} AS t SET is_paratext = s.is_paratext, year = s.year, "
+        f"resource_type = s.resource_type, {update} = COALESCE(s.{update}, t.{update}), "
+        f"json = s.json FROM ({latest}) AS s WHERE t.doi = s.doi"
+    )
+    insert_sql = (
+        f"INSERT INTO {table} (doi, harvesting_creation, is_paratext, year, resource_type, "
+        f"{update}, json) SELECT s.doi, %s, s.is_paratext, s.year, s.resource_type, "
+        f"s.{update}, s.json FROM ({latest}) AS s "
+        f"WHERE NOT EXISTS (SELECT 1 FROM {table} AS t WHERE t.doi = s.doi)"
+    )
+    return update_sql, insert_sql
+
+
+def upsert_records(records):
+    """Merges staging records into RawUnpaywall; returns (inserted, updated)."""
+    if not records:
+        return 0, 0
+
+    buffer = io.StringIO()
+    for record in records:
+        buffer.write("\t".join(_copy_value(value) for value in record))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    update_sql, insert_sql = _merge_sql()
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE IF NOT EXISTS {STAGING_TABLE} ("
+            "seq integer, doi text, is_paratext boolean, year text, "
+            '"update" text, resource_type text, json jsonb)'
+        )
+        cursor.execute(f"TRUNCATE {STAGING_TABLE}")
+        cursor.copy_expert(
+            f'COPY {STAGING_TABLE} (seq, doi, is_paratext, year, resource_type, "update", json) '
+            "FROM STDIN",
+            buffer,
+        )
+        cursor.execute(update_sql)
+        updated = cursor.rowcount
+        cursor.execute(insert_sql, [str(date.today())])
+        inserted = cursor.rowcount
+    return inserted, updated
+
+
+def _flush(batch, user, stats):
+    records, rejected = parse_batch(batch)
+    try:
+        inserted, updated = upsert_records(records)
+    except Exception as exc:
+        # A value the staging table rejects fails the whole COPY; the batch
+        # goes through the per-line loader, which logs the failing lines.
+        logger.warning("Unpaywall batch falling back to per-line load: %s", exc)
+        rejected = batch
+        inserted = updated = 0
+    for reference, raw in rejected:
+        unpaywall.load(reference, raw, user)
+    stats["inserted"] += inserted
+    stats["updated"] += updated
+    stats["fallback"] += len(rejected)
+
+
+def load_file(file_path, user, start=0, end=None, batch_size=None):
+    """
+    Loads an Unpaywall JSONL file (or the byte range [start, end) of an
+    uncompressed one) into RawUnpaywall and returns the load statistics.
+    """
+    batch_size = batch_size or getattr(settings, "UNPAYWALL_LOAD_BATCH_SIZE", 5000)
+    stats = {"read": 0, "inserted": 0, "updated": 0, "fallback": 0, "rows_per_second": 0.0}
+    started = time.monotonic()
+    batch = []
+
+    def report():
+        elapsed = max(time.monotonic() - started, 1e-9)
+        stats["rows_per_second"] = round(stats["read"] / elapsed, 1)
+        logger.info(
+            "Unpaywall %s [%s:%s]: %s lines, %s inserted, %s updated, %s rows/s",
+            file_path,
+            start,
+            end if end is not None else "",
+            stats["read"],
+            stats["inserted"],
+            stats["updated"],
+            stats["rows_per_second"],
+        )
+
+    for reference, raw in iter_lines(file_path, start=start, end=end):
+        batch.append((reference, raw))
+        stats["read"] += 1
+        if len(batch) >= batch_size:
+            _flush(batch, user, stats)
+            batch = []
+            report()
+    if batch:
+        _flush(batch, user, stats)
+    report()
+    return stats
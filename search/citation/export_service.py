@@ -5,7 +5,7 @@ from django.utils.translation import gettext as _
 from ..export_service import BadRequestError
 from ..ris_export import render_ris_lines
 from .constants import CITATION_PRESET_STYLES
-from .render import build_citation_items, render_bibtex, render_citation
+from .render import build_citation_items, render_bibtex, render_citation, render_citations
 
 
 def _to_citation_items(inputs):
@@ -47,21 +47,21 @@ def build_citation_file(inputs):
     return renderer(inputs)
 
 
-def _render_style(csl_json, style):
-    rendered = render_citation(csl_json, style=style, validate=False)
+def _join_rendered(rendered):
     return "\n\n".join(r.strip() for r in rendered if r and r.strip())
 
 
 def _render_items_style(citation_items, style):
-    return _render_style(citation_items, style)
+    return _join_rendered(render_citation(citation_items, style=style, validate=False))
 
 
 def _build_presets(citation_items):
+    rendered = render_citations(citation_items, list(CITATION_PRESET_STYLES), validate=False)
     return [
         {
             "id": style_id,
             "label": str(label),
-            "citation": _render_items_style(citation_items, style_id),
+            "citation": _join_rendered(rendered[style_id]),
         }
         for style_id, label in CITATION_PRESET_STYLES.items()
     ]
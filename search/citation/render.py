@@ -1,5 +1,7 @@
 import functools
+import json
 import re
+import threading
 from pathlib import Path
 
 import citeproc_styles
@@ -38,6 +40,11 @@ _CSL_ITEM_KEYS = frozenset(
         "language",
     }
 )
+# Parsed CSL styles kept per process, keyed by (style, locale, validate)
+_STYLE_CACHE_SIZE = 64
+# Rendered bibliographies kept per process, and the largest selection cached
+_RENDERED_CACHE_SIZE = 2048
+_RENDERED_CACHE_MAX_ITEMS = 50
 _BIBTEX_TYPE_MAP = {
     "article": "article",
     "article-journal": "article",
@@ -139,42 +146,106 @@ def list_installed_csl_styles():
     return rows
 
 
+@functools.lru_cache(maxsize=_STYLE_CACHE_SIZE)
+def get_parsed_style(style, locale=None, validate=False):
+    """
+    Parsed ``CitationStylesStyle`` shared by every render of ``style``.
+
+    citeproc stores the formatter on the style while rendering, so callers
+    must hold the returned lock while a bibliography uses it.
+    """
+    style_path = get_style_filepath(style)
+    return CitationStylesStyle(style_path, locale=locale, validate=validate), threading.Lock()
+
+
+def _citeproc_items(csl_json):
+    return [
+        {key: value for key, value in item.items() if key in _CSL_ITEM_KEYS}
+        for item in csl_json
+    ]
+
+
+def _render_bibliography(citeproc_items, style, locale, fmt, validate):
+    bib_style, lock = get_parsed_style(style, locale, validate)
+    bib_source = CiteProcJSON(citeproc_items)
+
+    def warn(_citation_item):
+        pass
+
+    with lock:
+        bibliography = CitationStylesBibliography(bib_style, bib_source, fmt)
+        for entry in citeproc_items:
+            cid = entry.get("id")
+            if cid is None:
+                continue
+            citation = Citation([CitationItem(str(cid))])
+            bibliography.register(citation)
+            bibliography.cite(citation, warn)
+        return [str(item) for item in bibliography.bibliography()]
+
+
+@functools.lru_cache(maxsize=_RENDERED_CACHE_SIZE)
+def _render_cached(items_key, style, locale, fmt_name, validate):
+    return tuple(
+        _render_bibliography(
+            json.loads(items_key),
+            style,
+            locale,
+            getattr(formatter, fmt_name),
+            validate,
+        )
+    )
+
+
 def render_citation(
     csl_json,
     *,
     style="apa",
     fmt=formatter.plain,
     validate=False,
+    locale=None,
 ):
     """
     Render bibliography strings for each CSL-JSON item using citeproc-py.
 
     ``style`` is the filename stem under citeproc_styles (e.g. ``bibtex``, ``apa``).
     """
-    if not csl_json:
-        return []
+    return render_citations(csl_json, [style], fmt=fmt, validate=validate, locale=locale)[style]
 
-    citeproc_items = [
-        {key: value for key, value in item.items() if key in _CSL_ITEM_KEYS}
-        for item in csl_json
-    ]
-    bib_source = CiteProcJSON(citeproc_items)
-    style_path = get_style_filepath(style)
-    bib_style = CitationStylesStyle(style_path, validate=validate)
-    bibliography = CitationStylesBibliography(bib_style, bib_source, fmt)
 
-    def warn(_citation_item):
-        pass
+def render_citations(csl_json, styles, *, fmt=formatter.plain, validate=False, locale=None):
+    """
+    Render one selection in several styles, returning ``{style: [strings]}``.
+
+    The citeproc items are built once for every style. Selections of up to
+    ``_RENDERED_CACHE_MAX_ITEMS`` items are memoized by their contents, style
+    and locale: numbering, sorting and disambiguation depend on the whole
+    selection, so the key covers every item rather than each document alone.
+    """
+    if not csl_json:
+        return {style: [] for style in styles}
+
+    citeproc_items = _citeproc_items(csl_json)
+    fmt_name = fmt.__name__.rsplit(".", 1)[-1]
+    cacheable = len(citeproc_items) <= _RENDERED_CACHE_MAX_ITEMS and getattr(formatter, fmt_name, None) is fmt
+    items_key = (
+        json.dumps(citeproc_items, sort_keys=True, ensure_ascii=False, default=str)
+        if cacheable
+        else None
+    )
+
+    rendered = {}
+    for style in styles:
+        if items_key is None:
+            rendered[style] = _render_bibliography(citeproc_items, style, locale, fmt, validate)
+        else:
+            rendered[style] = list(_render_cached(items_key, style, locale, fmt_name, validate))
+    return rendered
 
-    for entry in citeproc_items:
-        cid = entry.get("id")
-        if cid is None:
-            continue
-        citation = Citation([CitationItem(str(cid))])
-        bibliography.register(citation)
-        bibliography.cite(citation, warn)
 
-    return [str(item) for item in bibliography.bibliography()]
+def clear_citation_caches():
+    get_parsed_style.cache_clear()
+    _render_cached.cache_clear()
 
 
 def _bibtex_escape(value):
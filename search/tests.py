@@ -8,9 +8,14 @@ from .citation.views import (
     export_view,
 )
 from .citation.render import (
+    _render_cached,
     build_citation_items,
     build_csl_payload,
+    clear_citation_caches,
+    get_parsed_style,
     render_bibtex,
+    render_citation,
+    render_citations,
 )
 from .citation.scientific_production import build_csl_item
 from .citation.social_production import is_social_production_document
@@ -409,6 +414,33 @@ class CiteprocIntegrationTests(SimpleTestCase):
         self.assertIn("TY  - JOUR", out)
         self.assertIn("RIS title", out)
 
+    def test_render_citation_reuses_parsed_style_and_rendered_selection(self):
+        clear_citation_caches()
+        self.addCleanup(clear_citation_caches)
+        csl = [
+            {"id": "1", "type": "article-journal", "title": "First", "issued": {"date-parts": [[2020]]}},
+            {"id": "2", "type": "article-journal", "title": "Second", "issued": {"date-parts": [[2021]]}},
+        ]
+
+        first = render_citation(csl, style="vancouver")
+        second = render_citation(csl, style="vancouver")
+        changed = render_citation([{**csl[0], "title": "Changed"}], style="vancouver")
+
+        self.assertEqual(first, second)
+        self.assertTrue(first[0].startswith("1. First"))
+        self.assertTrue(first[1].startswith("2. Second"))
+        self.assertIn("Changed", changed[0])
+        self.assertEqual(get_parsed_style.cache_info().misses, 1)
+        self.assertEqual(_render_cached.cache_info().hits, 1)
+
+    def test_render_citations_renders_each_style_for_one_selection(self):
+        csl = [{"id": "1", "type": "article-journal", "title": "Shared", "issued": {"date-parts": [[2020]]}}]
+
+        rendered = render_citations(csl, ["apa", "vancouver"])
+
+        self.assertEqual(rendered["apa"], render_citation(csl, style="apa"))
+        self.assertEqual(rendered["vancouver"], render_citation(csl, style="vancouver"))
+
 
 class SocialProductionCitationTests(SimpleTestCase):
     def _sample_document(self):
@@ -0,0 +1,168 @@
+import hashlib
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "search_gateway:aggregatable_fields"
+AGGREGATABLE_TYPES = {
+    "keyword",
+    "constant_keyword",
+    "long",
+    "integer",
+    "short",
+    "byte",
+    "double",
+    "float",
+    "half_float",
+    "scaled_float",
+    "unsigned_long",
+    "date",
+    "date_nanos",
+    "boolean",
+    "ip",
+    "version",
+}
+
+_versions = {}
+_fields_by_version = {}
+_lock = threading.Lock()
+
+
+def expand_field_variants(candidates):
+    """Candidate field names followed by their ``.keyword`` subfield, without duplicates."""
+    expanded = []
+    for candidate in candidates:
+        cleaned = str(candidate or "").strip()
+        if not cleaned:
+            continue
+        variants = [cleaned]
+        if not cleaned.endswith(".keyword"):
+            variants.append(f"{cleaned}.keyword")
+        for variant in variants:
+            if variant not in expanded:
+                expanded.append(variant)
+    return expanded
+
+
+def aggregatable_fields_from_mapping(mapping):
+    fields = set()
+    for index_mapping in (mapping or {}).values():
+        properties = ((index_mapping or {}).get("mappings") or {}).get("properties") or {}
+        _collect_aggregatable_fields(properties, "", fields)
+    return fields
+
+
+def _collect_aggregatable_fields(properties, prefix, fields):
+    for name, config in (properties or {}).items():
+        path = f"{prefix}.{name}" if prefix else name
+        if _is_aggregatable(config):
+            fields.add(path)
+        for subfield_name, subfield_config in (config.get("fields") or {}).items():
+            if _is_aggregatable(subfield_config):
+                fields.add(f"{path}.{subfield_name}")
+        if config.get("properties"):
+            _collect_aggregatable_fields(config["properties"], path, fields)
+
+
+def _is_aggregatable(config):
+    field_type = (config or {}).get("type")
+    if field_type == "text":
+        return bool(config.get("fielddata"))
+    if config.get("doc_values") is False:
+        return False
+    return field_type in AGGREGATABLE_TYPES
+
+
+def mapping_version(client, index_name):
+    """
+    Token identifying the mappings behind ``index_name``.
+
+    Built from the cluster-state ``mapping_version`` and uuid of each concrete
+    index, so it changes on ``put_mapping``, dynamic mapping updates and when
+    an alias is switched to a rebuilt index. It is re-read at most every
+    SEARCH_GATEWAY_FIELD_MAPPING_CHECK_SECONDS per process.
+    """
+    check_seconds = getattr(settings, "SEARCH_GATEWAY_FIELD_MAPPING_CHECK_SECONDS", 300)
+    now = time.monotonic()
+    with _lock:
+        cached = _versions.get(index_name)
+    if cached and now - cached[1] < check_seconds:
+        return cached[0]
+
+    response = client.cluster.state(
+        metric="metadata",
+        index=index_name,
+        filter_path=[
+            "metadata.indices.*.mapping_version",
+            "metadata.indices.*.settings.index.uuid",
+        ],
+    )
+    indices = ((response or {}).get("metadata") or {}).get("indices") or {}
+    versions = sorted(
+        (
+            concrete_name,
+            (((metadata or {}).get("settings") or {}).get("index") or {}).get("uuid") or "",
+            (metadata or {}).get("mapping_version"),
+        )
+        for concrete_name, metadata in indices.items()
+    )
+    version = hashlib.sha256(repr(versions).encode("utf-8")).hexdigest()[:16]
+    with _lock:
+        _versions[index_name] = (version, now)
+    return version
+
+
+def get_aggregatable_fields(client, index_name):
+    """
+    Aggregatable field paths of ``index_name``, read from its mapping once per
+    mapping version and shared through the Django cache. Returns None when the
+    mapping cannot be read.
+    """
+    if client is None or not index_name:
+        return None
+
+    try:
+        version = mapping_version(client, index_name)
+        key = f"{CACHE_PREFIX}:{index_name}:{version}"
+        with _lock:
+            fields = _fields_by_version.get(key)
+        if fields is None:
+            fields = cache.get(key)
+        if fields is None:
+            fields = aggregatable_fields_from_mapping(client.indices.get_mapping(index=index_name))
+            cache.set(key, fields, getattr(settings, "SEARCH_GATEWAY_FIELD_MAPPING_CACHE_TTL", 60 * 60 * 24))
+    except Exception as exc:
+        logger.warning("Could not read mapping of %s to resolve aggregation fields: %s", index_name, exc)
+        return None
+
+    with _lock:
+        for cached_key in [k for k in _fields_by_version if k.startswith(f"{CACHE_PREFIX}:{index_name}:")]:
+            if cached_key != key:
+                _fields_by_version.pop(cached_key, None)
+        _fields_by_version[key] = fields
+    return fields
+
+
+def resolve_aggregatable_candidates(client, index_name, candidates):
+    """
+    Orders ``candidates`` and their ``.keyword`` variants, keeping only those
+    the mapping can aggregate on. Falls back to every variant when the mapping
+    is unavailable or none of the candidates is mapped.
+    """
+    expanded = expand_field_variants(candidates)
+    fields = get_aggregatable_fields(client, index_name)
+    if not fields:
+        return expanded
+    resolved = [candidate for candidate in expanded if candidate in fields]
+    return resolved or expanded
+
+
+def clear_field_resolution_cache():
+    with _lock:
+        _versions.clear()
+        _fields_by_version.clear()
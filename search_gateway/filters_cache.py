@@ -1,8 +1,23 @@
+import hashlib
 import json
+import logging
+import pickle
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
-FILTERS_CACHE = {}
-FILTERS_CACHE_TTL_SECONDS = 300
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+SHARED_CACHE_PREFIX = "search_filters"
+FILTERS_CACHE_TTL_SECONDS = getattr(settings, "SEARCH_GATEWAY_FILTERS_CACHE_TTL", 300)
+
+_refresh_executor = None
+_refresh_executor_lock = threading.Lock()
 
 
 def parse_filters_cache_entry(cache_entry):
@@ -68,20 +83,233 @@ def build_filters_cache_key(
     )
 
 
-def get_cached_filters(cache_key, force_refresh=False):
-    if force_refresh or cache_key not in FILTERS_CACHE:
+class LocalLRUCache:
+    """Per-process LRU bounded by entry count and by approximate pickled size."""
+
+    def __init__(self, max_entries, max_bytes):
+        self.max_entries = max(int(max_entries), 1)
+        self.max_bytes = max(int(max_bytes), 1)
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def total_bytes(self):
+        return self._bytes
+
+    def get(self, key):
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            self._entries.move_to_end(key)
+            return item[0]
+
+    def set(self, key, entry):
+        size = _entry_size(entry)
+        with self._lock:
+            self._discard(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (entry, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _key, (_entry, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def delete(self, key):
+        with self._lock:
+            self._discard(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _discard(self, key):
+        item = self._entries.pop(key, None)
+        if item is not None:
+            self._bytes -= item[1]
+
+
+class FiltersCache:
+    """
+    Filter sidebar data cached in a local LRU in front of the shared Django cache.
+
+    Entries younger than ``ttl`` are served as they are. Older entries are
+    still served for ``stale_seconds`` while a single background refresh
+    recomputes them. On a miss only the worker holding the shared lock runs
+    the aggregation; the others wait up to ``wait_seconds`` for its result.
+    """
+
+    def __init__(
+        self,
+        local=None,
+        shared=None,
+        ttl=None,
+        stale_seconds=None,
+        lock_seconds=None,
+        wait_seconds=None,
+    ):
+        self.local = local or LocalLRUCache(
+            max_entries=getattr(settings, "SEARCH_GATEWAY_FILTERS_CACHE_MAX_ENTRIES", 256),
+            max_bytes=getattr(settings, "SEARCH_GATEWAY_FILTERS_CACHE_MAX_BYTES", 32 * 1024 * 1024),
+        )
+        self.shared = shared or cache
+        self.ttl = FILTERS_CACHE_TTL_SECONDS if ttl is None else ttl
+        self.stale_seconds = (
+            getattr(settings, "SEARCH_GATEWAY_FILTERS_CACHE_STALE_SECONDS", 900)
+            if stale_seconds is None
+            else stale_seconds
+        )
+        self.lock_seconds = (
+            getattr(settings, "SEARCH_GATEWAY_FILTERS_CACHE_LOCK_SECONDS", 30)
+            if lock_seconds is None
+            else lock_seconds
+        )
+        self.wait_seconds = (
+            getattr(settings, "SEARCH_GATEWAY_FILTERS_CACHE_WAIT_SECONDS", 5.0)
+            if wait_seconds is None
+            else wait_seconds
+        )
+
+    def storage_key(self, cache_key):
+        digest = hashlib.sha256(repr(cache_key).encode("utf-8")).hexdigest()
+        return f"{SHARED_CACHE_PREFIX}:{digest}"
+
+    def get(self, cache_key):
+        entry = self._get_entry(self.storage_key(cache_key))
+        if self._state(entry) == "fresh":
+            return entry["data"]
         return None
 
-    cached_data, cached_at = parse_filters_cache_entry(FILTERS_CACHE[cache_key])
-    if cached_at is None or (time.monotonic() - cached_at) <= FILTERS_CACHE_TTL_SECONDS:
-        return cached_data
+    def set(self, cache_key, data):
+        self._store(self.storage_key(cache_key), data)
+
+    def clear(self):
+        self.local.clear()
 
-    FILTERS_CACHE.pop(cache_key, None)
-    return None
+    def get_or_compute(self, cache_key, compute, force_refresh=False):
+        storage_key = self.storage_key(cache_key)
+
+        if not force_refresh:
+            entry = self._get_entry(storage_key)
+            state = self._state(entry)
+            if state == "fresh":
+                return entry["data"]
+            if state == "stale":
+                self._refresh_in_background(storage_key, compute)
+                return entry["data"]
+
+        return self._compute_single_flight(storage_key, compute, force_refresh=force_refresh)
+
+    def _state(self, entry):
+        data, cached_at = parse_filters_cache_entry(entry)
+        if entry is None or data is None or cached_at is None:
+            return None
+
+        age = time.time() - cached_at
+        if age <= self.ttl:
+            return "fresh"
+        if age <= self.ttl + self.stale_seconds:
+            return "stale"
+        return None
+
+    def _get_entry(self, storage_key):
+        local_entry = self.local.get(storage_key)
+        if self._state(local_entry) == "fresh":
+            return local_entry
+
+        shared_entry = self.shared.get(storage_key)
+        if self._state(shared_entry) and (
+            local_entry is None or shared_entry["cached_at"] > local_entry["cached_at"]
+        ):
+            self.local.set(storage_key, shared_entry)
+            return shared_entry
+        return local_entry
+
+    def _store(self, storage_key, data):
+        entry = {"data": data, "cached_at": time.time()}
+        self.local.set(storage_key, entry)
+        self.shared.set(storage_key, entry, timeout=self.ttl + self.stale_seconds)
+        return entry
+
+    def _compute_single_flight(self, storage_key, compute, force_refresh=False):
+        lock_key = f"{storage_key}:lock"
+        started_at = time.time()
+
+        if self.shared.add(lock_key, 1, timeout=self.lock_seconds):
+            try:
+                return self._store(storage_key, compute())["data"]
+            finally:
+                self.shared.delete(lock_key)
+
+        entry = self._wait_for_entry(storage_key, newer_than=started_at if force_refresh else None)
+        if entry is not None:
+            return entry["data"]
+
+        logger.info("Filters cache lock wait expired for %s; computing locally", storage_key)
+        return self._store(storage_key, compute())["data"]
+
+    def _wait_for_entry(self, storage_key, newer_than=None):
+        deadline = time.monotonic() + self.wait_seconds
+        delay = 0.05
+        while time.monotonic() < deadline:
+            entry = self.shared.get(storage_key)
+            if self._state(entry) and (newer_than is None or entry["cached_at"] >= newer_than):
+                self.local.set(storage_key, entry)
+                return entry
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+        return None
+
+    def _refresh_in_background(self, storage_key, compute):
+        lock_key = f"{storage_key}:lock"
+        if not self.shared.add(lock_key, 1, timeout=self.lock_seconds):
+            return None
+
+        def refresh():
+            try:
+                self._store(storage_key, compute())
+            except Exception:
+                logger.exception("Error refreshing stale filters cache entry %s", storage_key)
+            finally:
+                self.shared.delete(lock_key)
+                close_old_connections()
+
+        return _get_refresh_executor().submit(refresh)
+
+
+def _get_refresh_executor():
+    global _refresh_executor
+    with _refresh_executor_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="filters-cache")
+        return _refresh_executor
+
+
+def _entry_size(entry):
+    try:
+        return len(pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return len(repr(entry).encode("utf-8"))
+
+
+FILTERS_CACHE = FiltersCache()
+
+
+def get_cached_filters(cache_key, force_refresh=False):
+    if force_refresh:
+        return None
+    return FILTERS_CACHE.get(cache_key)
 
 
 def store_filters_cache(cache_key, filters_data):
-    FILTERS_CACHE[cache_key] = {
-        "data": filters_data,
-        "cached_at": time.monotonic(),
-    }
+    FILTERS_CACHE.set(cache_key, filters_data)
+
+
+def get_or_compute_filters(cache_key, compute, force_refresh=False):
+    return FILTERS_CACHE.get_or_compute(cache_key, compute, force_refresh=force_refresh)
@@ -1,17 +1,52 @@
 import hashlib
 import logging
+import queue
+import threading
 from collections import Counter
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import timedelta
+from datetime import timezone as dt_timezone
 from typing import Any
 
 from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from opensearchpy.helpers import scan, streaming_bulk
 
 from search_gateway.option_normalization import clean_text, normalize_boolean, normalize_text
 from search_gateway.opensearch import OpenSearchIndexClient
+from search_gateway.pagination import close_point_in_time, open_point_in_time, sliced_iterators
 
 logger = logging.getLogger(__name__)
 
+# Merges the metadata lists into an existing lookup document; scalar
+# attributes are only filled when still empty. The document count is left
+# alone: a changed source document was already counted by an earlier build.
+LOOKUP_DELTA_SCRIPT = """
+    for (entry in params.lists.entrySet()) {
+        def current = ctx._source[entry.getKey()];
+        if (current == null) {
+            current = new ArrayList();
+            ctx._source[entry.getKey()] = current;
+        }
+        for (value in entry.getValue()) {
+            if (!current.contains(value)) {
+                current.add(value);
+            }
+        }
+    }
+    for (entry in params.scalars.entrySet()) {
+        def current = ctx._source[entry.getKey()];
+        if (current == null || current == '') {
+            ctx._source[entry.getKey()] = entry.getValue();
+        }
+    }
+"""
+
+_SLICE_DONE = object()
+
 
 class LookupBuilder:
     key: str
@@ -193,6 +228,32 @@ class LookupBuilder:
                 },
             }
 
+    def iter_delta_actions(self, index_name: str) -> Iterable[dict[str, Any]]:
+        """
+        Upserts that merge the collected metadata into existing lookup
+        documents, used by incremental builds. New values are inserted as in a
+        full build; the size of existing values is only refreshed by full builds.
+        """
+        for action in self.iter_actions(index_name):
+            document = action["_source"]
+            lists = {key: value for key, value in document.items() if isinstance(value, list)}
+            scalars = {
+                key: value
+                for key, value in document.items()
+                if key not in lists and key not in ("value", "size") and value not in (None, "")
+            }
+            yield {
+                "_op_type": "update",
+                "_index": index_name,
+                "_id": action["_id"],
+                "script": {
+                    "lang": "painless",
+                    "source": LOOKUP_DELTA_SCRIPT,
+                    "params": {"lists": lists, "scalars": scalars},
+                },
+                "upsert": document,
+            }
+
 
 class LookupIndexBuildService:
     def __init__(
@@ -206,6 +267,9 @@ class LookupIndexBuildService:
         lookup_index_overrides: dict[str, str] | None = None,
         max_items: dict[str, int] | None = None,
         progress=None,
+        incremental: bool = False,
+        since: str | None = None,
+        slices: int | None = None,
     ) -> None:
         self.client = client
         self.lookup_builders = lookup_builders
@@ -216,6 +280,12 @@ class LookupIndexBuildService:
         self.lookup_index_overrides = lookup_index_overrides or {}
         self.max_items = max_items or {}
         self.progress = progress
+        self.incremental = incremental
+        self.since = since
+        self.slices = slices or getattr(settings, "SEARCH_GATEWAY_LOOKUP_SCAN_SLICES", 1)
+        self.watermark_field = getattr(settings, "SEARCH_GATEWAY_LOOKUP_WATERMARK_FIELD", "etl_indexed_at")
+        self.watermark_lag_seconds = getattr(settings, "SEARCH_GATEWAY_LOOKUP_WATERMARK_LAG_SECONDS", 900)
+        self.keep_alive = getattr(settings, "SEARCH_GATEWAY_LOOKUP_SCAN_KEEP_ALIVE", "10m")
 
     def resolve_index_names(self, builders: dict[str, LookupBuilder]) -> dict[str, str]:
         index_names = {
@@ -255,28 +325,200 @@ class LookupIndexBuildService:
                     "or delete the existing index first."
                 )
 
-    def collect(self, builders: dict[str, LookupBuilder]) -> int:
-        source_fields = sorted(
-            {field for builder in builders.values() for field in builder.source_fields}
+    def current_watermark(self) -> str | None:
+        """
+        Watermark for a build, read before scanning: the latest watermark field
+        value in the source index, held back to SEARCH_GATEWAY_LOOKUP_WATERMARK_LAG_SECONDS
+        ago. Documents stamped just before the latest value may still be in
+        flight or not yet refreshed; with the lag the next incremental build
+        reads them again, which is safe since delta updates are idempotent.
+        """
+        response = self.client.search(
+            index=self.source_index,
+            body={
+                "size": 0,
+                "track_total_hits": False,
+                "aggs": {"watermark": {"max": {"field": self.watermark_field}}},
+            },
+        )
+        aggregations = response.get("aggregations") if isinstance(response, dict) else None
+        value = ((aggregations or {}).get("watermark") or {}).get("value_as_string")
+        if not isinstance(value, str):
+            return None
+
+        latest_at = parse_datetime(value)
+        settled_at = timezone.now() - timedelta(seconds=self.watermark_lag_seconds)
+        if latest_at is None or latest_at <= settled_at:
+            return value
+        return settled_at.astimezone(dt_timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+    def read_watermarks(self, index_names: dict[str, str]) -> dict[str, str]:
+        watermarks = {}
+        for lookup_key, index_name in index_names.items():
+            if not self.client.indices.exists(index=index_name):
+                raise ValueError(
+                    f"Lookup index '{index_name}' for lookup '{lookup_key}' does not exist. "
+                    "Run a full build before an incremental one."
+                )
+            if self.since:
+                watermarks[lookup_key] = self.since
+                continue
+
+            mapping = self.client.indices.get_mapping(index=index_name)
+            meta = next(iter(mapping.values()), {}).get("mappings", {}).get("_meta", {})
+            if not meta.get("watermark"):
+                raise ValueError(
+                    f"Lookup index '{index_name}' has no build watermark. "
+                    "Run a full build or pass --since."
+                )
+            watermarks[lookup_key] = meta["watermark"]
+        return watermarks
+
+    def watermark_meta(self, watermark: str) -> dict[str, Any]:
+        return {
+            "source_index": self.source_index,
+            "watermark_field": self.watermark_field,
+            "watermark": watermark,
+        }
+
+    def record_watermark(self, index_name: str, watermark: str) -> None:
+        self.client.indices.put_mapping(
+            index=index_name,
+            body={"_meta": self.watermark_meta(watermark)},
+        )
+
+    def source_query(
+        self,
+        source_fields: list[str],
+        after: str | None = None,
+        until: str | None = None,
+    ) -> dict[str, Any]:
+        if after:
+            window = {"gt": after}
+            if until:
+                window["lte"] = until
+            query = {"bool": {"filter": [{"range": {self.watermark_field: window}}]}}
+        elif until:
+            # Documents without the field are included; later ones are left
+            # to the next incremental build.
+            query = {"bool": {"must_not": [{"range": {self.watermark_field: {"gt": until}}}]}}
+        else:
+            query = {"match_all": {}}
+        return {"_source": source_fields, "query": query}
+
+    def iter_source_hits(self, query: dict[str, Any]) -> Iterable[dict[str, Any]]:
+        if self.slices <= 1:
+            yield from scan(self.client, index=self.source_index, query=query, size=self.batch_size)
+            return
+        yield from self.iter_sliced_hits(query)
+
+    def iter_sliced_hits(self, query: dict[str, Any]) -> Iterable[dict[str, Any]]:
+        """
+        Reads the source index with ``slices`` point-in-time slices in
+        parallel threads. Pages are handed to the caller through a bounded
+        queue, so builders are still fed from a single thread.
+        """
+        pit_id = open_point_in_time(self.client, self.source_index, self.keep_alive)
+        pages: queue.Queue = queue.Queue(maxsize=self.slices * 2)
+        stop = threading.Event()
+
+        def put(item) -> None:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=1)
+                    return
+                except queue.Full:
+                    continue
+
+        def read_slice(iterator) -> None:
+            try:
+                page = []
+                for hit in iterator:
+                    if stop.is_set():
+                        return
+                    page.append(hit)
+                    if len(page) >= self.batch_size:
+                        put(page)
+                        page = []
+                if page:
+                    put(page)
+            except Exception as exc:
+                put(exc)
+            finally:
+                put(_SLICE_DONE)
+
+        iterators = sliced_iterators(
+            self.client,
+            self.source_index,
+            {**query, "size": self.batch_size},
+            self.slices,
+            pit_id=pit_id,
+            keep_alive=self.keep_alive,
         )
-        query = {"_source": source_fields, "query": {"match_all": {}}}
+        try:
+            with ThreadPoolExecutor(max_workers=self.slices) as executor:
+                for iterator in iterators:
+                    executor.submit(read_slice, iterator)
+                try:
+                    remaining = self.slices
+                    while remaining:
+                        item = pages.get()
+                        if item is _SLICE_DONE:
+                            remaining -= 1
+                        elif isinstance(item, Exception):
+                            raise item
+                        else:
+                            yield from item
+                finally:
+                    stop.set()
+        finally:
+            close_point_in_time(self.client, pit_id)
+
+    @staticmethod
+    def _is_after(value: Any, watermark: str | None) -> bool:
+        if not watermark:
+            return True
+        changed_at = parse_datetime(str(value)) if value else None
+        watermark_at = parse_datetime(watermark)
+        if changed_at is None or watermark_at is None:
+            return True
+        try:
+            return changed_at > watermark_at
+        except TypeError:
+            return True
+
+    def collect(
+        self,
+        builders: dict[str, LookupBuilder],
+        after: str | None = None,
+        until: str | None = None,
+        watermarks: dict[str, str] | None = None,
+    ) -> int:
+        source_fields = {field for builder in builders.values() for field in builder.source_fields}
+        if watermarks:
+            source_fields.add(self.watermark_field)
+        query = self.source_query(sorted(source_fields), after=after, until=until)
 
         processed = 0
         if self.progress:
             self.progress(f"Scanning source index '{self.source_index}'...")
 
-        for hit in scan(self.client, index=self.source_index, query=query, size=self.batch_size):
-            source = hit.get("_source", {})
-            processed += 1
+        with closing(self.iter_source_hits(query)) as hits:
+            for hit in hits:
+                source = hit.get("_source", {})
+                processed += 1
+                changed_at = source.get(self.watermark_field) if watermarks else None
 
-            for lookup_key, builder in builders.items():
-                builder.collect(source, self.max_items.get(lookup_key))
+                for lookup_key, builder in builders.items():
+                    if watermarks and not self._is_after(changed_at, watermarks.get(lookup_key)):
+                        continue
+                    builder.collect(source, self.max_items.get(lookup_key))
 
-            if self.progress and processed % 10000 == 0:
-                self.progress(f"Processed {processed:,} source documents...")
+                if self.progress and processed % 10000 == 0:
+                    self.progress(f"Processed {processed:,} source documents...")
 
-            if self.max_docs is not None and processed >= self.max_docs:
-                break
+                if self.max_docs is not None and processed >= self.max_docs:
+                    break
 
         if self.progress:
             self.progress(f"Finished scanning {processed:,} documents.")
@@ -355,6 +597,7 @@ class LookupIndexBuildService:
         index_name: str,
         actions: Iterable[dict[str, Any]],
         expected_count: int,
+        verify_count: bool = True,
     ) -> dict[str, int]:
         success = 0
         error_count = 0
@@ -410,6 +653,9 @@ class LookupIndexBuildService:
             self.progress(f"Finished indexing {success:,} documents in '{index_name}'.")
 
         self.client.indices.refresh(index=index_name)
+        if not verify_count:
+            return {"indexed": success, "errors": error_count}
+
         count_response = self.client.count(index=index_name)
 
         if hasattr(count_response, "get"):
@@ -439,12 +685,23 @@ class LookupIndexBuildService:
 
         return {"indexed": success, "errors": error_count}
 
-    def create_indices(self, builders: dict[str, LookupBuilder], index_names: dict[str, str]) -> None:
+    def create_indices(
+        self,
+        builders: dict[str, LookupBuilder],
+        index_names: dict[str, str],
+        watermark: str | None = None,
+    ) -> None:
         for lookup_key, builder in builders.items():
             index_name = index_names[lookup_key]
-            self.client.indices.create(index=index_name, body=builder.mapping)
+            body = builder.mapping
+            if watermark:
+                body["mappings"]["_meta"] = self.watermark_meta(watermark)
+            self.client.indices.create(index=index_name, body=body)
 
     def run(self) -> dict[str, Any]:
+        if self.incremental:
+            return self.run_incremental()
+
         builders: dict[str, LookupBuilder] = {
             key: self.lookup_builders[key]() for key in self.selected_lookups
         }
@@ -453,12 +710,13 @@ class LookupIndexBuildService:
         self.validate_source()
         self.validate_targets(index_names)
 
-        processed_docs = self.collect(builders)
+        watermark = self.current_watermark()
+        processed_docs = self.collect(builders, until=watermark)
         indexed_counts: dict[str, Any] = {"_processed_docs": processed_docs}
         error_counts: dict[str, int] = {}
 
         self.validate_targets(index_names)
-        self.create_indices(builders, index_names)
+        self.create_indices(builders, index_names, watermark)
 
         for lookup_key, builder in builders.items():
             index_name = index_names[lookup_key]
@@ -483,3 +741,64 @@ class LookupIndexBuildService:
             indexed_counts["_errors"] = error_counts
 
         return indexed_counts
+
+    def run_incremental(self) -> dict[str, Any]:
+        """
+        Applies the documents changed since each lookup's build watermark to
+        its existing index, then advances the watermark.
+
+        New values are added with their counts and existing values get the new
+        metadata, but their size is not changed: without the previous version
+        of a changed document its old contribution cannot be subtracted, so
+        sizes are only refreshed by full rebuilds.
+        """
+        builders: dict[str, LookupBuilder] = {
+            key: self.lookup_builders[key]() for key in self.selected_lookups
+        }
+        index_names = self.resolve_index_names(builders)
+
+        self.validate_source()
+        watermarks = self.read_watermarks(index_names)
+        new_watermark = self.current_watermark()
+        if not new_watermark:
+            raise ValueError(
+                f"Source index '{self.source_index}' has no '{self.watermark_field}' values "
+                "to build incrementally from."
+            )
+
+        processed_docs = self.collect(
+            builders,
+            after=min(watermarks.values()),
+            until=new_watermark,
+            watermarks=watermarks,
+        )
+        indexed_counts: dict[str, Any] = {"_processed_docs": processed_docs}
+        error_counts: dict[str, int] = {}
+
+        for lookup_key, builder in builders.items():
+            index_name = index_names[lookup_key]
+            if self.progress:
+                self.progress(
+                    f"Applying {builder.count():,} changed values for lookup '{lookup_key}' "
+                    f"since {watermarks[lookup_key]}."
+                )
+
+            bulk_result = self.bulk_index(
+                lookup_key,
+                index_name,
+                builder.iter_delta_actions(index_name),
+                builder.count(),
+                verify_count=False,
+            )
+            # The watermark advances even after partial errors; those are
+            # recorded by bulk_index.
+            self.record_watermark(index_name, new_watermark)
+
+            indexed_counts[lookup_key] = bulk_result["indexed"]
+            if bulk_result["errors"]:
+                error_counts[lookup_key] = bulk_result["errors"]
+
+        if error_counts:
+            indexed_counts["_errors"] = error_counts
+
+        return indexed_counts
@@ -98,6 +98,26 @@ class Command(BaseCommand):
             default=[],
             help="Optional limit of unique values per lookup in KEY=LIMIT format. Repeat as needed.",
         )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help=(
+                "Apply only source documents changed since each lookup index's build "
+                "watermark to the existing lookup indexes. Sizes of values already "
+                "indexed are only refreshed by full builds."
+            ),
+        )
+        parser.add_argument(
+            "--since",
+            default=None,
+            help="Watermark override for --incremental (e.g. 2026-01-01T00:00:00Z).",
+        )
+        parser.add_argument(
+            "--slices",
+            type=int,
+            default=None,
+            help="Parallel point-in-time slices used to read the source index.",
+        )
         parser.add_argument(
             "--enqueue",
             action="store_true",
@@ -109,6 +129,10 @@ class Command(BaseCommand):
             raise CommandError("--batch-size must be >= 1.")
         if options["max_docs"] is not None and options["max_docs"] < 1:
             raise CommandError("--max-docs must be >= 1.")
+        if options["slices"] is not None and options["slices"] < 1:
+            raise CommandError("--slices must be >= 1.")
+        if options["since"] and not options["incremental"]:
+            raise CommandError("--since requires --incremental.")
 
         try:
             lookup_index_overrides = dict(
@@ -123,6 +147,9 @@ class Command(BaseCommand):
         batch_size = options["batch_size"]
         max_docs = options["max_docs"]
         selected_lookups = options["lookups"] or DEFAULT_LOOKUPS.copy()
+        incremental = options["incremental"]
+        since = options["since"]
+        slices = options["slices"]
 
         if options["enqueue"]:
             result = build_lookup_indices_task.delay(
@@ -132,6 +159,9 @@ class Command(BaseCommand):
                 selected_lookups=selected_lookups,
                 lookup_index_overrides=lookup_index_overrides,
                 max_items=max_items,
+                incremental=incremental,
+                since=since,
+                slices=slices,
             )
             self.stdout.write(
                 self.style.SUCCESS(
@@ -153,6 +183,9 @@ class Command(BaseCommand):
                 lookup_index_overrides=lookup_index_overrides,
                 max_items=max_items,
                 progress=lambda message: self.stdout.write(message),
+                incremental=incremental,
+                since=since,
+                slices=slices,
             ).run()
         except Exception as exc:
             raise CommandError(str(exc)) from exc
@@ -69,7 +69,45 @@ class OpenSearchIndexClient:
         refresh: bool = False,
     ):
         index_name = error_index_name or settings.SEARCH_GATEWAY_ERROR_INDEX
-        body = {
+        body = self._error_body(
+            component=component,
+            operation=operation,
+            message=message,
+            error_type=error_type,
+            traceback_text=traceback_text,
+            context=context,
+        )
+        return self.client.index(index=index_name, body=body, refresh=refresh)
+
+    def bulk_index_errors(
+        self,
+        errors: list[dict[str, Any]],
+        *,
+        error_index_name: str | None = None,
+        refresh: bool = False,
+    ):
+        """Indexes many error log rows (``index_error`` keyword dicts) in one ``_bulk`` call."""
+        if not errors:
+            return None
+
+        index_name = error_index_name or settings.SEARCH_GATEWAY_ERROR_INDEX
+        actions = []
+        for error in errors:
+            actions.append({"index": {"_index": index_name}})
+            actions.append(self._error_body(**error))
+        return self.client.bulk(body=actions, refresh=refresh)
+
+    def _error_body(
+        self,
+        *,
+        component: str,
+        operation: str,
+        message: str,
+        error_type: str = "",
+        traceback_text: str = "",
+        context: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        return {
             "component": component,
             "operation": operation,
             "message": message,
@@ -78,7 +116,6 @@ class OpenSearchIndexClient:
             "context": context or {},
             "created_at": timezone.now().isoformat(),
         }
-        return self.client.index(index=index_name, body=body, refresh=refresh)
 
     def scroll_all(self, index_name: str, query: dict[str, Any] | None = None, batch_size: int = 1000):
         scroll_id = None
@@ -0,0 +1,146 @@
+import copy
+import logging
+from typing import Any
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_KEEP_ALIVE = "5m"
+
+
+def tiebreaker_sort() -> list[dict[str, Any]]:
+    field = getattr(settings, "SEARCH_GATEWAY_PIT_TIEBREAKER_FIELD", "_shard_doc")
+    return [{field: "asc"}]
+
+
+def open_point_in_time(client, index: str, keep_alive: str = DEFAULT_KEEP_ALIVE) -> str:
+    response = client.create_pit(index=index, keep_alive=keep_alive)
+    return response["pit_id"]
+
+
+def close_point_in_time(client, pit_id: str | None) -> None:
+    if not pit_id:
+        return
+    try:
+        client.delete_pit(body={"pit_id": [pit_id]})
+    except Exception:
+        logger.exception("Failed to close OpenSearch point in time")
+
+
+class PointInTimeIterator:
+    """
+    Iterates every hit of a query using a point in time and ``search_after``.
+
+    The query sort gets a tiebreaker appended so pages are stable, and
+    ``last_sort`` holds the sort key of the last yielded hit; passing it back
+    as ``search_after`` resumes the iteration right after that hit. When
+    ``pit_id`` is given the caller owns the point in time (e.g. sliced reads
+    sharing one PIT) and it is not closed here.
+    """
+
+    def __init__(
+        self,
+        client,
+        index: str,
+        body: dict[str, Any] | None = None,
+        *,
+        page_size: int | None = None,
+        keep_alive: str = DEFAULT_KEEP_ALIVE,
+        search_after: list[Any] | None = None,
+        slice_id: int | None = None,
+        max_slices: int | None = None,
+        pit_id: str | None = None,
+    ):
+        self.client = client
+        self.index = index
+        self.body = body or {}
+        self.page_size = page_size or self.body.get("size") or DEFAULT_PAGE_SIZE
+        self.keep_alive = keep_alive
+        self.last_sort = list(search_after) if search_after else None
+        self.slice_id = slice_id
+        self.max_slices = max_slices
+        self.pit_id = pit_id
+        self._owns_pit = pit_id is None
+
+    def __iter__(self):
+        if self._owns_pit:
+            self.pit_id = open_point_in_time(self.client, self.index, self.keep_alive)
+        try:
+            while True:
+                response = self.client.search(body=self._page_body())
+                self.pit_id = response.get("pit_id") or self.pit_id
+                hits = response.get("hits", {}).get("hits", [])
+                for hit in hits:
+                    self.last_sort = hit.get("sort")
+                    yield hit
+                if len(hits) < self.page_size:
+                    break
+        finally:
+            if self._owns_pit:
+                close_point_in_time(self.client, self.pit_id)
+                self.pit_id = None
+
+    def _page_body(self) -> dict[str, Any]:
+        body = {
+            key: copy.deepcopy(value)
+            for key, value in self.body.items()
+            if key not in ("size", "sort", "from", "search_after", "pit", "slice")
+        }
+        body["size"] = self.page_size
+        body["sort"] = self._sort()
+        body["pit"] = {"id": self.pit_id, "keep_alive": self.keep_alive}
+        body.setdefault("track_total_hits", False)
+        if self.last_sort:
+            body["search_after"] = self.last_sort
+        if self.max_slices and self.max_slices > 1:
+            body["slice"] = {"id": self.slice_id or 0, "max": self.max_slices}
+        return body
+
+    def _sort(self) -> list[Any]:
+        sort = self.body.get("sort") or []
+        if not isinstance(sort, list):
+            sort = [sort]
+        sort = copy.deepcopy(sort)
+        for tiebreaker in tiebreaker_sort():
+            field = next(iter(tiebreaker))
+            if not any(_sort_field(entry) == field for entry in sort):
+                sort.append(tiebreaker)
+        return sort
+
+
+def _sort_field(entry) -> str:
+    if isinstance(entry, str):
+        return entry
+    if isinstance(entry, dict) and entry:
+        return next(iter(entry))
+    return ""
+
+
+def iter_pit_hits(client, index: str, body: dict[str, Any] | None = None, **kwargs):
+    yield from PointInTimeIterator(client, index, body, **kwargs)
+
+
+def sliced_iterators(
+    client,
+    index: str,
+    body: dict[str, Any] | None,
+    slices: int,
+    *,
+    pit_id: str,
+    **kwargs,
+) -> list[PointInTimeIterator]:
+    """Builds one iterator per slice over a PIT opened by the caller."""
+    return [
+        PointInTimeIterator(
+            client,
+            index,
+            body,
+            slice_id=slice_id,
+            max_slices=slices,
+            pit_id=pit_id,
+            **kwargs,
+        )
+        for slice_id in range(slices)
+    ]
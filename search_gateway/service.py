@@ -13,8 +13,7 @@ from .filter_mapping import (
 )
 from .filters_cache import (
     build_filters_cache_key,
-    get_cached_filters,
-    store_filters_cache,
+    get_or_compute_filters,
 )
 from .models import DataSource
 from .option_normalization import clean_text
@@ -336,22 +335,23 @@ class SearchGatewayService:
             field_settings=field_settings,
         )
 
-        cached_data = get_cached_filters(cache_key, force_refresh=force_refresh)
-        if cached_data is not None:
-            return cached_data, None
-
         aggs = build_filters_aggs(field_settings, exclude_fields)
         mapped_filters = get_mapped_filters(filters or {}, filter_mapping_field_settings)
         body = build_filters_body(aggs, mapped_filters=mapped_filters)
 
-        try:
+        def compute_filters_data():
             response = self._search(body)
-
-            filters_data = parse_filters_response(
+            return parse_filters_response(
                 response,
                 self.data_source,
             )
-            store_filters_cache(cache_key, filters_data)
+
+        try:
+            filters_data = get_or_compute_filters(
+                cache_key,
+                compute_filters_data,
+                force_refresh=force_refresh,
+            )
             return filters_data, None
         except Exception as exc:
             return None, f"Error retrieving filters: {exc}"
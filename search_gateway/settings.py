@@ -37,6 +37,65 @@ SEARCH_GATEWAY_LOOKUP_SOURCE_TYPES = _env.list(
     "SEARCH_GATEWAY_LOOKUP_SOURCE_TYPES",
     default=["journal", "conference"],
 )
+# Lookup builds: source field recorded as the build watermark for incremental
+# runs (the write time the ETL stamps on silver documents), and parallel PIT
+# slices read by full rebuilds (1 disables slicing)
+SEARCH_GATEWAY_LOOKUP_WATERMARK_FIELD = _env.str(
+    "SEARCH_GATEWAY_LOOKUP_WATERMARK_FIELD",
+    default="etl_indexed_at",
+)
+SEARCH_GATEWAY_LOOKUP_SCAN_SLICES = _env.int("SEARCH_GATEWAY_LOOKUP_SCAN_SLICES", default=1)
+SEARCH_GATEWAY_LOOKUP_SCAN_KEEP_ALIVE = _env.str(
+    "SEARCH_GATEWAY_LOOKUP_SCAN_KEEP_ALIVE",
+    default="10m",
+)
+# Seconds the recorded watermark is held behind the latest source value, so
+# documents still being written or refreshed are read by the next build
+SEARCH_GATEWAY_LOOKUP_WATERMARK_LAG_SECONDS = _env.int(
+    "SEARCH_GATEWAY_LOOKUP_WATERMARK_LAG_SECONDS",
+    default=900,
+)
+# Filter sidebar aggregations: bounded per-worker LRU in front of the shared
+# Django cache. Entries older than the TTL are still served for STALE seconds
+# while a single worker refreshes them.
+SEARCH_GATEWAY_FILTERS_CACHE_TTL = _env.int("SEARCH_GATEWAY_FILTERS_CACHE_TTL", default=300)
+SEARCH_GATEWAY_FILTERS_CACHE_STALE_SECONDS = _env.int(
+    "SEARCH_GATEWAY_FILTERS_CACHE_STALE_SECONDS",
+    default=900,
+)
+SEARCH_GATEWAY_FILTERS_CACHE_MAX_ENTRIES = _env.int(
+    "SEARCH_GATEWAY_FILTERS_CACHE_MAX_ENTRIES",
+    default=256,
+)
+SEARCH_GATEWAY_FILTERS_CACHE_MAX_BYTES = _env.int(
+    "SEARCH_GATEWAY_FILTERS_CACHE_MAX_BYTES",
+    default=32 * 1024 * 1024,
+)
+SEARCH_GATEWAY_FILTERS_CACHE_LOCK_SECONDS = _env.int(
+    "SEARCH_GATEWAY_FILTERS_CACHE_LOCK_SECONDS",
+    default=30,
+)
+SEARCH_GATEWAY_FILTERS_CACHE_WAIT_SECONDS = _env.float(
+    "SEARCH_GATEWAY_FILTERS_CACHE_WAIT_SECONDS",
+    default=5.0,
+)
+# Aggregatable field variants resolved from the index mapping, cached per
+# concrete index; the concrete indices behind an alias are re-checked every
+# CHECK_SECONDS.
+SEARCH_GATEWAY_FIELD_MAPPING_CHECK_SECONDS = _env.int(
+    "SEARCH_GATEWAY_FIELD_MAPPING_CHECK_SECONDS",
+    default=300,
+)
+SEARCH_GATEWAY_FIELD_MAPPING_CACHE_TTL = _env.int(
+    "SEARCH_GATEWAY_FIELD_MAPPING_CACHE_TTL",
+    default=60 * 60 * 24,
+)
+# Tiebreaker appended to point-in-time/search_after sorts so pages are stable.
+# _shard_doc is unique within a PIT and, unlike _id, loads no fielddata.
+SEARCH_GATEWAY_PIT_TIEBREAKER_FIELD = _env.str(
+    "SEARCH_GATEWAY_PIT_TIEBREAKER_FIELD",
+    default="_shard_doc",
+)
 SEARCH_GATEWAY_ERROR_INDEX = _env.str(
     "SEARCH_GATEWAY_ERROR_INDEX",
     default="search_gateway_errors",
@@ -58,3 +117,11 @@ DATA_FRESHNESS_FALLBACK_DATE = _env.str(
     "DATA_FRESHNESS_FALLBACK_DATE",
     default="",
 )
+
+# Indicator results cached per data source, filters, study unit and language.
+# ETL writes start a new cache generation.
+INDICATOR_RESULT_CACHE_ENABLED = _env.bool("INDICATOR_RESULT_CACHE_ENABLED", default=True)
+INDICATOR_RESULT_CACHE_TTL = _env.int(
+    "INDICATOR_RESULT_CACHE_TTL",
+    default=60 * 60 * 6,
+)
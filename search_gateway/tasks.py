@@ -19,6 +19,9 @@ def build_lookup_indices_task(
     selected_lookups=None,
     lookup_index_overrides=None,
     max_items=None,
+    incremental=False,
+    since=None,
+    slices=None,
     **kwargs,
 ):
     if not source_index:
@@ -43,4 +46,7 @@ def build_lookup_indices_task(
         lookup_index_overrides=dict(lookup_index_overrides or {}),
         max_items=dict(max_items or {}),
         progress=progress,
+        incremental=incremental,
+        since=since,
+        slices=slices,
     ).run()
@@ -1,3 +1,5 @@
+from datetime import datetime
+from datetime import timezone as dt_timezone
 from unittest.mock import Mock, patch
 
 from django.core.management import call_command
@@ -452,6 +454,169 @@ class BuildLookupCommandTests(SimpleTestCase):
         self.assertEqual(error_body["context"]["sample_errors"][0]["error"], "mapping error")
         client.indices.delete.assert_not_called()
 
+    @override_settings(SEARCH_GATEWAY_LOOKUP_WATERMARK_LAG_SECONDS=600)
+    @patch("search_gateway.lookup.base.timezone.now")
+    def test_watermark_is_held_behind_recent_source_values(self, now_mock):
+        now_mock.return_value = datetime(2026, 3, 1, 12, 0, tzinfo=dt_timezone.utc)
+        client = Mock()
+        service = LookupIndexBuildService(
+            client=client,
+            lookup_builders=LOOKUP_BUILDERS,
+            source_index="scientific_production",
+            batch_size=100,
+            selected_lookups=["publisher"],
+        )
+
+        client.search.return_value = {
+            "aggregations": {"watermark": {"value": 1, "value_as_string": "2026-03-01T11:58:00.000Z"}}
+        }
+        self.assertEqual(service.current_watermark(), "2026-03-01T11:50:00.000Z")
+
+        client.search.return_value = {
+            "aggregations": {"watermark": {"value": 1, "value_as_string": "2026-03-01T11:00:00.000Z"}}
+        }
+        self.assertEqual(service.current_watermark(), "2026-03-01T11:00:00.000Z")
+
+    @patch("search_gateway.lookup.base.streaming_bulk")
+    @patch("search_gateway.lookup.base.scan")
+    def test_full_build_records_watermark_in_lookup_index_meta(self, scan_mock, streaming_bulk_mock):
+        client = Mock()
+        client.ping.return_value = True
+        client.indices.exists.side_effect = lambda index: index == "scientific_production"
+        client.search.return_value = {
+            "aggregations": {"watermark": {"value": 1, "value_as_string": "2026-01-01T00:00:00.000Z"}}
+        }
+        client.count.return_value = {"count": 0}
+        scan_mock.return_value = []
+        streaming_bulk_mock.return_value = []
+
+        LookupIndexBuildService(
+            client=client,
+            lookup_builders=LOOKUP_BUILDERS,
+            source_index="scientific_production",
+            batch_size=100,
+            selected_lookups=["publisher"],
+        ).run()
+
+        body = client.indices.create.call_args.kwargs["body"]
+        self.assertEqual(body["mappings"]["_meta"]["watermark"], "2026-01-01T00:00:00.000Z")
+        query = scan_mock.call_args.kwargs["query"]["query"]
+        self.assertEqual(
+            query,
+            {"bool": {"must_not": [{"range": {"etl_indexed_at": {"gt": "2026-01-01T00:00:00.000Z"}}}]}},
+        )
+
+    @patch("search_gateway.lookup.base.streaming_bulk")
+    @patch("search_gateway.lookup.base.scan")
+    def test_incremental_build_applies_changes_since_watermark(self, scan_mock, streaming_bulk_mock):
+        client = Mock()
+        client.ping.return_value = True
+        client.indices.exists.return_value = True
+        client.indices.get_mapping.return_value = {
+            "silver_lookup_publisher": {"mappings": {"_meta": {"watermark": "2026-01-01T00:00:00Z"}}}
+        }
+        client.search.return_value = {
+            "aggregations": {"watermark": {"value": 1, "value_as_string": "2026-02-01T00:00:00.000Z"}}
+        }
+        scan_mock.return_value = [
+            {
+                "_source": {
+                    "etl_indexed_at": "2026-01-15T10:00:00+00:00",
+                    "source": [{"type": "journal"}],
+                    "publishers": [{"name": "SciELO"}],
+                }
+            },
+            {
+                "_source": {
+                    "etl_indexed_at": "2025-12-31T10:00:00+00:00",
+                    "source": [{"type": "journal"}],
+                    "publishers": [{"name": "Older"}],
+                }
+            },
+        ]
+        sent = []
+
+        def fake_streaming_bulk(client, actions, **kwargs):
+            for action in actions:
+                sent.append(action)
+                yield True, {"update": {"_id": action["_id"]}}
+
+        streaming_bulk_mock.side_effect = fake_streaming_bulk
+
+        counts = LookupIndexBuildService(
+            client=client,
+            lookup_builders=LOOKUP_BUILDERS,
+            source_index="scientific_production",
+            batch_size=100,
+            selected_lookups=["publisher"],
+            incremental=True,
+        ).run()
+
+        self.assertEqual(counts["publisher"], 1)
+        self.assertEqual(len(sent), 1)
+        self.assertEqual(sent[0]["_op_type"], "update")
+        self.assertEqual(sent[0]["upsert"]["value"], "SciELO")
+        self.assertEqual(sent[0]["upsert"]["size"], 1)
+        self.assertNotIn("size", sent[0]["script"]["params"])
+        self.assertNotIn("size", sent[0]["script"]["source"])
+        self.assertEqual(sent[0]["script"]["params"]["lists"]["source_types"], ["journal"])
+        window = scan_mock.call_args.kwargs["query"]["query"]["bool"]["filter"][0]["range"]["etl_indexed_at"]
+        self.assertEqual(window, {"gt": "2026-01-01T00:00:00Z", "lte": "2026-02-01T00:00:00.000Z"})
+        client.indices.create.assert_not_called()
+        client.count.assert_not_called()
+        client.indices.put_mapping.assert_called_once_with(
+            index="silver_lookup_publisher",
+            body={
+                "_meta": {
+                    "source_index": "scientific_production",
+                    "watermark_field": "etl_indexed_at",
+                    "watermark": "2026-02-01T00:00:00.000Z",
+                }
+            },
+        )
+
+    def test_incremental_build_requires_existing_watermark(self):
+        client = Mock()
+        client.ping.return_value = True
+        client.indices.exists.return_value = True
+        client.indices.get_mapping.return_value = {"silver_lookup_publisher": {"mappings": {}}}
+
+        with self.assertRaisesMessage(ValueError, "has no build watermark"):
+            LookupIndexBuildService(
+                client=client,
+                lookup_builders=LOOKUP_BUILDERS,
+                source_index="scientific_production",
+                batch_size=100,
+                selected_lookups=["publisher"],
+                incremental=True,
+            ).run()
+
+    def test_sliced_scan_reads_every_slice_of_one_point_in_time(self):
+        slice_hits = {
+            0: [{"_id": "a", "_source": {"n": 1}, "sort": ["a"]}],
+            1: [{"_id": "b", "_source": {"n": 2}, "sort": ["b"]}, {"_id": "c", "_source": {"n": 3}, "sort": ["c"]}],
+        }
+        client = Mock()
+        client.create_pit.return_value = {"pit_id": "pit-1"}
+        client.search.side_effect = lambda body: {
+            "pit_id": "pit-1",
+            "hits": {"hits": [] if "search_after" in body else slice_hits[body["slice"]["id"]]},
+        }
+        service = LookupIndexBuildService(
+            client=client,
+            lookup_builders=LOOKUP_BUILDERS,
+            source_index="scientific_production",
+            batch_size=2,
+            selected_lookups=["publisher"],
+            slices=2,
+        )
+
+        hits = list(service.iter_source_hits({"_source": ["n"], "query": {"match_all": {}}}))
+
+        self.assertEqual(sorted(hit["_id"] for hit in hits), ["a", "b", "c"])
+        client.create_pit.assert_called_once()
+        client.delete_pit.assert_called_once_with(body={"pit_id": ["pit-1"]})
+
 
     @patch("search_gateway.management.commands.build_lookup_indices.LookupIndexBuildService")
     @patch("search_gateway.management.commands.build_lookup_indices.get_opensearch_client")
@@ -486,4 +651,7 @@ class BuildLookupCommandTests(SimpleTestCase):
             selected_lookups=["source"],
             lookup_index_overrides={"source": "lookup_source_v2"},
             max_items={},
+            incremental=False,
+            since=None,
+            slices=None,
         )
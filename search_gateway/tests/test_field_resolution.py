@@ -0,0 +1,110 @@
+from unittest.mock import Mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from search_gateway.field_resolution import (
+    aggregatable_fields_from_mapping,
+    clear_field_resolution_cache,
+    resolve_aggregatable_candidates,
+)
+
+MAPPING = {
+    "silver_v2": {
+        "mappings": {
+            "properties": {
+                "country": {"type": "text", "fields": {"keyword": {"type": "keyword"}}},
+                "publication_year": {"type": "integer"},
+                "title": {"type": "text"},
+                "tags": {"type": "text", "fielddata": True},
+                "source": {
+                    "properties": {
+                        "issn": {"type": "keyword"},
+                        "raw": {"type": "keyword", "doc_values": False},
+                    }
+                },
+            }
+        }
+    }
+}
+
+
+def cluster_state(index_name="silver_v2", uuid="abc", mapping_version=1):
+    return {
+        "metadata": {
+            "indices": {
+                index_name: {
+                    "mapping_version": mapping_version,
+                    "settings": {"index": {"uuid": uuid}},
+                }
+            }
+        }
+    }
+
+
+def build_client(uuid="abc"):
+    client = Mock()
+    client.cluster.state.return_value = cluster_state(uuid=uuid)
+    client.indices.get_mapping.return_value = MAPPING
+    return client
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class FieldResolutionTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        clear_field_resolution_cache()
+        self.addCleanup(clear_field_resolution_cache)
+
+    def test_collects_aggregatable_paths_and_subfields(self):
+        self.assertEqual(
+            aggregatable_fields_from_mapping(MAPPING),
+            {"country.keyword", "publication_year", "tags", "source.issn"},
+        )
+
+    def test_picks_keyword_variant_of_text_field(self):
+        client = build_client()
+
+        resolved = resolve_aggregatable_candidates(client, "silver", ["country", "author_country_codes"])
+
+        self.assertEqual(resolved, ["country.keyword"])
+
+    def test_mapping_is_read_once_per_version(self):
+        client = build_client()
+
+        resolve_aggregatable_candidates(client, "silver", ["country"])
+        resolve_aggregatable_candidates(client, "silver", ["publication_year"])
+
+        client.indices.get_mapping.assert_called_once_with(index="silver")
+        client.cluster.state.assert_called_once()
+
+    @override_settings(SEARCH_GATEWAY_FIELD_MAPPING_CHECK_SECONDS=0)
+    def test_new_concrete_index_reloads_mapping(self):
+        client = build_client()
+        resolve_aggregatable_candidates(client, "silver", ["country"])
+
+        client.cluster.state.return_value = cluster_state(index_name="silver_v3", uuid="def")
+        resolve_aggregatable_candidates(client, "silver", ["country"])
+
+        self.assertEqual(client.indices.get_mapping.call_count, 2)
+
+    @override_settings(SEARCH_GATEWAY_FIELD_MAPPING_CHECK_SECONDS=0)
+    def test_mapping_update_on_same_index_reloads_mapping(self):
+        client = build_client()
+        resolve_aggregatable_candidates(client, "silver", ["country"])
+
+        client.cluster.state.return_value = cluster_state(mapping_version=2)
+        resolve_aggregatable_candidates(client, "silver", ["country"])
+
+        self.assertEqual(client.indices.get_mapping.call_count, 2)
+
+    def test_unreadable_mapping_falls_back_to_all_variants(self):
+        client = build_client()
+        client.cluster.state.side_effect = RuntimeError("forbidden")
+
+        resolved = resolve_aggregatable_candidates(client, "silver", ["country", "publication_year"])
+
+        self.assertEqual(
+            resolved,
+            ["country", "country.keyword", "publication_year", "publication_year.keyword"],
+        )
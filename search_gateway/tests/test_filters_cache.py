@@ -0,0 +1,113 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import SimpleTestCase
+
+from search_gateway.filters_cache import FiltersCache, LocalLRUCache
+
+
+def run_in_thread(fn):
+    worker = threading.Thread(target=fn)
+    worker.start()
+    worker.join()
+
+
+class LocalLRUCacheTests(SimpleTestCase):
+    def test_evicts_least_recently_used_entry_by_count(self):
+        lru = LocalLRUCache(max_entries=2, max_bytes=1024 * 1024)
+        lru.set("a", {"data": 1})
+        lru.set("b", {"data": 2})
+        lru.get("a")
+        lru.set("c", {"data": 3})
+
+        self.assertIsNotNone(lru.get("a"))
+        self.assertIsNone(lru.get("b"))
+        self.assertEqual(len(lru), 2)
+
+    def test_evicts_entries_over_byte_budget(self):
+        lru = LocalLRUCache(max_entries=100, max_bytes=400)
+        lru.set("a", {"data": "x" * 150})
+        lru.set("b", {"data": "y" * 150})
+        lru.set("c", {"data": "z" * 150})
+
+        self.assertIsNone(lru.get("a"))
+        self.assertLessEqual(lru.total_bytes, 400)
+        lru.set("huge", {"data": "w" * 1000})
+        self.assertIsNone(lru.get("huge"))
+
+
+class FiltersCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.shared = LocMemCache(f"filters-cache-{self._testMethodName}", {})
+        self.shared.clear()
+
+    def build_cache(self, **kwargs):
+        options = {"ttl": 60, "stale_seconds": 60, "lock_seconds": 5, "wait_seconds": 0.5}
+        options.update(kwargs)
+        return FiltersCache(local=LocalLRUCache(10, 1024 * 1024), shared=self.shared, **options)
+
+    def test_other_workers_reuse_the_shared_entry(self):
+        compute = Mock(return_value={"country": [{"key": "BR"}]})
+
+        first = self.build_cache().get_or_compute(("k",), compute)
+        second = self.build_cache().get_or_compute(("k",), compute)
+
+        self.assertEqual(first, second)
+        compute.assert_called_once()
+
+    def test_stale_entry_is_served_while_refreshing(self):
+        filters_cache = self.build_cache()
+        storage_key = filters_cache.storage_key(("k",))
+        self.shared.set(storage_key, {"data": {"old": []}, "cached_at": time.time() - 90})
+        compute = Mock(return_value={"new": []})
+        executor = Mock()
+        executor.submit.side_effect = run_in_thread
+
+        with patch("search_gateway.filters_cache._get_refresh_executor", return_value=executor):
+            result = filters_cache.get_or_compute(("k",), compute)
+
+        self.assertEqual(result, {"old": []})
+        compute.assert_called_once()
+        self.assertEqual(filters_cache.get_or_compute(("k",), compute), {"new": []})
+        self.assertIsNone(self.shared.get(f"{storage_key}:lock"))
+
+    def test_expired_entry_is_recomputed(self):
+        filters_cache = self.build_cache()
+        self.shared.set(filters_cache.storage_key(("k",)), {"data": {"old": []}, "cached_at": time.time() - 500})
+
+        result = filters_cache.get_or_compute(("k",), Mock(return_value={"new": []}))
+
+        self.assertEqual(result, {"new": []})
+
+    def test_waits_for_the_worker_holding_the_lock(self):
+        filters_cache = self.build_cache()
+        storage_key = filters_cache.storage_key(("k",))
+        self.shared.add(f"{storage_key}:lock", 1)
+        other_worker = self.build_cache()
+        timer = threading.Timer(0.1, other_worker._store, args=(storage_key, {"from_other": []}))
+        timer.start()
+        self.addCleanup(timer.cancel)
+        compute = Mock(return_value={"local": []})
+
+        result = filters_cache.get_or_compute(("k",), compute)
+
+        self.assertEqual(result, {"from_other": []})
+        compute.assert_not_called()
+
+    def test_computes_locally_when_lock_holder_does_not_deliver(self):
+        filters_cache = self.build_cache(wait_seconds=0.1)
+        self.shared.add(f"{filters_cache.storage_key(('k',))}:lock", 1)
+
+        result = filters_cache.get_or_compute(("k",), Mock(return_value={"local": []}))
+
+        self.assertEqual(result, {"local": []})
+
+    def test_compute_errors_release_the_lock(self):
+        filters_cache = self.build_cache()
+
+        with self.assertRaises(RuntimeError):
+            filters_cache.get_or_compute(("k",), Mock(side_effect=RuntimeError("boom")))
+
+        self.assertIsNone(self.shared.get(f"{filters_cache.storage_key(('k',))}:lock"))
@@ -0,0 +1,107 @@
+from django.test import SimpleTestCase
+
+from search_gateway.pagination import PointInTimeIterator, sliced_iterators
+
+
+class FakePitClient:
+    def __init__(self, hits, fail_after=None):
+        self.hits = hits
+        self.fail_after = fail_after
+        self.bodies = []
+        self.deleted = []
+
+    def create_pit(self, index, keep_alive):
+        return {"pit_id": "pit-1"}
+
+    def search(self, body):
+        self.bodies.append(body)
+        if self.fail_after is not None and len(self.bodies) > self.fail_after:
+            raise RuntimeError("search failed")
+        start = 0
+        if "search_after" in body:
+            start = next(
+                position + 1
+                for position, hit in enumerate(self.hits)
+                if hit["sort"] == body["search_after"]
+            )
+        page = self.hits[start:start + body["size"]]
+        return {"pit_id": "pit-2", "hits": {"hits": page}}
+
+    def delete_pit(self, body):
+        self.deleted.append(body)
+
+
+def make_hits(count):
+    return [{"_id": f"doc-{n}", "_source": {}, "sort": [f"doc-{n}"]} for n in range(count)]
+
+
+class PointInTimeIteratorTests(SimpleTestCase):
+    def test_pages_with_search_after_and_closes_pit(self):
+        client = FakePitClient(make_hits(5))
+
+        hits = list(PointInTimeIterator(client, "bronze", {"query": {"match_all": {}}, "size": 2}))
+
+        self.assertEqual([hit["_id"] for hit in hits], [f"doc-{n}" for n in range(5)])
+        self.assertEqual(len(client.bodies), 3)
+        self.assertNotIn("search_after", client.bodies[0])
+        self.assertEqual(client.bodies[1]["search_after"], ["doc-1"])
+        self.assertEqual(client.bodies[1]["pit"]["id"], "pit-2")
+        self.assertEqual(client.bodies[0]["sort"], [{"_shard_doc": "asc"}])
+        self.assertEqual(client.deleted, [{"pit_id": ["pit-2"]}])
+
+    def test_resumes_from_last_sort_key_after_failure(self):
+        client = FakePitClient(make_hits(5), fail_after=2)
+        iterator = PointInTimeIterator(client, "bronze", {"size": 2})
+        seen = []
+
+        with self.assertRaises(RuntimeError):
+            for hit in iterator:
+                seen.append(hit["_id"])
+
+        self.assertEqual(client.deleted, [{"pit_id": ["pit-2"]}])
+        resumed = PointInTimeIterator(
+            FakePitClient(make_hits(5)),
+            "bronze",
+            {"size": 2},
+            search_after=iterator.last_sort,
+        )
+        seen.extend(hit["_id"] for hit in resumed)
+
+        self.assertEqual(seen, [f"doc-{n}" for n in range(5)])
+
+    def test_last_sort_points_at_the_hit_just_yielded(self):
+        iterator = PointInTimeIterator(FakePitClient(make_hits(5)), "bronze", {"size": 2})
+
+        for hit in iterator:
+            if hit["_id"] == "doc-2":
+                break
+
+        self.assertEqual(iterator.last_sort, ["doc-2"])
+        resumed = PointInTimeIterator(
+            FakePitClient(make_hits(5)),
+            "bronze",
+            {"size": 2},
+            search_after=iterator.last_sort,
+        )
+        self.assertEqual([hit["_id"] for hit in resumed], ["doc-3", "doc-4"])
+
+    def test_keeps_query_sort_and_appends_tiebreaker(self):
+        client = FakePitClient([])
+
+        list(PointInTimeIterator(client, "silver", {"sort": [{"publication_year": "desc"}]}))
+
+        self.assertEqual(client.bodies[0]["sort"], [{"publication_year": "desc"}, {"_shard_doc": "asc"}])
+
+    def test_sliced_iterators_share_caller_pit(self):
+        client = FakePitClient([])
+
+        iterators = sliced_iterators(client, "silver", {"size": 10}, 3, pit_id="shared-pit")
+        for iterator in iterators:
+            list(iterator)
+
+        self.assertEqual(
+            [body["slice"] for body in client.bodies],
+            [{"id": 0, "max": 3}, {"id": 1, "max": 3}, {"id": 2, "max": 3}],
+        )
+        self.assertTrue(all(body["pit"]["id"] == "shared-pit" for body in client.bodies))
+        self.assertEqual(client.deleted, [])